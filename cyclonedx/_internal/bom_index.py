@@ -0,0 +1,131 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+from .observe import ObservedSortedSet
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model.component import Component
+    from ..model.service import Service
+
+_V = TypeVar('_V')
+
+Key = Callable[[_V], Optional[str]]
+
+
+def iter_components(components: Iterable['Component']) -> Iterator['Component']:
+    # depth-first, in order - unlike `Component.get_all_nested_components()`, which returns an unordered set
+    for c in components:
+        yield c
+        yield from iter_components(c.components)
+
+
+def iter_services(services: Iterable['Service']) -> Iterator['Service']:
+    for s in services:
+        yield s
+        yield from iter_services(s.services)
+
+
+def component_bom_ref(c: 'Component') -> Optional[str]:
+    return c.bom_ref.value
+
+
+def component_purl(c: 'Component') -> Optional[str]:
+    return None if c.purl is None else c.purl.to_string()
+
+
+def component_name(c: 'Component') -> Optional[str]:
+    return c.name
+
+
+def component_cpe(c: 'Component') -> Optional[str]:
+    return c.cpe
+
+
+def service_bom_ref(s: 'Service') -> Optional[str]:
+    return s.bom_ref.value
+
+
+def service_name(s: 'Service') -> Optional[str]:
+    return s.name
+
+
+_COMPONENT_KEYS: tuple[Key['Component'], ...] = (component_bom_ref, component_purl, component_name, component_cpe)
+_SERVICE_KEYS: tuple[Key['Service'], ...] = (service_bom_ref, service_name)
+
+
+class BomLookupIndex:
+    """Lookup tables of all components and services of a Bom, including nested ones.
+
+    Keys are plain strings, so that lookups do not need to compare or hash model objects.
+    Items of each table are kept in order of occurrence.
+
+    The index observes all collections of components and services it was built from.
+    Any change of them makes it :attr:`stale`.
+    """
+
+    def __init__(self, metadata_component: Optional['Component'],
+                 components: Iterable['Component'], services: Iterable['Service']) -> None:
+        self.metadata_component = metadata_component
+        self.stale = False
+        self.component_tables: dict[Key['Component'], dict[str, list['Component']]] = {k: {} for k in _COMPONENT_KEYS}
+        self.service_tables: dict[Key['Service'], dict[str, list['Service']]] = {k: {} for k in _SERVICE_KEYS}
+        self.__observe(components)
+        self.__observe(services)
+        for c in iter_components(chain((metadata_component,) if metadata_component else (), components)):
+            self.__observe(c.components)
+            for ckey, ctable in self.component_tables.items():
+                _append(ctable, ckey(c), c)
+        for s in iter_services(services):
+            self.__observe(s.services)
+            for skey, stable in self.service_tables.items():
+                _append(stable, skey(s), s)
+
+    def __observe(self, collection: Iterable[object]) -> None:
+        if isinstance(collection, ObservedSortedSet):
+            collection.observe(self.__changed)
+
+    def __changed(self) -> None:
+        self.stale = True
+
+
+def lookup(tables: Optional[dict[Key[_V], dict[str, list[_V]]]], key: Key[_V], value: str,
+           items: Callable[[], Iterable[_V]]) -> list[_V]:
+    """All items with the given key value, in order of occurrence.
+
+    Served from the tables of an index, as long as all hits still have the value.
+    Otherwise - and if there is no hit - the items are searched linearly, in case that any of them changed.
+    """
+    if tables is not None:
+        found = tables[key].get(value)
+        if found and all(key(i) == value for i in found):
+            return found
+    return [i for i in items() if key(i) == value]
+
+
+def _append(table: dict[str, list[_V]], value: Optional[str], item: _V) -> None:
+    if value is not None:
+        table.setdefault(value, []).append(item)
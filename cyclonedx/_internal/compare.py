@@ -21,9 +21,13 @@
 Everything might change without any notice.
 """
 
+from collections.abc import Callable, Generator, Hashable
+from contextlib import contextmanager
 from itertools import zip_longest
 from typing import TYPE_CHECKING, Any, Optional
 
+from .observe import GenerationScope, Observable, generation_scope
+
 if TYPE_CHECKING:  # pragma: no cover
     from packageurl import PackageURL
 
@@ -81,3 +85,78 @@ class ComparablePackageURL(ComparableTuple):
             ComparableDict(p.qualifiers) if isinstance(p.qualifiers, dict) else p.qualifiers,
             p.subpath
         ))
+
+
+@contextmanager
+def cached_comparison() -> Generator[None, None, None]:
+    """Enable caching of comparable tuples and their hashes, while in this context.
+
+    The state is kept per thread and per asynchronous task - see :mod:`contextvars`.
+    May be nested; caching stays enabled until the outermost context exits.
+    """
+    if generation_scope.get() is not None:
+        yield
+        return
+    token = generation_scope.set(GenerationScope())
+    try:
+        yield
+    finally:
+        generation_scope.reset(token)
+
+
+# caches and observers are not part of the state of an object - neither of copies, nor of pickles
+_NOT_STATE = frozenset(('_comparable_cache', '_digest_cache', '_observers'))
+
+
+class CachedComparable(Observable):
+    """Mixin for classes, that may cache their comparable key and tuple and its hash - see :func:`cached_comparison()`.
+
+    Also holds the memoized content digest - see :mod:`cyclonedx.contrib.bom.digest`.
+    Property setters must tell about the change - via :meth:`changed()`.
+
+    Cached keys and hashes must be derived from values that are observed this way - like strings and enums.
+    Nested objects, like a supplier, are compared as they are; changing them in place is always reflected.
+    """
+
+    __slots__ = ('_comparable_cache', '_digest_cache')
+    _comparable_cache: Optional[list[Any]]
+    _digest_cache: Optional[bytes]
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        reduced = super().__reduce_ex__(protocol)
+        if isinstance(reduced, tuple) and len(reduced) > 2 and isinstance(reduced[2], tuple):
+            # state of an object with slots: (`__dict__` or None, slots or None)
+            dict_state, slots_state = reduced[2]
+            if slots_state:
+                slots_state = {k: v for k, v in slots_state.items() if k not in _NOT_STATE}
+            reduced = (*reduced[:2], (dict_state, slots_state), *reduced[3:])
+        return reduced
+
+    def _forget_digest(self) -> None:
+        """Drop the memoized digest - and tell the observers, like the memos of parents."""
+        self._digest_cache = None
+        self.changed()
+
+    def __cached(self, index: int, make: Callable[[], Any]) -> Any:
+        scope = generation_scope.get()
+        if scope is None:
+            return make()
+        # entry: [generation, comparable key, comparable tuple, hash] - each one made on first use
+        entry: Optional[list[Any]] = getattr(self, '_comparable_cache', None)
+        if entry is None or entry[0] != scope.generation:
+            entry = [scope.generation, None, None, None]
+            self._comparable_cache = entry
+        value = entry[index]
+        if value is None:
+            entry[index] = value = make()
+        return value
+
+    def _cached_comparable_key(self, make: Callable[[], tuple[Any, ...]]) -> tuple[Any, ...]:
+        return self.__cached(1, make)  # type:ignore[no-any-return]
+
+    def _cached_comparable_tuple(self, make: Callable[[], ComparableTuple]) -> ComparableTuple:
+        return self.__cached(2, make)  # type:ignore[no-any-return]
+
+    def _cached_hash(self, make: Callable[[], Hashable]) -> int:
+        """Hash of whatever `make` returns - like the comparable key or tuple, which might be cached themselves."""
+        return self.__cached(3, lambda: hash(make()))  # type:ignore[no-any-return]
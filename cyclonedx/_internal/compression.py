@@ -0,0 +1,103 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+import bz2
+import gzip
+import lzma
+from collections.abc import Generator
+from contextlib import contextmanager
+from mmap import mmap
+from os import PathLike
+from typing import IO, Literal, Optional, Union
+
+Compression = Literal['gzip', 'bz2', 'xz']
+
+_BY_SUFFIX: dict[str, Compression] = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+
+_MAGIC_NUMBERS: tuple[tuple[bytes, Compression], ...] = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+)
+
+
+def compression_by_suffix(filename: Union[str, 'PathLike[str]']) -> Optional[Compression]:
+    name = str(filename).lower()
+    return next((compression for suffix, compression in _BY_SUFFIX.items() if name.endswith(suffix)), None)
+
+
+def compression_by_content(stream: Union[IO[bytes], mmap]) -> Optional[Compression]:
+    """Detect the compression by the leading magic number - without consuming it.
+
+    Works for streams that can `peek()` or `seek()` only, and for memory maps; others are considered uncompressed.
+    """
+    if isinstance(stream, mmap):
+        position = stream.tell()
+        head = stream[position:position + 6]
+    elif hasattr(stream, 'peek'):
+        head = stream.peek(6)[:6]
+    elif stream.seekable():
+        position = stream.tell()
+        head = stream.read(6)
+        stream.seek(position)
+    else:
+        return None
+    return next((compression for magic, compression in _MAGIC_NUMBERS if head.startswith(magic)), None)
+
+
+def compressor(stream: IO[bytes], compression: Compression) -> IO[bytes]:
+    """Writer that compresses into `stream`, while being written to. Closing it does not close `stream`."""
+    if compression == 'gzip':
+        # no file name or time stamp in the header - so that equal documents compress equally
+        return gzip.GzipFile(filename='', mode='wb', fileobj=stream, mtime=0)  # type:ignore[return-value]
+    if compression == 'bz2':
+        return bz2.BZ2File(stream, mode='wb')
+    if compression == 'xz':
+        return lzma.LZMAFile(stream, mode='wb')
+    raise ValueError(f'Unexpected compression: {compression!r}')
+
+
+def decompressor(stream: IO[bytes], compression: Compression) -> IO[bytes]:
+    """Reader that decompresses from `stream`, while being read from. Closing it does not close `stream`."""
+    if compression == 'gzip':
+        return gzip.GzipFile(mode='rb', fileobj=stream)  # type:ignore[return-value]
+    if compression == 'bz2':
+        return bz2.BZ2File(stream, mode='rb')
+    if compression == 'xz':
+        return lzma.LZMAFile(stream, mode='rb')
+    raise ValueError(f'Unexpected compression: {compression!r}')
+
+
+@contextmanager
+def decompressed(stream: IO[bytes]) -> Generator[IO[bytes], None, None]:
+    """The decompressed content of `stream` - if it is compressed, detected by its content."""
+    compression = compression_by_content(stream)
+    if compression is None:
+        yield stream
+        return
+    with decompressor(stream, compression) as reader:
+        yield reader
@@ -0,0 +1,66 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
+_contents: dict[tuple[type, frozenset[str]], tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]] = {}
+
+
+def get_content_names(item: Any, exclude: frozenset[str] = frozenset()) -> tuple[str, ...]:
+    """Names of the properties of a model object - except the excluded ones."""
+    return _get_contents(item, exclude)[0]
+
+
+def get_content(item: Any, exclude: frozenset[str] = frozenset()) -> tuple[Any, ...]:
+    """Values of the properties of a model object - except the excluded ones - in order of their names."""
+    return _get_contents(item, exclude)[1](item)
+
+
+def _get_contents(item: Any, exclude: frozenset[str]) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    key = type(item), exclude
+    contents = _contents.get(key)
+    if contents is None:
+        # properties are backed by same-named private attributes - which are much cheaper to read.
+        attributes = tuple(
+            attribute for attribute in item.__dict__
+            if (name := attribute.lstrip('_')) not in exclude
+            and isinstance(getattr(type(item), name, None), property))
+        getter: Callable[[Any], tuple[Any, ...]]
+        if len(attributes) > 1:
+            getter = attrgetter(*attributes)
+        elif attributes:
+            getter = _single(attrgetter(*attributes))
+        else:
+            getter = _none
+        contents = _contents[key] = tuple(attribute.lstrip('_') for attribute in attributes), getter
+    return contents
+
+
+def _single(getter: Callable[[Any], Any]) -> Callable[[Any], tuple[Any, ...]]:
+    return lambda item: (getter(item),)
+
+
+def _none(item: Any) -> tuple[Any, ...]:
+    return ()
@@ -0,0 +1,64 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+__all__ = ['deprecated']
+
+import sys
+from typing import TYPE_CHECKING
+
+if sys.version_info >= (3, 13):
+    from warnings import deprecated
+elif TYPE_CHECKING:  # pragma: no cover
+    from typing_extensions import deprecated
+else:
+    from functools import wraps
+    from typing import Any, Optional
+    from warnings import warn
+
+    class deprecated:  # noqa:N801
+        """Like :func:`typing_extensions.deprecated` - but cheap to apply to functions.
+
+        The original imports :mod:`asyncio` when applied to any function, just to find out whether it is a coroutine.
+        That would be the biggest part of the time it takes to import the model.
+        None of the deprecated functions of this library is a coroutine.
+        """
+
+        def __init__(self, message: str, /, *,
+                     category: Optional[type[Warning]] = DeprecationWarning, stacklevel: int = 1) -> None:
+            self.message = message
+            self.category = category
+            self.stacklevel = stacklevel
+
+        def __call__(self, arg: Any, /) -> Any:
+            msg, category, stacklevel = self.message, self.category, self.stacklevel
+            if category is None or isinstance(arg, type):
+                from typing_extensions import deprecated as _deprecated
+                return _deprecated(msg, category=category, stacklevel=stacklevel)(arg)
+
+            @wraps(arg)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                warn(msg, category=category, stacklevel=stacklevel + 1)
+                return arg(*args, **kwargs)
+
+            arg.__deprecated__ = wrapper.__deprecated__ = msg
+            return wrapper
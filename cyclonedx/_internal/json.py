@@ -0,0 +1,235 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Collection, Container, Iterator
+from decimal import Decimal
+from enum import Enum
+from json import dumps as json_dumps
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+from py_serializable import ObjectMetadataLibrary, SerializationType
+from py_serializable.formatters import BaseNameFormatter, CurrentFormatter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from py_serializable import ViewType
+
+    _PropInfo = ObjectMetadataLibrary.SerializableProperty
+
+# how a property value is to be converted - mirrors the decision chain of `py_serializable`'s JSON encoder
+_KIND_HELPER = 1
+_KIND_CUSTOM = 2
+_KIND_ARRAY = 3
+_KIND_ENUM = 4
+_KIND_OBJECT = 5
+_KIND_PRIMITIVE = 6
+
+
+class _Prop(NamedTuple):
+    name: str
+    key: str
+    info: '_PropInfo'
+    kind: int
+    # property is part of the view
+    in_view: bool
+    # property is rendered, even if it is `None`/empty
+    empty_allowed: bool
+    none_value: Any
+    # property's concrete type is a serializable class
+    serializable: bool
+
+
+_plans: dict[tuple[type, Optional[type['ViewType']], type[BaseNameFormatter]], tuple[_Prop, ...]] = {}
+
+
+def _prop_kind(info: '_PropInfo') -> int:
+    if info.custom_type:
+        return _KIND_HELPER if info.is_helper_type() else _KIND_CUSTOM
+    if info.is_array:
+        return _KIND_ARRAY
+    if info.is_enum:
+        return _KIND_ENUM
+    if not info.is_primitive_type():
+        return _KIND_OBJECT
+    return _KIND_PRIMITIVE
+
+
+def _make_plan(klass: type, view: Optional[type['ViewType']],
+               formatter: type[BaseNameFormatter]) -> tuple[_Prop, ...]:
+    qualified_name = f'{klass.__module__}.{klass.__qualname__}'
+    plan = []
+    for name, info in ObjectMetadataLibrary.klass_property_mappings.get(qualified_name, {}).items():
+        in_view = (view in info.views) if info.views else True
+        if info.include_none:
+            empty_allowed = any(_v == view for _v, _ in info.include_none_views) \
+                if info.include_none_views \
+                else in_view
+        else:
+            empty_allowed = False
+        if not (in_view or empty_allowed):
+            continue
+        key = BaseNameFormatter.decode_handle_python_builtins_and_keywords(name=name)
+        if custom_name := info.custom_names.get(SerializationType.JSON):
+            key = str(custom_name)
+        key = formatter.encode(property_name=key)
+        kind = _prop_kind(info)
+        plan.append(_Prop(
+            name=name, key=key, info=info, kind=kind,
+            in_view=in_view, empty_allowed=empty_allowed,
+            none_value=info.get_none_value_for_view(view_=view),
+            serializable=kind == _KIND_OBJECT and ObjectMetadataLibrary.is_klass_serializable(
+                f'{info.concrete_type.__module__}.{info.concrete_type.__name__}')
+        ))
+    return tuple(plan)
+
+
+def _allowed(prop: _Prop, value: Any) -> bool:
+    if value is None or (prop.info.is_array and len(value) < 1):
+        return prop.empty_allowed
+    return prop.in_view
+
+
+def _convert(prop: _Prop, v: Any, view: Optional[type['ViewType']], klass: type) -> Any:
+    kind = prop.kind
+    if kind == _KIND_HELPER:
+        return prop.info.custom_type.json_normalize(  # type:ignore[union-attr]
+            v, view=view, prop_info=prop.info, ctx=klass)
+    if kind == _KIND_CUSTOM:
+        return prop.info.custom_type(v)  # type:ignore[misc]
+    if kind == _KIND_ARRAY:
+        return list(v) if len(v) > 0 else None
+    if kind == _KIND_ENUM:
+        return str(v.value)
+    if kind == _KIND_OBJECT:
+        string_format = prop.info.string_format
+        if isinstance(v, Decimal):
+            return float(f'{v:{string_format}}') if string_format else float(v)
+        if not prop.serializable:
+            return f'{v:{string_format}}' if string_format else str(v)
+    return v
+
+
+class DeferredArray:
+    """Array of items that are normalized one by one, while being iterated."""
+
+    def __init__(self, items: Collection[Any], view: Optional[type['ViewType']]) -> None:
+        self._items = items
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        view = self._view
+        return (normalize(i, view) for i in self._items)
+
+
+def _normalize_object(o: Any, view: Optional[type['ViewType']],
+                      defer: Container[str] = ()) -> Any:
+    klass = type(o)
+    formatter = CurrentFormatter.formatter
+    plan_key = (klass, view, formatter)
+    plan = _plans.get(plan_key)
+    if plan is None:
+        plan = _plans[plan_key] = _make_plan(klass, view, formatter)
+    d: dict[str, Any] = {}
+    for prop in plan:
+        v = getattr(o, prop.name)
+        if not _allowed(prop, v):
+            continue
+        if prop.kind == _KIND_ARRAY and prop.name in defer:
+            if len(v) > 0:
+                d[prop.key] = DeferredArray(v, view)
+            continue
+        v = _convert(prop, v, view, klass)
+        if prop.key == '.':
+            return normalize(v, view)
+        if _allowed(prop, v):
+            d[prop.key] = normalize(prop.none_value if v is None else v, view)
+    return d
+
+
+def normalize(o: Any, view: Optional[type['ViewType']]) -> Any:
+    """Render `o` to a structure of JSON-native types: `dict`, `list`, `str`, `int`, `float`, `bool` and `None`.
+
+    The result equals ``json.loads(o.as_json(view_=view))`` of a `py_serializable` class - without the intermediate
+    string. Property-plans are computed once per class and view.
+    """
+    if o is None or o is True or o is False:
+        return o
+    if isinstance(o, Enum):
+        return normalize(o.value, view)
+    if isinstance(o, (str, int, float)):
+        return o
+    if isinstance(o, dict):
+        return {k: normalize(v, view) for k, v in o.items()}
+    if isinstance(o, (list, tuple, set)):
+        return [normalize(i, view) for i in o]
+    return _normalize_object(o, view)
+
+
+def normalize_deferred(o: Any, view: Optional[type['ViewType']], defer: Container[str]) -> dict[str, Any]:
+    """Like :func:`normalize()`, but the array-properties named in `defer` become :class:`DeferredArray`.
+
+    Use :func:`iterencode()` to render the result.
+    """
+    return _normalize_object(o, view, defer)  # type:ignore[no-any-return]
+
+
+def iterencode(o: Any, indent: Optional[Union[int, str]] = None) -> Iterator[str]:
+    """Encode `o` chunk by chunk, as :func:`json.dumps()` would do - but with support for :class:`DeferredArray`.
+
+    Only the outermost `dict` is unrolled; each of its values or each item of a :class:`DeferredArray` is one chunk.
+    """
+    if isinstance(indent, int):
+        indent = ' ' * indent
+    if not o:
+        yield '{}'
+        return
+    if indent is None:
+        nl1 = nl2 = ''
+        item_separator = ', '
+    else:
+        nl1 = f'\n{indent}'
+        nl2 = f'\n{indent}{indent}'
+        item_separator = ','
+    yield '{'
+    first = True
+    for key, value in o.items():
+        yield f'{"" if first else item_separator}{nl1}{json_dumps(key)}: '
+        first = False
+        if isinstance(value, DeferredArray):
+            yield '['
+            first_item = True
+            for item in value:
+                yield f'{"" if first_item else item_separator}{nl2}'
+                first_item = False
+                yield _dumps_nested(item, indent, nl2)
+            yield ']' if first_item else f'{nl1}]'
+        else:
+            yield _dumps_nested(value, indent, nl1)
+    yield '}' if indent is None else '\n}'
+
+
+def _dumps_nested(o: Any, indent: Optional[str], nl: str) -> str:
+    # JSON strings never contain a raw line break, so it is safe to shift all lines by replacing line breaks
+    return json_dumps(o) if indent is None else json_dumps(o, indent=indent).replace('\n', nl)
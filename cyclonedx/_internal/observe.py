@@ -0,0 +1,155 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from itertools import count
+from typing import Any, Optional
+
+from sortedcontainers import SortedSet
+
+Observer = Callable[[], None]
+
+# generations are unique across all scopes - so that stamps of other scopes are never taken as current
+_generations = count()
+
+
+class GenerationScope:
+    """Counts changes of observed objects - for the current thread or asynchronous task, see :data:`generation_scope`.
+
+    Anything stamped with an older generation is outdated.
+    """
+
+    __slots__ = ('generation',)
+
+    def __init__(self) -> None:
+        self.generation = next(_generations)
+
+
+generation_scope: ContextVar[Optional[GenerationScope]] = ContextVar('generation_scope', default=None)
+
+
+def bump_generation() -> None:
+    """Note a change of an observed object."""
+    scope = generation_scope.get()
+    if scope is not None:
+        scope.generation = next(_generations)
+
+
+class Observable:
+    """Mixin for objects, that tell their observers about their changes.
+
+    Observers are callbacks. They are called once, on the next change, and then forgotten.
+    """
+
+    __slots__ = ('_observers',)
+    _observers: Optional[dict[Observer, None]]
+
+    def observe(self, observer: Observer) -> None:
+        observers: Optional[dict[Observer, None]] = getattr(self, '_observers', None)
+        if observers is None:
+            self._observers = {observer: None}
+        else:
+            # a dict keeps the order, and an observer that observes again is called once only
+            observers[observer] = None
+
+    def changed(self) -> None:
+        """Tell all observers about a change - and forget them.
+
+        Also bumps the generation - see :func:`bump_generation()`.
+        """
+        # inlined `bump_generation()` - this is called on each change, observed or not
+        scope = generation_scope.get()
+        if scope is not None:
+            scope.generation = next(_generations)
+        observers: Optional[dict[Observer, None]] = getattr(self, '_observers', None)
+        if observers:
+            self._observers = None
+            for observer in observers:
+                observer()
+
+
+class ObservedSortedSet(Observable, SortedSet):  # type:ignore[type-arg]
+    """A :class:`SortedSet`, that tells its observers about any change of its content."""
+
+    @classmethod
+    def replacing(cls, replaced: Optional[Iterable[Any]], iterable: Iterable[Any]) -> 'ObservedSortedSet':
+        """A new set of the given values, that replaces another one - whose observers are told about the change."""
+        if isinstance(replaced, ObservedSortedSet):
+            replaced.changed()
+        return cls(iterable)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self.changed()
+
+    def add(self, value: Any) -> None:
+        super().add(value)
+        self.changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self.changed()
+
+    def discard(self, value: Any) -> None:
+        super().discard(value)
+        self.changed()
+
+    def pop(self, index: int = -1) -> Any:
+        try:
+            return super().pop(index)
+        finally:
+            self.changed()
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self.changed()
+
+    def difference_update(self, *iterables: Iterable[Any]) -> Any:
+        try:
+            return super().difference_update(*iterables)
+        finally:
+            self.changed()
+
+    def intersection_update(self, *iterables: Iterable[Any]) -> Any:
+        try:
+            return super().intersection_update(*iterables)
+        finally:
+            self.changed()
+
+    def symmetric_difference_update(self, other: Iterable[Any]) -> Any:
+        try:
+            return super().symmetric_difference_update(other)
+        finally:
+            self.changed()
+
+    def update(self, *iterables: Iterable[Any]) -> Any:
+        try:
+            return super().update(*iterables)
+        finally:
+            self.changed()
+
+    __isub__ = difference_update
+    __iand__ = intersection_update
+    __ixor__ = symmetric_difference_update
+    __ior__ = update
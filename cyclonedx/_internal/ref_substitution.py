@@ -0,0 +1,51 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model.bom_ref import BomRef
+
+# per thread/task - so that other threads are not affected
+_substitutes: ContextVar[Optional[Mapping[int, str]]] = ContextVar('_substitutes', default=None)
+
+
+@contextmanager
+def substituted_values(substitutes: Mapping[int, str]) -> Generator[None, None, None]:
+    """Within the current context, serialize BomRefs by the values mapped to their :func:`id()`."""
+    token = _substitutes.set(substitutes)
+    try:
+        yield
+    finally:
+        _substitutes.reset(token)
+
+
+def serialized_value(bom_ref: 'BomRef') -> Optional[str]:
+    substitutes = _substitutes.get()
+    if substitutes is not None:
+        value = substitutes.get(id(bom_ref))
+        if value is not None:
+            return value
+    return bom_ref.value
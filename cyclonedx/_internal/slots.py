@@ -0,0 +1,56 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from typing import Any
+
+_slot_names: dict[type, tuple[str, ...]] = {}
+
+
+def _get_slot_names(klass: type) -> tuple[str, ...]:
+    names = _slot_names.get(klass)
+    if names is None:
+        names = _slot_names[klass] = tuple(
+            name
+            for k in reversed(klass.__mro__)
+            # slots of other bases, like caches, are not part of the view
+            if issubclass(k, SlotsDict)
+            for name in vars(k).get('__slots__', ())
+            if name not in ('__dict__', '__weakref__'))
+    return names
+
+
+class SlotsDict:
+    """Mixin for classes with `__slots__`, that provides a read-only view of all attributes as `__dict__`.
+
+    `py_serializable` reads XML attributes from an object's `__dict__`, which does not exist with `__slots__`.
+    Attributes are listed in order of their slot definition, which should follow the order of assignment
+    in `__init__()` - as it determines the order of XML attributes.
+
+    Subclasses must define `__slots__`, too. Otherwise, they get an actual `__dict__`, which hides this view.
+    """
+
+    __slots__ = ()
+
+    @property
+    def __dict__(self) -> dict[str, Any]:  # type:ignore[override]
+        return {name: getattr(self, name) for name in _get_slot_names(type(self)) if hasattr(self, name)}
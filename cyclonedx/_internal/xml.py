@@ -0,0 +1,187 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+"""
+!!! ALL SYMBOLS IN HERE ARE INTERNAL.
+Everything might change without any notice.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Optional, Union
+from xml.etree.ElementTree import Element  # nosec B405
+
+# bound to the prefix `xml` by definition - which must never be declared
+_XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
+_ESCAPE_TEXT = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'))
+_ESCAPE_ATTRIB = _ESCAPE_TEXT + (('"', '&quot;'), ('\r', '&#13;'), ('\n', '&#10;'), ('\t', '&#09;'))
+
+
+def _escape(s: str, table: tuple[tuple[str, str], ...]) -> str:
+    for c, r in table:
+        if c in s:
+            s = s.replace(c, r)
+    return s
+
+
+class XmlWriter:
+    """Incremental XML writer.
+
+    Elements are written as soon as they are known - so a document can be rendered piece by piece.
+    Without `indent`, the output equals :func:`xml.etree.ElementTree.tostring()` with a `default_namespace`;
+    with `indent`, the layout equals :meth:`xml.dom.minidom.Node.toprettyxml()`.
+
+    Names in the `default_namespace` are written unprefixed, names in the XML namespace get the prefix ``xml``.
+    Names in other namespaces get a prefix. For a whole document written via :meth:`element()`, all prefixes
+    are declared on its root - like :func:`xml.etree.ElementTree.tostring()` does.
+    A root opened via :meth:`start()` cannot know its content in advance. So, within it,
+    a prefix is declared on each outermost element that uses it - again for sibling elements.
+    Mixed content is not supported: an element's `tail` is ignored.
+    """
+
+    def __init__(self, write: Callable[[str], Any], default_namespace: str,
+                 indent: Optional[Union[int, str]] = None) -> None:
+        self._write = write
+        self._default_ns = default_namespace
+        self._ns_prefix = f'{{{default_namespace}}}'
+        if isinstance(indent, int):
+            indent = ' ' * indent
+        self._indent = indent
+        # stack of currently open elements: (qualified name, has content)
+        self._open: list[list[Any]] = []
+        self._foreign_ns: dict[str, str] = {}
+
+    def declaration(self) -> None:
+        self._write('<?xml version="1.0" ?>\n')
+
+    def _qname(self, name: str, declare: dict[str, str]) -> str:
+        if not name.startswith('{'):
+            return name
+        if name.startswith(self._ns_prefix):
+            return name[len(self._ns_prefix):]
+        uri, local = name[1:].split('}', 1)
+        if uri == _XML_NAMESPACE:
+            return f'xml:{local}'
+        prefix = self._foreign_ns.get(uri)
+        if prefix is None:
+            # numbered like ElementTree does - which counts the default namespace, too
+            prefix = self._foreign_ns[uri] = f'ns{len(self._foreign_ns) + 1}'
+            declare[uri] = prefix
+        return f'{prefix}:{local}'
+
+    def _open_tag(self, tag: str, attrib: Mapping[str, str], depth: int, declare: dict[str, str]) -> str:
+        qtag = self._qname(tag, declare)
+        attrs = ''.join(
+            f' {self._qname(k, declare)}="{_escape(v, _ESCAPE_ATTRIB)}"'
+            for k, v in attrib.items())
+        xmlns = ' '.join(f'xmlns:{p}="{_escape(u, _ESCAPE_ATTRIB)}"' for u, p in declare.items())
+        if depth == 0:
+            xmlns = f'xmlns="{_escape(self._default_ns, _ESCAPE_ATTRIB)}"{" " if xmlns else ""}{xmlns}'
+        if xmlns:
+            xmlns = f' {xmlns}'
+        lead = '' if self._indent is None else self._indent * depth
+        self._write(f'{lead}<{qtag}{xmlns}{attrs}')
+        return qtag
+
+    def _mark_content(self) -> None:
+        if self._open:
+            parent = self._open[-1]
+            if not parent[1]:
+                parent[1] = True
+                self._write('>' if self._indent is None else '>\n')
+
+    def start(self, tag: str, attrib: Optional[Mapping[str, str]] = None) -> None:
+        """Open an element - to be closed by :meth:`end()`."""
+        self._mark_content()
+        declare: dict[str, str] = {}
+        qtag = self._open_tag(tag, attrib or {}, len(self._open), declare)
+        self._open.append([qtag, False, declare])
+
+    def end(self) -> None:
+        """Close the element opened last."""
+        qtag, has_content, declare = self._open.pop()
+        self._close_tag(qtag, has_content, len(self._open))
+        for uri in declare:
+            del self._foreign_ns[uri]
+
+    def _close_tag(self, qtag: str, has_content: bool, depth: int) -> None:
+        if self._indent is None:
+            self._write(f'</{qtag}>' if has_content else ' />')
+        elif has_content:
+            self._write(f'{self._indent * depth}</{qtag}>\n')
+        else:
+            self._write('/>\n')
+
+    def element(self, elem: Element) -> None:
+        """Write a complete element, including all its descendants."""
+        self._mark_content()
+        declare: dict[str, str] = {}
+        if not self._open:
+            # a whole document - declare all prefixes on its root, in the order of their first use, like ElementTree
+            for e in elem.iter():
+                self._qname(e.tag, declare)
+                for k in e.attrib:
+                    self._qname(k, declare)
+        self._element(elem, len(self._open), declare)
+
+    def _element(self, elem: Element, depth: int, declare: Optional[dict[str, str]] = None) -> None:
+        if declare is None:
+            declare = {}
+        qtag = self._open_tag(elem.tag, elem.attrib, depth, declare)
+        text = elem.text
+        if len(elem) == 0:
+            if text:
+                self._write(f'>{_escape(text, _ESCAPE_TEXT)}</{qtag}>')
+                if self._indent is not None:
+                    self._write('\n')
+            else:
+                self._close_tag(qtag, False, depth)
+        else:
+            if self._indent is None:
+                self._write(f'>{_escape(text, _ESCAPE_TEXT)}' if text else '>')
+            else:
+                self._write('>\n')
+                if text:
+                    self._write(f'{self._indent * (depth + 1)}{_escape(text, _ESCAPE_TEXT)}\n')
+            for child in elem:
+                self._element(child, depth + 1)
+            self._close_tag(qtag, True, depth)
+        for uri in declare:
+            del self._foreign_ns[uri]
+
+
+def iter_deferred(root: Element, deferred: Mapping[str, tuple[int, Callable[[], Iterator[Element]]]],
+                  sequences: Mapping[str, int]) -> Iterator[Union[Element, tuple[str, Iterator[Element]]]]:
+    """Merge the children of `root` with deferred arrays, in order of their XML sequence.
+
+    `deferred` maps an element name to its sequence and a factory of its child elements.
+    `sequences` maps element names to their sequence. Children of `root` that are named like a deferred array
+    are dropped - the deferred array takes their place.
+    Yields either an existing child element, or a tuple of the element name of a deferred array and its children.
+    """
+    pending = sorted(deferred.items(), key=lambda i: i[1][0])
+    for child in root:
+        if child.tag in deferred:
+            continue
+        seq = sequences.get(child.tag, 0)
+        while pending and pending[0][1][0] <= seq:
+            name, (_, make_items) = pending.pop(0)
+            yield name, make_items()
+        yield child
+    for name, (_, make_items) in pending:
+        yield name, make_items()
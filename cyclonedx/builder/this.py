@@ -22,14 +22,9 @@
 
 __all__ = ['this_component', 'this_tool']
 
-import sys
 from typing import TYPE_CHECKING
 
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
+from .._internal.deprecation import deprecated
 from ..contrib.this.builders import this_component as _this_component, this_tool as _this_tool
 
 # region deprecated re-export
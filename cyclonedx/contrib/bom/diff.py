@@ -0,0 +1,256 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Structural differences between two BOMs"""
+
+__all__ = [
+    'BomDiff',
+    'Change',
+    'diff_boms',
+    'component_match_key',
+    'service_match_key',
+]
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from itertools import chain
+from typing import Any, Generic, TypeVar
+
+from ..._internal.content import get_content, get_content_names
+from ...model import cached_comparison
+from ...model.bom import Bom
+from ...model.component import Component
+from ...model.service import Service
+from ...model.vulnerability import Vulnerability
+from .digest import memoized_digest
+from .merge import vulnerability_identity
+
+_T = TypeVar('_T')
+
+# `bom-ref` values are identifiers, not content - they might even be random.
+# nested components/services are compared one by one, instead.
+_NOT_CONTENT = frozenset(('bom_ref', 'components', 'services'))
+
+
+def component_match_key(component: Component) -> Hashable:
+    """
+    Key to match components of two BOMs by: the purl without version - or, if it has none, the group and name.
+
+    Versions are not part of the key, so that up- and downgrades are reported as changes.
+    """
+    purl = component.purl
+    if purl is not None:
+        return 'purl', purl.type, purl.namespace, purl.name, purl.subpath
+    return 'component', component.group, component.name
+
+
+def service_match_key(service: Service) -> Hashable:
+    """Key to match services of two BOMs by: the group and name."""
+    return 'service', service.group, service.name
+
+
+def _get_content_names(item: Any) -> tuple[str, ...]:
+    return get_content_names(item, _NOT_CONTENT)
+
+
+def _get_content(item: Any) -> tuple[Any, ...]:
+    return get_content(item, _NOT_CONTENT)
+
+
+class Change(Generic[_T]):
+    """A matched pair of items, whose content differs."""
+
+    def __init__(self, old: _T, new: _T, fields: tuple[str, ...]) -> None:
+        self._old = old
+        self._new = new
+        self._fields = fields
+
+    @property
+    def old(self) -> _T:
+        return self._old
+
+    @property
+    def new(self) -> _T:
+        return self._new
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Names of the properties that differ - like ``version`` or ``licenses``."""
+        return self._fields
+
+    def added(self, field: str) -> tuple[Any, ...]:
+        """Elements of a collection property, like ``licenses`` or ``hashes``, that exist in the new item only."""
+        old = set(getattr(self._old, field))
+        return tuple(e for e in getattr(self._new, field) if e not in old)
+
+    def removed(self, field: str) -> tuple[Any, ...]:
+        """Elements of a collection property, like ``licenses`` or ``hashes``, that exist in the old item only."""
+        new = set(getattr(self._new, field))
+        return tuple(e for e in getattr(self._old, field) if e not in new)
+
+    def __repr__(self) -> str:
+        return f'<Change {type(self._new).__name__} fields={self._fields!r}>'
+
+
+class BomDiff:
+    """
+    Change set between two BOMs.
+
+    Added and removed components and services include their nested ones;
+    for matched components and services, nested ones are compared one by one.
+    """
+
+    def __init__(self) -> None:
+        self.components_added: list[Component] = []
+        self.components_removed: list[Component] = []
+        self.components_changed: list[Change[Component]] = []
+        self.services_added: list[Service] = []
+        self.services_removed: list[Service] = []
+        self.services_changed: list[Change[Service]] = []
+        self.vulnerabilities_added: list[Vulnerability] = []
+        self.vulnerabilities_removed: list[Vulnerability] = []
+        self.vulnerabilities_changed: list[Change[Vulnerability]] = []
+
+    def __bool__(self) -> bool:
+        return any(self.__dict__.values())
+
+    def __repr__(self) -> str:
+        return '<BomDiff ' + ' '.join(f'{k}={len(v)}' for k, v in self.__dict__.items()) + '>'
+
+
+class _Differ:
+
+    def __init__(self, memoized_digests: bool = False) -> None:
+        self._memoized_digests = memoized_digests
+
+    @staticmethod
+    def changed_fields(old: Any, new: Any) -> tuple[str, ...]:
+        if old is new:
+            return ()
+        old_content, new_content = _get_content(old), _get_content(new)
+        if old_content == new_content:
+            return ()
+        return tuple(name for name, o, n in zip(_get_content_names(new), old_content, new_content) if o != n)
+
+    @staticmethod
+    def same_digests(old: Any, new: Any) -> bool:
+        """Whether both items have equal memoized digests - which cover their nested items, too.
+
+        Comparing memoized digests is cheap. Computing them is not done here, though:
+        that would cost more than comparing the fields.
+        """
+        old_digest = memoized_digest(old)
+        return old_digest is not None and old_digest == memoized_digest(new)
+
+    @staticmethod
+    def pair(olds: Iterable[_T], news: Iterable[_T], key: Callable[[_T], Hashable]
+             ) -> tuple[list[tuple[_T, _T]], list[_T], list[_T]]:
+        """Match items by key - and, for ambiguous keys, by equal version, then in order."""
+        buckets: dict[Hashable, tuple[list[_T], list[_T]]] = {}
+        for side, items in enumerate((olds, news)):
+            for item in items:
+                buckets.setdefault(key(item), ([], []))[side].append(item)
+        pairs, removed, added = [], [], []
+        for bucket_olds, bucket_news in buckets.values():
+            if len(bucket_olds) == 1 and len(bucket_news) == 1:
+                pairs.append((bucket_olds[0], bucket_news[0]))
+                continue
+            by_version: dict[Any, list[_T]] = {}
+            for o in bucket_olds:
+                by_version.setdefault(getattr(o, 'version', None), []).append(o)
+            rest_news = []
+            for n in bucket_news:
+                candidates = by_version.get(getattr(n, 'version', None))
+                if candidates:
+                    pairs.append((candidates.pop(0), n))
+                else:
+                    rest_news.append(n)
+            rest_olds = [o for os in by_version.values() for o in os]
+            pairs.extend(zip(rest_olds, rest_news))
+            removed.extend(rest_olds[len(rest_news):])
+            added.extend(rest_news[len(rest_olds):])
+        return pairs, removed, added
+
+    def diff_trees(self, olds: Iterable[_T], news: Iterable[_T], key: Callable[[_T], Hashable],
+                   nested: Callable[[_T], Iterable[_T]],
+                   added: list[_T], removed: list[_T], changed: list[Change[_T]]) -> None:
+        todos = [(olds, news)]
+        while todos:
+            pairs, removed_, added_ = self.pair(*todos.pop(), key)
+            removed.extend(removed_)
+            added.extend(added_)
+            for old, new in pairs:
+                if old is new or (self._memoized_digests and self.same_digests(old, new)):
+                    continue
+                fields = self.changed_fields(old, new)
+                if fields:
+                    changed.append(Change(old, new, fields))
+                if nested(old) or nested(new):
+                    todos.append((nested(old), nested(new)))
+
+    def diff_vulnerabilities(self, olds: Iterable[Vulnerability], news: Iterable[Vulnerability],
+                             key: Callable[[Vulnerability], Hashable], diff: BomDiff) -> None:
+        pairs, diff.vulnerabilities_removed, diff.vulnerabilities_added = self.pair(olds, news, key)
+        for old, new in pairs:
+            fields = self.changed_fields(old, new)
+            if fields:
+                diff.vulnerabilities_changed.append(Change(old, new, fields))
+
+
+def _nested_components(component: Component) -> Iterable[Component]:
+    return component.components
+
+
+def _nested_services(service: Service) -> Iterable[Service]:
+    return service.services
+
+
+def _top_components(bom: Bom) -> Sequence[Component]:
+    root = bom.metadata.component
+    return bom.components if root is None else tuple(chain((root,), bom.components))
+
+
+def diff_boms(old: Bom, new: Bom, *,
+              component_key: Callable[[Component], Hashable] = component_match_key,
+              service_key: Callable[[Service], Hashable] = service_match_key,
+              vulnerability_key: Callable[[Vulnerability], Hashable] = vulnerability_identity,
+              memoized_digests: bool = False,
+              ) -> BomDiff:
+    """
+    Determine the structural differences between two BOMs.
+
+    Components, services and vulnerabilities are matched by key;
+    matched pairs are compared property by property, which stops at the first difference.
+    `bom-ref` values are not content - so re-generated values do not count as changes.
+
+    The :attr:`cyclonedx.model.bom.BomMetaData.component` is compared like any other component.
+
+    :param memoized_digests: whether to compare components and services, whose digests are memoized on both sides,
+                             by their digests first - see :func:`cyclonedx.contrib.bom.digest.digest()`.
+                             So, when BOMs are diffed repeatedly - like a baseline against its successors -
+                             digesting them beforehand pays off.
+                             Memos are not dropped on in-place changes of nested values, like the name of a
+                             component's supplier; after such changes, differences would be missed.
+    """
+    diff = BomDiff()
+    differ = _Differ(memoized_digests)
+    with cached_comparison():
+        differ.diff_trees(_top_components(old), _top_components(new), component_key, _nested_components,
+                          diff.components_added, diff.components_removed, diff.components_changed)
+        differ.diff_trees(old.services, new.services, service_key, _nested_services,
+                          diff.services_added, diff.services_removed, diff.services_changed)
+        differ.diff_vulnerabilities(old.vulnerabilities, new.vulnerabilities, vulnerability_key, diff)
+    return diff
@@ -0,0 +1,296 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""
+Stable content digests of BOMs and their components, services and vulnerabilities.
+
+A digest is a SHA-256 over a canonical encoding of the content.
+It is the same across processes, platforms and serialization formats - and independent of the order of collections.
+
+`bom-ref` values are identifiers, not content - they are often random, see
+:class:`cyclonedx.contrib.bom.utils.BomRefDiscriminator`. So they are not part of any digest.
+Within a BOM, dependencies and :attr:`cyclonedx.model.vulnerability.Vulnerability.affects`
+refer to the digests of their targets, instead.
+"""
+
+__all__ = [
+    'digest',
+]
+
+from collections.abc import Iterable
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from hashlib import sha256
+from typing import TYPE_CHECKING, Any, Optional, Union
+from uuid import UUID
+
+from packageurl import PackageURL
+from sortedcontainers import SortedSet
+
+from ..._internal.compare import CachedComparable as _CachedComparable
+from ..._internal.content import get_content, get_content_names
+from ..._internal.observe import Observable as _Observable
+from ...model import XsUri
+from ...model.bom import Bom
+from ...model.bom_ref import BomRef
+from ...model.component import Component
+from ...model.dependency import Dependency
+from ...model.service import Service
+from ...model.vulnerability import Vulnerability
+
+if TYPE_CHECKING:  # pragma: no cover
+    from _hashlib import HASH
+
+_NOT_CONTENT = frozenset(('bom_ref',))
+# referencing properties - they are digested along with the referenced items
+_NOT_CORE_CONTENT = frozenset(('bom_ref', 'affects'))
+# properties of a document, not of its content
+_NOT_BOM_CONTENT = frozenset(('serial_number', 'version', 'dependencies', 'vulnerabilities'))
+_NOT_METADATA_CONTENT = frozenset(('bom_ref', 'timestamp'))
+
+_COLLECTIONS = (SortedSet, set, frozenset)
+_SCALARS = (str, Enum, int, float, Decimal, datetime, UUID, XsUri, PackageURL, BomRef)
+_SEQUENCES = (list, tuple)
+
+_type_tags: dict[type, bytes] = {}
+
+
+def _type_tag(klass: type) -> bytes:
+    """Name of the model class - so that subclasses, like lazy ones, digest like their base."""
+    tag = _type_tags.get(klass)
+    if tag is None:
+        model = next((k for k in klass.__mro__ if k.__module__.startswith('cyclonedx.model')), klass)
+        tag = _type_tags[klass] = f'{model.__module__}.{model.__qualname__}'.encode()
+    return tag
+
+
+def _str(h: 'HASH', tag: bytes, value: str) -> None:
+    data = value.encode()
+    h.update(b'%s%d:' % (tag, len(data)))
+    h.update(data)
+
+
+class _Digester:
+
+    def __init__(self, memoize: bool, refs: Optional[dict[str, bytes]] = None) -> None:
+        self._memoize = memoize
+        # digests of the items within a BOM, by their `bom-ref` value
+        self._refs = refs or {}
+        # digests of this run, by identity of the item - so that each item is digested once only
+        self._digests: dict[int, bytes] = {}
+        # the items, whose digests are memoized while they are being digested - innermost last
+        self._memoizing: list[_CachedComparable] = []
+
+    def item(self, item: Any) -> bytes:
+        """Digest of a model object - without its referencing properties."""
+        memoizable = self._memoize and isinstance(item, _CachedComparable)
+        if memoizable and self._memoizing:
+            # a change of the item is a change of the item whose digest is being memoized
+            item.observe(self._memoizing[-1]._forget_digest)
+        digest = self._digests.get(id(item))
+        if digest is None:
+            digest = self._digests[id(item)] = self._memoized(item) if memoizable \
+                else self._object(item, _NOT_CORE_CONTENT)
+        return digest
+
+    def _memoized(self, item: _CachedComparable) -> bytes:
+        # a memo is valid, until the item or any of its observed collections or nested items changes -
+        # which drops the memos of the item and of all items that observe it, like its parents
+        memo: Optional[bytes] = getattr(item, '_digest_cache', None)
+        if memo is not None:
+            return memo
+        self._memoizing.append(item)
+        try:
+            item.observe(item._forget_digest)
+            digest = self._object(item, _NOT_CORE_CONTENT)
+        finally:
+            self._memoizing.pop()
+        item._digest_cache = digest
+        return digest
+
+    def _object(self, item: Any, exclude: frozenset[str]) -> bytes:
+        h = sha256(b'o%s:' % _type_tag(type(item)))
+        for name, value in zip(get_content_names(item, exclude), get_content(item, exclude)):
+            if isinstance(value, _Observable) and self._memoizing:
+                # a change of the collection - even an empty one - is a change of the item being memoized
+                value.observe(self._memoizing[-1]._forget_digest)
+            # unset properties are skipped - so that new properties do not change the digests of existing content
+            if value is None or (isinstance(value, (*_COLLECTIONS, *_SEQUENCES, dict)) and not value):
+                continue
+            _str(h, b'n', name)
+            self._value(h, value)
+        return h.digest()
+
+    def _value(self, h: 'HASH', value: Any) -> None:  # noqa:C901
+        if isinstance(value, str):  # includes string enums
+            _str(h, b's', value.value if isinstance(value, Enum) else value)
+        elif isinstance(value, Enum):
+            h.update(b'e')
+            self._value(h, value.value)
+        elif isinstance(value, bool):
+            h.update(b'T' if value else b'F')
+        elif isinstance(value, (int, float, Decimal)):
+            _str(h, b'd', str(value))
+        elif isinstance(value, datetime):
+            _str(h, b't', value.isoformat())
+        elif isinstance(value, (UUID, XsUri)):
+            _str(h, b'u', str(value))
+        elif isinstance(value, PackageURL):
+            _str(h, b'p', value.to_string())
+        elif isinstance(value, BomRef):
+            self._ref(h, value.value)
+        elif isinstance(value, _COLLECTIONS):
+            # unordered - so the order of elements must not matter
+            self._multiset(h, b'S', (self._element(e) for e in value))
+        elif isinstance(value, _SEQUENCES):
+            h.update(b'L%d:' % len(value))
+            for e in value:
+                self._value(h, e)
+        elif isinstance(value, dict):
+            self._multiset(h, b'D', (self._element((k, v)) for k, v in value.items()))
+        elif hasattr(value, '__dict__'):
+            h.update(b'O')
+            h.update(self.item(value))
+        else:
+            raise TypeError(f'cannot digest {type(value)!r}')
+
+    def _element(self, value: Any) -> bytes:
+        if not isinstance(value, _SCALARS) and hasattr(value, '__dict__'):
+            return self.item(value)
+        h = sha256()
+        self._value(h, value)
+        return h.digest()
+
+    @staticmethod
+    def _multiset(h: 'HASH', tag: bytes, digests: Iterable[bytes]) -> None:
+        ordered = sorted(digests)
+        h.update(b'%s%d:' % (tag, len(ordered)))
+        for d in ordered:
+            h.update(d)
+
+    def _ref(self, h: 'HASH', value: Optional[str]) -> None:
+        target = None if value is None else self._refs.get(value)
+        if target is None:
+            _str(h, b'r', value or '')
+        else:
+            h.update(b'R')
+            h.update(target)
+
+    def vulnerability(self, vulnerability: Vulnerability) -> bytes:
+        h = sha256(b'V')
+        h.update(self.item(vulnerability))
+        h.update(self._affects(vulnerability))
+        return h.digest()
+
+    def _affects(self, vulnerability: Vulnerability) -> bytes:
+        h = sha256(b'A')
+        self._multiset(h, b'S', (self._target(t.ref, t.versions) for t in vulnerability.affects))
+        return h.digest()
+
+    def _target(self, ref: str, versions: Iterable[Any]) -> bytes:
+        h = sha256(b'B')
+        self._ref(h, ref)
+        self._value(h, versions)
+        return h.digest()
+
+    def bom(self, bom: Bom) -> bytes:
+        # items are digested first - so that references can refer to them
+        for item in self.__referable(bom):
+            if item.bom_ref.value is not None:
+                self._refs.setdefault(item.bom_ref.value, self.item(item))
+        h = sha256(b'o%s:' % _type_tag(Bom))
+        _str(h, b'n', 'metadata')
+        h.update(self._object(bom.metadata, _NOT_METADATA_CONTENT))
+        for name, value in zip(get_content_names(bom, _NOT_BOM_CONTENT), get_content(bom, _NOT_BOM_CONTENT)):
+            if name == 'metadata' or value is None or not value:
+                continue
+            _str(h, b'n', name)
+            self._value(h, value)
+        _str(h, b'n', 'dependencies')
+        self._multiset(h, b'S', self.__dependencies(bom.dependencies))
+        _str(h, b'n', 'vulnerabilities')
+        self._multiset(h, b'S', (self.vulnerability(v) for v in bom.vulnerabilities))
+        return h.digest()
+
+    @staticmethod
+    def __referable(bom: Bom) -> Iterable[Union[Component, Service]]:
+        yield from bom._get_all_components()
+        todos = list(bom.services)
+        while todos:
+            service = todos.pop()
+            yield service
+            todos.extend(service.services)
+
+    def __dependencies(self, dependencies: Iterable[Dependency]) -> Iterable[bytes]:
+        # flattened and merged - like on serialization
+        flat: dict[Optional[str], set[Optional[str]]] = {}
+        todos = list(dependencies)
+        seen = set()
+        while todos:
+            todo = todos.pop()
+            if (todo_id := id(todo)) in seen:
+                continue
+            seen.add(todo_id)
+            flat.setdefault(todo.ref.value, set()).update(d.ref.value for d in todo.dependencies)
+            todos.extend(todo.dependencies)
+        for ref, targets in flat.items():
+            h = sha256(b'G')
+            self._ref(h, ref)
+            self._multiset(h, b'S', (self.__ref(t) for t in targets))
+            yield h.digest()
+
+    def __ref(self, value: Optional[str]) -> bytes:
+        h = sha256()
+        self._ref(h, value)
+        return h.digest()
+
+
+def memoized_digest(item: Any) -> Optional[bytes]:
+    """The memoized digest of a component, service or vulnerability - if there is a current one.
+
+    Like with :func:`digest()`, the referencing properties of a vulnerability are not part of it.
+    """
+    return getattr(item, '_digest_cache', None) if isinstance(item, _CachedComparable) else None
+
+
+def digest(item: Union[Bom, Component, Service, Vulnerability], *, memoize: bool = True) -> str:
+    """
+    Stable content digest of a BOM, component, service or vulnerability - as hex string.
+
+    Equal content has equal digests, regardless of `bom-ref` values and the order of collections.
+    Unset properties do not contribute - so that properties added in future versions of this library
+    do not change the digests of existing content.
+    The ``serial_number``, ``version`` and metadata ``timestamp`` of a BOM describe the document,
+    not its content - so they do not contribute either.
+
+    Digests of components, services and vulnerabilities are memoized per object. So re-digesting after a change
+    digests the changed objects only - and their parents.
+    A memo is dropped on any property assignment on the object and on any change of its collections,
+    and so are the memos of all objects it is part of - like its parent components.
+    Changing other nested values in place - like the ``id`` of one of a component's licenses - is not detected.
+    Use ``memoize=False`` after such changes.
+
+    :param item: what to digest
+    :param memoize: whether to use and update the memoized digests
+    """
+    digester = _Digester(memoize)
+    if isinstance(item, Bom):
+        return digester.bom(item).hex()
+    if isinstance(item, Vulnerability):
+        return digester.vulnerability(item).hex()
+    return digester.item(item).hex()
@@ -0,0 +1,357 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Dependency graph analysis"""
+
+__all__ = [
+    'DependencyGraph',
+]
+
+from array import array
+from collections import deque
+from collections.abc import Collection, Iterable, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from ...exception.model import CyclicDependencyException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ...model.bom import Bom
+    from ...model.bom_ref import BomRef
+    from ...model.dependency import Dependency
+
+
+def _csr(adjacency: Sequence[Collection[int]]) -> tuple['array[int]', 'array[int]']:
+    """Compressed sparse rows: targets of node `i` are `targets[offsets[i]:offsets[i+1]]`."""
+    offsets = array('i', [0])
+    for targets_of in adjacency:
+        offsets.append(offsets[-1] + len(targets_of))
+    return offsets, array('i', chain.from_iterable(adjacency))
+
+
+def _transpose(offsets: 'array[int]', targets: 'array[int]') -> tuple['array[int]', 'array[int]']:
+    """Reverse all edges - in linear time, via counting sort."""
+    n = len(offsets) - 1
+    counts = [0] * n
+    for t in targets:
+        counts[t] += 1
+    r_offsets = array('i', [0])
+    for c in counts:
+        r_offsets.append(r_offsets[-1] + c)
+    r_targets = array('i', bytes(targets.itemsize * len(targets)))
+    fill = r_offsets.tolist()
+    for s in range(n):
+        for k in range(offsets[s], offsets[s + 1]):
+            t = targets[k]
+            r_targets[fill[t]] = s
+            fill[t] += 1
+    return r_offsets, r_targets
+
+
+class DependencyGraph:
+    """
+    Read-only snapshot of a dependency graph, for fast analysis.
+
+    Each distinct :class:`cyclonedx.model.bom_ref.BomRef` becomes a node, numbered in order of occurrence.
+    Edges are kept in compact integer arrays, in both directions - so that all analyses run in linear time,
+    even for graphs with hundreds of thousands of edges.
+
+    Nested :class:`cyclonedx.model.dependency.Dependency` structures are flattened and merged,
+    just like on serialization.
+    Changes to the dependencies after the graph was built are not reflected.
+    """
+
+    def __init__(self, dependencies: Iterable['Dependency']) -> None:
+        index: dict['BomRef', int] = {}
+        adjacency: list[dict[int, None]] = []
+
+        def node(ref: 'BomRef') -> int:
+            i = index.get(ref)
+            if i is None:
+                i = index[ref] = len(adjacency)
+                adjacency.append({})
+            return i
+
+        todos = list(dependencies)
+        todos.reverse()
+        seen = set()
+        while todos:
+            todo = todos.pop()
+            if (todo_id := id(todo)) in seen:
+                continue
+            seen.add(todo_id)
+            targets_of = adjacency[node(todo.ref)]
+            for d in todo.dependencies:
+                targets_of[node(d.ref)] = None
+            todos.extend(reversed(todo.dependencies))
+
+        self._index = index
+        self._refs = tuple(index)
+        self._offsets, self._targets = _csr(adjacency)
+        self._r_offsets, self._r_targets = _transpose(self._offsets, self._targets)
+
+    @classmethod
+    def from_bom(cls, bom: 'Bom') -> 'DependencyGraph':
+        """Build the graph of :attr:`cyclonedx.model.bom.Bom.dependencies`."""
+        return cls(bom.dependencies)
+
+    # region nodes
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._index
+
+    @property
+    def refs(self) -> tuple['BomRef', ...]:
+        """All nodes, in order of their number."""
+        return self._refs
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct edges."""
+        return len(self._targets)
+
+    def index_of(self, ref: 'BomRef') -> int:
+        """Number of a node.
+
+        :raises KeyError: if the node is not part of the graph
+        """
+        return self._index[ref]
+
+    def _successors(self, i: int) -> 'array[int]':
+        return self._targets[self._offsets[i]:self._offsets[i + 1]]
+
+    def _predecessors(self, i: int) -> 'array[int]':
+        return self._r_targets[self._r_offsets[i]:self._r_offsets[i + 1]]
+
+    def dependencies_of(self, ref: 'BomRef') -> tuple['BomRef', ...]:
+        """Direct dependencies of a node."""
+        refs = self._refs
+        return tuple(refs[t] for t in self._successors(self._index[ref]))
+
+    def dependents_of(self, ref: 'BomRef') -> tuple['BomRef', ...]:
+        """Direct dependents of a node - the nodes that depend on it."""
+        refs = self._refs
+        return tuple(refs[s] for s in self._predecessors(self._index[ref]))
+
+    def roots(self) -> tuple['BomRef', ...]:
+        """Nodes that nothing depends on."""
+        r_offsets = self._r_offsets
+        return tuple(ref for i, ref in enumerate(self._refs) if r_offsets[i] == r_offsets[i + 1])
+
+    def leaves(self) -> tuple['BomRef', ...]:
+        """Nodes that depend on nothing."""
+        offsets = self._offsets
+        return tuple(ref for i, ref in enumerate(self._refs) if offsets[i] == offsets[i + 1])
+
+    # endregion nodes
+
+    # region reachability
+
+    def _reach(self, starts: Iterable[int], offsets: 'array[int]', targets: 'array[int]') -> list[int]:
+        visited = bytearray(len(self._refs))
+        found = []
+        queue = deque(starts)
+        for i in queue:
+            visited[i] = 1
+        while queue:
+            s = queue.popleft()
+            for k in range(offsets[s], offsets[s + 1]):
+                t = targets[k]
+                if not visited[t]:
+                    visited[t] = 1
+                    found.append(t)
+                    queue.append(t)
+        return found
+
+    def transitive_dependencies(self, *refs: 'BomRef') -> tuple['BomRef', ...]:
+        """All nodes that the given nodes depend on, directly or transitively.
+
+        Ordered by distance. The given nodes themselves are not part of the result.
+
+        :raises KeyError: if a node is not part of the graph
+        """
+        found = self._reach(map(self._index.__getitem__, refs), self._offsets, self._targets)
+        refs_ = self._refs
+        return tuple(refs_[i] for i in found)
+
+    def transitive_dependents(self, *refs: 'BomRef') -> tuple['BomRef', ...]:
+        """All nodes that depend on the given nodes, directly or transitively.
+
+        Ordered by distance. The given nodes themselves are not part of the result.
+
+        :raises KeyError: if a node is not part of the graph
+        """
+        found = self._reach(map(self._index.__getitem__, refs), self._r_offsets, self._r_targets)
+        refs_ = self._refs
+        return tuple(refs_[i] for i in found)
+
+    def _reverse_closure(self, start: int) -> dict[int, tuple[int, int]]:
+        """All transitive dependents of a node, each with its distance and the next node on a shortest path back.
+
+        Ordered by distance.
+        """
+        r_offsets, r_targets = self._r_offsets, self._r_targets
+        closure = {start: (0, start)}
+        queue = deque((start,))
+        while queue:
+            t = queue.popleft()
+            d = closure[t][0] + 1
+            for k in range(r_offsets[t], r_offsets[t + 1]):
+                s = r_targets[k]
+                if s not in closure:
+                    closure[s] = (d, t)
+                    queue.append(s)
+        del closure[start]
+        return closure
+
+    def depths(self) -> dict['BomRef', int]:
+        """Depth of each node: the length of the shortest path from any root.
+
+        Roots have depth zero.
+        Nodes that are not reachable from any root - because they are part of a cycle only - are omitted.
+        """
+        n = len(self._refs)
+        offsets, targets = self._offsets, self._targets
+        r_offsets = self._r_offsets
+        depth = [-1] * n
+        queue = deque(i for i in range(n) if r_offsets[i] == r_offsets[i + 1])
+        for i in queue:
+            depth[i] = 0
+        while queue:
+            s = queue.popleft()
+            d = depth[s] + 1
+            for k in range(offsets[s], offsets[s + 1]):
+                t = targets[k]
+                if depth[t] < 0:
+                    depth[t] = d
+                    queue.append(t)
+        return {ref: d for ref, d in zip(self._refs, depth) if d >= 0}
+
+    # endregion reachability
+
+    # region order and cycles
+
+    def _topological_order(self) -> tuple[list[int], bool]:
+        # dependencies first - via Kahn's algorithm, starting at the leaves
+        n = len(self._refs)
+        offsets = self._offsets
+        r_offsets, r_targets = self._r_offsets, self._r_targets
+        pending = [offsets[i + 1] - offsets[i] for i in range(n)]
+        order = [i for i in range(n) if pending[i] == 0]
+        for t in order:  # grows while iterating
+            for k in range(r_offsets[t], r_offsets[t + 1]):
+                s = r_targets[k]
+                pending[s] -= 1
+                if pending[s] == 0:
+                    order.append(s)
+        return order, len(order) == n
+
+    def topological_order(self) -> tuple['BomRef', ...]:
+        """All nodes, each after all of its dependencies - like an install order.
+
+        :raises CyclicDependencyException: if the graph has cycles - see :meth:`cycles()`
+        """
+        order, complete = self._topological_order()
+        if not complete:
+            raise CyclicDependencyException(
+                f'dependency graph has {len(self.cycles())} cycle(s) - no topological order exists')
+        refs = self._refs
+        return tuple(refs[i] for i in order)
+
+    def is_acyclic(self) -> bool:
+        """Whether the graph has no cycles."""
+        return self._topological_order()[1]
+
+    def _strongly_connected_components(self) -> list[list[int]]:
+        # Tarjan's algorithm, iterative - so that deep graphs do not exceed the recursion limit
+        n = len(self._refs)
+        offsets, targets = self._offsets, self._targets
+        index = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack: list[int] = []
+        components = []
+        counter = 0
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            work = [(root, offsets[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                v, k = work[-1]
+                if k < offsets[v + 1]:
+                    work[-1] = (v, k + 1)
+                    w = targets[k]
+                    if index[w] < 0:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, offsets[w]))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    components.append(self._pop_component(v, stack, on_stack))
+        return components
+
+    @staticmethod
+    def _pop_component(v: int, stack: list[int], on_stack: bytearray) -> list[int]:
+        component = []
+        while True:
+            w = stack.pop()
+            on_stack[w] = 0
+            component.append(w)
+            if w == v:
+                return component
+
+    def strongly_connected_components(self) -> tuple[tuple['BomRef', ...], ...]:
+        """Partition of all nodes into strongly connected components.
+
+        Each component is a maximal set of nodes that all (transitively) depend on each other;
+        a node that is not part of any cycle forms a component on its own.
+        Components are ordered so that each comes after all components it depends on.
+        """
+        refs = self._refs
+        return tuple(tuple(refs[i] for i in c) for c in self._strongly_connected_components())
+
+    def cycles(self) -> tuple[tuple['BomRef', ...], ...]:
+        """The strongly connected components that contain cycles - including nodes that depend on themselves."""
+        refs = self._refs
+        return tuple(
+            tuple(refs[i] for i in c)
+            for c in self._strongly_connected_components()
+            if len(c) > 1 or self._has_self_loop(c[0]))
+
+    def _has_self_loop(self, i: int) -> bool:
+        return i in self._successors(i)
+
+    # endregion order and cycles
+
+    def __repr__(self) -> str:
+        return f'<DependencyGraph nodes={len(self._refs)} edges={len(self._targets)}>'
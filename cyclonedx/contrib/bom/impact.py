@@ -0,0 +1,181 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Impact analysis: what is affected by a change to - or a vulnerability of - some components"""
+
+__all__ = [
+    'Impact',
+    'ImpactAnalyzer',
+]
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional, Union
+
+from ...model.bom_ref import BomRef
+from .graph import DependencyGraph
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ...model.bom import Bom
+    from ...model.vulnerability import Vulnerability
+
+
+class Impact:
+    """
+    Result of an impact analysis.
+
+    Holds the directly affected nodes and all of their transitive dependents,
+    each with a shortest dependency path down to a directly affected node.
+    """
+
+    def __init__(self, affected: tuple[BomRef, ...], next_hops: dict[BomRef, Optional[BomRef]],
+                 roots: tuple[BomRef, ...]) -> None:
+        self._affected = affected
+        self._next_hops = next_hops
+        self._roots = roots
+
+    @property
+    def affected(self) -> tuple[BomRef, ...]:
+        """The directly affected nodes, as queried."""
+        return self._affected
+
+    @property
+    def impacted(self) -> tuple[BomRef, ...]:
+        """
+        Every impacted node: the directly affected ones and their transitive dependents.
+
+        Ordered by the length of their path - see :meth:`path()`.
+        """
+        return tuple(self._next_hops)
+
+    @property
+    def dependents(self) -> tuple[BomRef, ...]:
+        """The transitive dependents of the directly affected nodes - without the directly affected nodes."""
+        return tuple(ref for ref, next_hop in self._next_hops.items() if next_hop is not None)
+
+    @property
+    def roots(self) -> tuple[BomRef, ...]:
+        """
+        The impacted nodes that nothing depends on - typically the products or applications.
+
+        Directly affected nodes that are not part of the dependency graph at all count as roots, too.
+        """
+        return self._roots
+
+    def path(self, ref: BomRef) -> tuple[BomRef, ...]:
+        """
+        A shortest dependency path from an impacted node down to a directly affected node.
+
+        The path starts with the given node and ends with the affected node;
+        for a directly affected node, it is just the node itself.
+
+        :raises KeyError: if the node is not impacted
+        """
+        path = [ref]
+        next_hop = self._next_hops[ref]
+        while next_hop is not None:
+            path.append(next_hop)
+            next_hop = self._next_hops[next_hop]
+        return tuple(path)
+
+    @property
+    def paths(self) -> dict[BomRef, tuple[BomRef, ...]]:
+        """The :meth:`path()` of every impacted node."""
+        return {ref: self.path(ref) for ref in self._next_hops}
+
+    def __contains__(self, ref: object) -> bool:
+        return ref in self._next_hops
+
+    def __bool__(self) -> bool:
+        return bool(self._next_hops)
+
+    def __repr__(self) -> str:
+        return f'<Impact affected={len(self._affected)} impacted={len(self._next_hops)} roots={len(self._roots)}>'
+
+
+class ImpactAnalyzer:
+    """
+    Answers which parts of a dependency graph are affected by some components - or by vulnerabilities.
+
+    The reverse closure of each queried node is computed once and cached,
+    so that repeated queries - like one per vulnerability - do not walk the graph again.
+    The cache holds the closures of up to `cache_size` nodes; the least recently computed ones are dropped first.
+
+    Works on a snapshot of the dependencies - see :class:`DependencyGraph`.
+    """
+
+    def __init__(self, graph: DependencyGraph, cache_size: int = 1024) -> None:
+        self._graph = graph
+        self._cache_size = cache_size
+        self._closures: dict[int, dict[int, tuple[int, int]]] = {}
+        self._roots = frozenset(map(graph.index_of, graph.roots()))
+
+    @classmethod
+    def from_bom(cls, bom: 'Bom', cache_size: int = 1024) -> 'ImpactAnalyzer':
+        """Analyze :attr:`cyclonedx.model.bom.Bom.dependencies`."""
+        return cls(DependencyGraph.from_bom(bom), cache_size)
+
+    @property
+    def graph(self) -> DependencyGraph:
+        return self._graph
+
+    def clear_cache(self) -> None:
+        self._closures.clear()
+
+    def _closure(self, i: int) -> dict[int, tuple[int, int]]:
+        closure = self._closures.get(i)
+        if closure is None:
+            closure = self._graph._reverse_closure(i)
+            if self._cache_size > 0:
+                while len(self._closures) >= self._cache_size:
+                    del self._closures[next(iter(self._closures))]
+                self._closures[i] = closure
+        return closure
+
+    def impact_of(self, refs: Iterable[Union[BomRef, str]]) -> Impact:
+        """
+        Determine everything that transitively depends on any of the given nodes.
+
+        :param refs: the directly affected nodes - as :class:`BomRef` or plain `bom-ref` values.
+                     Nodes that are not part of the dependency graph have no dependents.
+        """
+        graph = self._graph
+        g_refs = graph.refs
+        affected = tuple(dict.fromkeys(ref if isinstance(ref, BomRef) else BomRef(ref) for ref in refs))
+        closures = {graph.index_of(ref): self._closure(graph.index_of(ref)) for ref in affected if ref in graph}
+        # per impacted node: distance, and the next node on a shortest path to any affected node.
+        # following these next nodes decreases the distance by one on each step - so they form valid paths.
+        best: dict[int, tuple[int, int]] = {}
+        for closure in closures.values():
+            for s, hop in closure.items():
+                if s not in closures and (s not in best or hop[0] < best[s][0]):
+                    best[s] = hop
+        ordered = sorted(best, key=lambda s: best[s][0]) if len(closures) > 1 else best
+        next_hops: dict[BomRef, Optional[BomRef]] = dict.fromkeys(affected)
+        next_hops.update((g_refs[s], g_refs[best[s][1]]) for s in ordered)
+        roots = (*(ref for ref in affected if ref not in graph or graph.index_of(ref) in self._roots),
+                 *(g_refs[s] for s in ordered if s in self._roots))
+        return Impact(affected, next_hops, roots)
+
+    def impact_of_vulnerabilities(self, vulnerabilities: Iterable['Vulnerability']
+                                  ) -> dict['Vulnerability', Impact]:
+        """
+        Determine the impact of each vulnerability, via the components and services it affects -
+        see :attr:`cyclonedx.model.vulnerability.Vulnerability.affects`.
+
+        Combine the :attr:`Impact.roots` of the results, to find all products affected by any of the vulnerabilities.
+        """
+        return {v: self.impact_of(target.ref for target in v.affects) for v in vulnerabilities}
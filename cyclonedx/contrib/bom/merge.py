@@ -0,0 +1,260 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Merging of many BOMs into one"""
+
+__all__ = [
+    'BomMerger',
+    'merge_boms',
+    'component_identity',
+    'service_identity',
+    'vulnerability_identity',
+]
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Optional, TypeVar
+
+from sortedcontainers import SortedSet
+
+from ...model import cached_comparison
+from ...model.bom import Bom
+from ...model.bom_ref import BomRef
+from ...model.component import Component
+from ...model.dependency import Dependency
+from ...model.service import Service
+from ...model.vulnerability import BomTarget, Vulnerability
+
+_T = TypeVar('_T', Component, Service)
+
+
+def component_identity(component: Component) -> Hashable:
+    """
+    Identity key of a component: its purl - or, if it has none, its group, name, version and hashes.
+
+    Components with equal keys are considered the same.
+    """
+    if component.purl is not None:
+        return 'purl', component.purl.to_string()
+    return ('component', component.group, component.name, component.version,
+            frozenset((h.alg, h.content) for h in component.hashes))
+
+
+def service_identity(service: Service) -> Hashable:
+    """Identity key of a service: its group, name and version."""
+    return 'service', service.group, service.name, service.version
+
+
+def vulnerability_identity(vulnerability: Vulnerability) -> Hashable:
+    """
+    Identity key of a vulnerability: its ID and source.
+
+    Vulnerabilities without ID are considered distinct.
+    """
+    if vulnerability.id is None:
+        return 'object', id(vulnerability)
+    source = vulnerability.source
+    return ('vulnerability', vulnerability.id,
+            None if source is None else source.name,
+            None if source is None or source.url is None else str(source.url))
+
+
+def _nested_components(component: Component) -> SortedSet[Component]:
+    return component.components
+
+
+def _nested_services(service: Service) -> SortedSet[Service]:
+    return service.services
+
+
+class BomMerger:
+    """
+    Merges many :class:`cyclonedx.model.bom.Bom` into one - flat.
+
+    * Components, services and vulnerabilities are deduplicated by their identity keys -
+      see :func:`component_identity()`, :func:`service_identity()` and :func:`vulnerability_identity()`.
+      The first occurrence wins; nested components and services stay with their parent.
+      Those that are nested in a dropped duplicate only are taken over by the parent that is kept.
+    * The :attr:`cyclonedx.model.bom.BomMetaData.component` of each BOM becomes a component of the result.
+    * `bom-ref` values are unique per BOM only. So colliding values of different components are rewritten,
+      and all dependencies and :attr:`cyclonedx.model.vulnerability.Vulnerability.affects` follow.
+      References to anything that is not declared in the same BOM are kept as they are.
+    * Dependency edges and the :attr:`cyclonedx.model.bom.BomMetaData.tools` are merged.
+
+    Each item is handled via hash lookups, so merging scales linearly with the total number of items;
+    sorting them into the result happens only once, in :meth:`to_bom()`.
+
+    Items are moved into the result, not copied - merged BOMs must not be used afterward.
+    In return, BOMs can be merged one by one from a stream, and released right away.
+    """
+
+    def __init__(self, component: Optional[Component] = None, *,
+                 component_key: Callable[[Component], Hashable] = component_identity,
+                 service_key: Callable[[Service], Hashable] = service_identity,
+                 vulnerability_key: Callable[[Vulnerability], Hashable] = vulnerability_identity) -> None:
+        """
+        :param component: the component that the result describes - like the product.
+                          It depends on the :attr:`cyclonedx.model.bom.BomMetaData.component` of each merged BOM.
+        """
+        self._component = component
+        self._component_key = component_key
+        self._service_key = service_key
+        self._vulnerability_key = vulnerability_key
+        self._components: dict[Hashable, Component] = {}
+        self._services: dict[Hashable, Service] = {}
+        self._vulnerabilities: dict[Hashable, Vulnerability] = {}
+        # all components and services - including the nested ones - for resolving references of duplicates
+        self._known_components: dict[Hashable, Component] = {}
+        self._known_services: dict[Hashable, Service] = {}
+        self._refs: dict[str, BomRef] = {}
+        # original values of the rewritten `bom-ref`s of the BOM being merged - by identity of the BomRef.
+        # references are resolved by the original values, as rewritten ones might collide with others of that BOM.
+        self._originals: dict[int, str] = {}
+        self._suffixes: dict[str, int] = {}
+        self._edges: dict[BomRef, dict[BomRef, None]] = {}
+        self._result = Bom()
+        if component is not None:
+            self._claim(component.bom_ref, {})
+            self._result.metadata.component = component
+
+    def add(self, bom: Bom) -> None:
+        """Merge a BOM into the result."""
+        remap: dict[str, BomRef] = {}
+        self._originals.clear()
+        root = bom.metadata.component
+        if root is not None:
+            self._add(root, self._components, self._known_components, self._component_key, _nested_components,
+                      remap)
+        for component in bom.components:
+            self._add(component, self._components, self._known_components, self._component_key, _nested_components,
+                      remap)
+        for service in bom.services:
+            self._add(service, self._services, self._known_services, self._service_key, _nested_services, remap)
+        tools = self._result.metadata.tools
+        tools.components.update(bom.metadata.tools.components)
+        tools.services.update(bom.metadata.tools.services)
+        tools.tools.update(bom.metadata.tools.tools)
+        self._add_dependencies(bom.dependencies, remap)
+        if root is not None and self._component is not None:
+            self._edges.setdefault(self._component.bom_ref, {})[self._resolve(root.bom_ref, remap)] = None
+        for vulnerability in bom.vulnerabilities:
+            self._add_vulnerability(vulnerability, remap)
+
+    def add_all(self, boms: Iterable[Bom]) -> 'BomMerger':
+        """Merge many BOMs into the result - one by one, so that each can be released right after."""
+        for bom in boms:
+            self.add(bom)
+        return self
+
+    def to_bom(self) -> Bom:
+        """
+        The merged BOM.
+
+        Completes the merge - the merger must not be used afterward.
+        """
+        bom = self._result
+        # sorting many items into the sets is dominated by comparisons - cache their keys
+        with cached_comparison():
+            bom.components = self._components.values()
+            bom.services = self._services.values()
+            bom.dependencies = (Dependency(ref, (Dependency(d) for d in ds)) for ref, ds in self._edges.items())
+            bom.vulnerabilities = self._vulnerabilities.values()
+        return bom
+
+    def _add(self, item: _T, items: dict[Hashable, _T], known: dict[Hashable, _T],
+             key: Callable[[_T], Hashable], nested: Callable[[_T], SortedSet[_T]],
+             remap: dict[str, BomRef]) -> None:
+        # each item, with the one that it is merged into - itself, unless it is a duplicate
+        todos = [(item, items.setdefault(key(item), item))]
+        while todos:
+            todo, kept = todos.pop()
+            if todo is kept:
+                known.setdefault(key(todo), todo)
+                self._claim(todo.bom_ref, remap)
+                todos.extend((n, n) for n in nested(todo))
+                continue
+            # a duplicate - refer to the kept one instead
+            if todo.bom_ref.value is not None:
+                remap[todo.bom_ref.value] = kept.bom_ref
+            for n in nested(todo):
+                kept_n = known.get(key(n))
+                if kept_n is None:
+                    # nested in the duplicate only - keep it, nested in the kept one
+                    nested(kept).add(n)
+                    kept_n = n
+                todos.append((n, kept_n))
+
+    def _claim(self, ref: BomRef, remap: dict[str, BomRef]) -> None:
+        """Take a `bom-ref` into the result - rewrite its value, if it collides."""
+        value = ref.value
+        if value is None:
+            return  # is made unique on serialization, anyway
+        claimed = self._refs.get(value)
+        if claimed is None:
+            self._refs[value] = ref
+        elif claimed is not ref:
+            self._originals[id(ref)] = value
+            ref.value = unique = self._make_unique(value)
+            self._refs[unique] = ref
+        remap[value] = ref
+
+    def _make_unique(self, value: str) -> str:
+        n = self._suffixes.get(value, 0)
+        while (unique := f'{value}-{(n := n + 1)}') in self._refs:
+            pass
+        self._suffixes[value] = n
+        return unique
+
+    def _resolve(self, ref: BomRef, remap: dict[str, BomRef]) -> BomRef:
+        value = self._originals.get(id(ref), ref.value)
+        return ref if value is None else remap.get(value, ref)
+
+    def _add_dependencies(self, dependencies: Iterable[Dependency], remap: dict[str, BomRef]) -> None:
+        todos = list(dependencies)
+        seen = set()
+        while todos:
+            todo = todos.pop()
+            if (todo_id := id(todo)) in seen:
+                continue
+            seen.add(todo_id)
+            ds = self._edges.setdefault(self._resolve(todo.ref, remap), {})
+            for d in todo.dependencies:
+                ds[self._resolve(d.ref, remap)] = None
+            todos.extend(todo.dependencies)
+
+    def _add_vulnerability(self, vulnerability: Vulnerability, remap: dict[str, BomRef]) -> None:
+        # affects are sorted by ref - so they are replaced, not modified
+        vulnerability.affects = [
+            BomTarget(ref=self._resolve(BomRef(t.ref), remap).value or t.ref, versions=t.versions)
+            for t in vulnerability.affects]
+        key = self._vulnerability_key(vulnerability)
+        kept = self._vulnerabilities.get(key)
+        if kept is not None:
+            kept.affects.update(vulnerability.affects)
+            return
+        self._vulnerabilities[key] = vulnerability
+        self._claim(vulnerability.bom_ref, remap)
+
+
+def merge_boms(boms: Iterable[Bom], component: Optional[Component] = None, **kwargs: Any) -> Bom:
+    """
+    Merge many BOMs into one - see :class:`BomMerger`.
+
+    :param boms: the BOMs to merge - may be a stream; each is released after it was merged
+    :param component: the component that the result describes - like the product
+    :param kwargs: further arguments for :class:`BomMerger`
+    """
+    return BomMerger(component, **kwargs).add_all(boms).to_bom()
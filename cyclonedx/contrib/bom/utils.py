@@ -20,13 +20,19 @@
 __all__ = [
     'BomRefDiscriminator',
     'BomDependencyGraphFlatMerger',
+    'BomSerializationView',
 ]
 
-from collections.abc import Iterable
+from collections.abc import Collection, Generator, Hashable, Iterable
+from contextlib import contextmanager
+from copy import copy
 from itertools import chain
 from random import random
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
+from sortedcontainers import SortedSet
+
+from ..._internal.ref_substitution import substituted_values as _substituted_values
 from ...model.dependency import Dependency
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -66,13 +72,26 @@ class BomRefDiscriminator:
         Any BomRef whose ``value`` is ``None`` or duplicates a previously
         encountered value is assigned a newly generated unique identifier.
         """
-        known_values = []
+        substitutes = self.substitutes()
+        for bomref, _ in self._bomrefs:
+            if (value := substitutes.get(id(bomref))) is not None:
+                bomref.value = value
+
+    def substitutes(self) -> dict[int, str]:
+        """
+        The values that :meth:`discriminate()` would assign - without assigning them.
+
+        Maps the :func:`id()` of each BomRef that needs a new value to that value.
+        """
+        substitutes = {}
+        # values are plain strings - so a set is safe here, and keeps this linear.
+        known_values: set[str] = set()
         for bomref, _ in self._bomrefs:
             value = bomref.value
             if value is None or value in known_values:
-                value = self._make_unique()
-                bomref.value = value
-            known_values.append(value)
+                value = substitutes[id(bomref)] = self._make_unique()
+            known_values.add(value)
+        return substitutes
 
     def reset(self) -> None:
         """
@@ -171,3 +190,115 @@ class BomDependencyGraphFlatMerger:
             for br, ds
             in flat.items()
         )
+
+
+class BomSerializationView:
+    """
+    Read-only counterpart of :class:`BomRefDiscriminator` and :class:`BomDependencyGraphFlatMerger`.
+
+    The discriminated `bom-ref` values, the missing dependency entries and the flattened dependency graph
+    are computed in side tables, instead of being written to the :class:`cyclonedx.model.bom.Bom`.
+    So the Bom is not modified at all - and can be serialized by many threads at once,
+    to many formats and schema versions.
+
+    The view is a snapshot: changes to the Bom after the view was created are not reflected.
+    """
+
+    def __init__(self, bom: 'Bom', prefix: str = 'BomRef') -> None:
+        self._bom = bom
+        self._substitutes = BomRefDiscriminator.from_bom(bom, prefix).substitutes()
+        self._dependencies = self._complete_dependencies(bom)
+        self._flat_dependencies: Optional[list[Dependency]] = None
+
+    @staticmethod
+    def _complete_dependencies(bom: 'Bom') -> Collection[Dependency]:
+        # like `Bom.validate()` does: each dependable gets a dependency entry
+        known = {d.ref for d in bom._dependencies}
+        missing = []
+        for dependable in bom._get_dependables():
+            if dependable.bom_ref not in known:
+                known.add(dependable.bom_ref)
+                missing.append(Dependency(ref=dependable.bom_ref))
+        # NOTE: do not use the getter - see `BomDependencyGraphFlatMerger.reset()` for reasons.
+        return SortedSet(chain(bom._dependencies, missing)) if missing else bom._dependencies
+
+    def value_of(self, ref: 'BomRef') -> Optional[str]:
+        """The value that a :class:`cyclonedx.model.bom_ref.BomRef` is serialized with."""
+        return self._substitutes.get(id(ref), ref.value)
+
+    def _key(self, ref: 'BomRef') -> Hashable:
+        substitute = self._substitutes.get(id(ref))
+        return ref if substitute is None else substitute
+
+    @property
+    def dependencies(self) -> Collection[Dependency]:
+        """All :attr:`cyclonedx.model.bom.Bom.dependencies` - plus an entry for each component and service that
+        has none, like :meth:`cyclonedx.model.bom.Bom.validate()` would register."""
+        return self._dependencies
+
+    def flat_dependencies(self) -> list[Dependency]:
+        """
+        The :attr:`dependencies`, flattened and merged - like :class:`BomDependencyGraphFlatMerger` does.
+
+        Ordered by the serialized values of their refs.
+        Computed once - so that the view can be shared by many outputs.
+        """
+        if self._flat_dependencies is None:
+            self._flat_dependencies = self._flatten_merge()
+        return self._flat_dependencies
+
+    def _flatten_merge(self) -> list[Dependency]:
+        flat: dict[Hashable, tuple['BomRef', dict[Hashable, 'BomRef']]] = {}
+        todos = list(self._dependencies)
+        seen = set()
+        while todos:
+            todo = todos.pop()
+            if (todo_id := id(todo)) in seen:
+                continue
+            seen.add(todo_id)
+            _, ds = flat.setdefault(self._key(todo.ref), (todo.ref, {}))
+            if todo_deps := todo.dependencies:
+                for d in todo_deps:
+                    ds.setdefault(self._key(d.ref), d.ref)
+                todos.extend(todo_deps)
+        return sorted((self._dependency(br, ds.values()) for br, ds in flat.values()),
+                      key=self._sort_key)
+
+    def _dependency(self, ref: 'BomRef', targets: Iterable['BomRef']) -> Dependency:
+        dependency = Dependency(ref)
+        # NOTE: not using the setter - its set would deduplicate refs by their original values.
+        dependency._dependencies = sorted(map(Dependency, targets), key=self._sort_key)  # type:ignore[assignment]
+        return dependency
+
+    def _sort_key(self, dependency: Dependency) -> str:
+        return self.value_of(dependency.ref) or ''
+
+    def validate(self) -> bool:
+        """
+        Like :meth:`cyclonedx.model.bom.Bom.validate()` - but without registering anything in the Bom.
+
+        The checks run against :attr:`dependencies`.
+        """
+        return self._bom._validate(self._dependencies)
+
+    def shell(self, flatten: bool = False) -> 'Bom':
+        """
+        A shallow copy of the Bom, that carries the :attr:`dependencies` - or the :meth:`flat_dependencies()`.
+
+        Serialize it within :meth:`serialization()` - so that the discriminated `bom-ref` values are used.
+        """
+        shell = copy(self._bom)
+        # NOTE: not using the setter - it would deduplicate refs by their original values.
+        shell._dependencies = self.flat_dependencies() if flatten else self._dependencies  # type:ignore[assignment]
+        return shell
+
+    @contextmanager
+    def serialization(self, flatten: bool = False) -> Generator['Bom', None, None]:
+        """
+        Context manager that provides a :meth:`shell()` of the Bom to serialize.
+
+        Within the ``with`` block, BomRefs are serialized with their discriminated values - see :meth:`value_of()`.
+        This takes effect in the current thread or task only.
+        """
+        with _substituted_values(self._substitutes):
+            yield self.shell(flatten)
@@ -143,3 +143,10 @@ class InvalidConfidenceException(CycloneDxModelException):
     The confidence of the evidence from 0 - 1, where 1 is 100% confidence.
     """
     pass
+
+
+class CyclicDependencyException(CycloneDxModelException):
+    """
+    Raised when an operation requires an acyclic dependency graph, but the graph has cycles.
+    """
+    pass
@@ -21,13 +21,8 @@
 
 __all__ = ['LicenseFactory']
 
-import sys
-
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
 
+from .._internal.deprecation import deprecated
 from ..contrib.license.factories import LicenseFactory as _LicenseFactory
 
 # region deprecated re-export
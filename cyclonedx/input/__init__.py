@@ -0,0 +1,220 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""
+Set of functions for reading CycloneDX documents into our libraries internal Bom model - incrementally,
+so that even huge documents can be processed in bounded memory.
+"""
+
+__all__ = ['Item', 'Source', 'load']
+
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from io import BytesIO
+from mmap import ACCESS_READ, mmap
+from os import PathLike
+from typing import IO, TYPE_CHECKING, Any, Optional, Union
+
+from .._internal.compression import (
+    compression_by_content as _compression_by_content,
+    decompressed as _decompressed,
+    decompressor as _decompressor,
+)
+from ..exception.serialization import CycloneDxDeserializationException
+from ..model import cached_comparison
+from ..model.component import Component
+from ..model.dependency import Dependency
+from ..model.service import Service
+from ..model.vulnerability import Vulnerability
+from ..schema import OutputFormat, SchemaVersion
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..model.bom import Bom
+
+Source = Union[str, 'PathLike[str]', IO[bytes]]
+"""Where to read a document from: either the path of a file, or a binary stream.
+
+Documents compressed with gzip, bzip2 or xz are decompressed while being read - detected by their content.
+For that, streams must support ``peek()`` or ``seek()``; like files opened in mode ``'rb'`` and :class:`io.BytesIO`.
+"""
+
+Item = Union[Component, Service, Dependency, Vulnerability]
+"""An item that is read incrementally."""
+
+_SECTIONS: dict[str, type] = {
+    'components': Component,
+    'services': Service,
+    'dependencies': Dependency,
+    'vulnerabilities': Vulnerability,
+}
+
+
+@contextmanager
+def _open(source: Source) -> Iterator[IO[bytes]]:
+    # compressed documents are decompressed while being read - detected by their content
+    if isinstance(source, (str, PathLike)):
+        with open(source, 'rb') as f, _decompressed(f) as d:
+            yield d
+    else:
+        # streams are owned by the caller, and are not closed
+        with _decompressed(source) as d:
+            yield d
+
+
+def _populate(bom: 'Bom', items: Iterable[tuple[str, Any]]) -> 'Bom':
+    sections: dict[str, list[Any]] = {name: [] for name in _SECTIONS}
+    for section_name, item in items:
+        sections[section_name].append(item)
+    # sorting many items into the sets is dominated by comparisons - cache their keys
+    with cached_comparison():
+        bom.components = sections['components']
+        bom.services = sections['services']
+        bom.dependencies = sections['dependencies']
+        bom.vulnerabilities = sections['vulnerabilities']
+    return bom
+
+
+# region load
+
+# how much of a stream is peeked at, for detecting its format and schema version
+_HEAD_SIZE = 64 * 1024
+
+_FIRST_CHAR = re.compile(rb'(?:\xef\xbb\xbf)?\s*(.)', re.DOTALL)
+_JSON_SPEC_VERSION = re.compile(rb'"specVersion"\s*:\s*"([^"]*)"')
+_XML_NAMESPACE = re.compile(rb'xmlns(?::[\w.-]+)?\s*=\s*["\']http://cyclonedx\.org/schema/bom/([^"\']*)["\']')
+
+_Buffer = Union[bytes, mmap]
+
+
+def _head(stream: IO[bytes]) -> bytes:
+    """The first bytes of a stream - without consuming them, if possible."""
+    head: bytes
+    if hasattr(stream, 'peek'):
+        head = stream.peek(_HEAD_SIZE)[:_HEAD_SIZE]
+        return head
+    if stream.seekable():
+        position = stream.tell()
+        head = stream.read(_HEAD_SIZE)
+        stream.seek(position)
+        return head
+    return b''
+
+
+@contextmanager
+def _open_mapped(source: Source) -> Iterator[tuple[IO[bytes], _Buffer]]:
+    """Open a source - along with its decompressed content, or at least the head of it.
+
+    Uncompressed files are memory-mapped, so that their content is neither copied nor decoded upfront.
+    """
+    if not isinstance(source, (str, PathLike)):
+        with _decompressed(source) as reader:
+            yield reader, _head(reader)
+        return
+    with open(source, 'rb') as f:
+        try:
+            mapped = mmap(f.fileno(), 0, access=ACCESS_READ)
+        except (OSError, ValueError):
+            # empty files and special files, like pipes, cannot be mapped
+            with _decompressed(f) as reader:
+                yield reader, _head(reader)
+            return
+        with mapped:
+            compression = _compression_by_content(mapped)
+            if compression is None:
+                yield mapped, mapped  # type:ignore[misc]
+            else:
+                with _decompressor(mapped, compression) as reader:  # type:ignore[arg-type]
+                    yield reader, _head(reader)
+
+
+def _detect_format(data: _Buffer) -> OutputFormat:
+    first = _FIRST_CHAR.match(data)
+    if first is not None:
+        if first.group(1) == b'{':
+            return OutputFormat.JSON
+        if first.group(1) == b'<':
+            return OutputFormat.XML
+    raise CycloneDxDeserializationException('Unknown document format - neither JSON nor XML')
+
+
+def _detect_schema_version(data: _Buffer, output_format: OutputFormat) -> Optional[SchemaVersion]:
+    found = (_JSON_SPEC_VERSION if output_format is OutputFormat.JSON else _XML_NAMESPACE).search(data)
+    if found is None:
+        return None
+    try:
+        return SchemaVersion.from_version(found.group(1).decode('ascii'))
+    except ValueError:
+        return None
+
+
+def _validate(data: _Buffer, output_format: OutputFormat, schema_version: Optional[SchemaVersion]) -> None:
+    from ..validation import make_schemabased_validator
+
+    if schema_version is None:
+        raise CycloneDxDeserializationException(
+            f'Cannot validate the {output_format.name} document - unknown schema version')
+    error = make_schemabased_validator(output_format, schema_version).validate_str(str(data, 'utf-8-sig'))
+    if error is not None:
+        raise CycloneDxDeserializationException(
+            f'Invalid {output_format.name} document for schema version {schema_version.to_version()}: {error}')
+
+
+def load(source: Source, *,
+         output_format: Optional[OutputFormat] = None,
+         validate: bool = False,
+         **kwargs: Any) -> 'Bom':
+    """Read a CycloneDX document - in whatever format and schema version it is.
+
+    The format is detected by the first character of the document, unless given.
+    Then the document is read incrementally - see :func:`cyclonedx.input.json.load_json()`
+    and :func:`cyclonedx.input.xml.load_xml()`.
+
+    Uncompressed files are memory-mapped: they are read straight from the page cache,
+    and never copied into memory as a whole - neither as bytes nor as decoded string.
+
+    :param source: path of a file, or a binary stream
+    :param output_format: the format of the document - detected, if omitted
+    :param validate: whether to validate the document against the schema of its version, first.
+                     The version is detected by the ``specVersion`` of JSON documents,
+                     and the namespace of XML documents.
+                     This requires the document to be decoded as a whole -
+                     and the optional dependencies of :mod:`cyclonedx.validation`.
+    :param kwargs: further arguments for :func:`cyclonedx.input.json.load_json()`
+                   or :func:`cyclonedx.input.xml.load_xml()` - like ``sections``
+    :return: the Bom
+    :raises CycloneDxDeserializationException: if the format is unknown, or if the document is invalid
+    """
+    with _open_mapped(source) as (stream, data):
+        if output_format is None:
+            output_format = _detect_format(data)
+        if validate:
+            if not isinstance(data, mmap):
+                # the whole document is needed - and must be read from memory, afterward
+                data = stream.read()
+                stream = BytesIO(data)
+            _validate(data, output_format, _detect_schema_version(data, output_format))
+        if output_format is OutputFormat.JSON:
+            from .json import load_json
+            return load_json(stream, **kwargs)
+        if output_format is OutputFormat.XML:
+            from .xml import load_xml
+            return load_xml(stream, **kwargs)
+    raise ValueError(f'Unexpected output_format: {output_format!r}')
+
+
+# endregion load
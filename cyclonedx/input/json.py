@@ -0,0 +1,363 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Incremental reading of CycloneDX JSON documents."""
+
+__all__ = ['LazyComponent', 'iter_json', 'load_json']
+
+from codecs import getincrementaldecoder
+from collections.abc import Callable, Container, Iterator
+from json import JSONDecodeError, JSONDecoder
+from re import compile as re_compile
+from typing import IO, Any, Optional
+
+from py_serializable import ObjectMetadataLibrary
+
+from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
+from .._internal.slots import _get_slot_names
+from ..exception.serialization import CycloneDxDeserializationException
+from ..model.bom import Bom
+from ..model.component import Component, ComponentType
+from ..serialization import PackageUrl as PackageUrlSH
+from . import _SECTIONS, Item, Source, _open, _populate
+
+_NON_WHITESPACE = re_compile(r'[^ \t\n\r]')
+# tokens that matter, while skipping a value: strings, and the nesting of arrays and objects
+_SKIP_STRUCTURE = re_compile(r'["\[\]{}]')
+_SKIP_STRING = re_compile(r'["\\]')
+
+_SKIP_FIELDS_OF = ('components', 'services')
+
+
+class LazyComponent(Component):
+    """A :class:`Component`, that is deserialized from its raw JSON data on first use.
+
+    Only the identifying fields - type, group, name, version, bom-ref, purl and cpe - are read right away,
+    and nested components become lazy components, too.
+    These suffice for sorting, hashing and lookups.
+    Accessing any other property deserializes the rest of the component, transparently;
+    afterward, the object is a complete component and the raw data is dropped.
+
+    Takes ownership of the raw data, which must not be modified afterward.
+    """
+
+    __slots__ = ('__raw',)
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        # `Component.__init__()` is not called on purpose - the remaining fields stay unset until materialized.
+        self.__raw: Optional[dict[str, Any]] = raw
+        try:
+            self.type = ComponentType(raw.get('type', ComponentType.LIBRARY))
+            self.group = raw.get('group')
+            self.name = raw['name']
+            self.version = raw.get('version')
+            self._bom_ref = _bom_ref_from_str(raw.get('bom-ref'))
+            purl = raw.get('purl')
+            self.purl = None if purl is None else PackageUrlSH.deserialize(purl)
+            self.cpe = raw.get('cpe')
+        except (KeyError, TypeError, ValueError) as err:
+            raise CycloneDxDeserializationException(f'Invalid component data: {err!r}') from err
+        # not via the setter - which would look up the replaced components, an unset field
+        self._components = _ObservedSortedSet(map(LazyComponent, raw.pop('components', ())))
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the component was deserialized completely."""
+        return self.__raw is None
+
+    def __materialize(self) -> bool:
+        try:
+            raw = object.__getattribute__(self, '_LazyComponent__raw')
+        except AttributeError:  # not initialized, yet - like while unpickling
+            return False
+        if raw is None:
+            return False
+        try:
+            component: Component = Component.from_json(raw)  # type:ignore[attr-defined]
+        except (KeyError, TypeError, ValueError) as err:
+            raise CycloneDxDeserializationException(f'Invalid component data: {err!r}') from err
+        for name in _get_slot_names(Component):
+            try:
+                object.__getattribute__(self, name)
+            except AttributeError:
+                object.__setattr__(self, name, getattr(component, name))
+        self.__raw = None
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        # called only for unset slots, like fields that were not deserialized, yet
+        if (name in _get_slot_names(Component) or not name.startswith('_')) and self.__materialize():
+            return getattr(self, name)
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+
+def __serialize_like_component() -> None:
+    # py_serializable looks up the metadata by the exact class of an object
+    component = f'{Component.__module__}.{Component.__qualname__}'
+    lazy_component = f'{LazyComponent.__module__}.{LazyComponent.__qualname__}'
+    ObjectMetadataLibrary.klass_mappings[lazy_component] = ObjectMetadataLibrary.klass_mappings[component]
+    ObjectMetadataLibrary.klass_property_mappings[lazy_component] = \
+        ObjectMetadataLibrary.klass_property_mappings[component]
+
+
+__serialize_like_component()
+
+
+class _JsonReader:
+    """Reads the tokens of a JSON document from a binary stream, chunk by chunk.
+
+    Structure is walked token by token; values are decoded as a whole via :meth:`JSONDecoder.raw_decode()`,
+    or skipped without being decoded.
+    Only the unread rest of the current chunk and the value being decoded are kept in memory.
+    """
+
+    def __init__(self, f: IO[bytes], chunk_size: int) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = getincrementaldecoder('utf-8-sig')()
+        self._json_decoder = JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read more data. Returns whether there was more data."""
+        if self._eof:
+            return False
+        data = self._f.read(size)
+        self._eof = not data
+        self._buf = self._buf[self._pos:] + self._decoder.decode(data, final=self._eof)
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character - or an empty string at the end."""
+        while True:
+            m = _NON_WHITESPACE.search(self._buf, self._pos)
+            if m is not None:
+                self._pos = m.start()
+                return self._buf[self._pos]
+            self._pos = len(self._buf)
+            if not self._fill(self._chunk_size):
+                return ''
+
+    def consume(self, char: str) -> bool:
+        if self._peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char: str) -> None:
+        if not self.consume(char):
+            raise JSONDecodeError(f'Expecting {char!r}', self._buf, self._pos)
+
+    def expect_end(self) -> None:
+        if self._peek() != '':
+            raise JSONDecodeError('Extra data', self._buf, self._pos)
+
+    def value(self) -> Any:
+        self._peek()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buf, self._pos)
+            except JSONDecodeError:
+                # might be incomplete, yet
+                if not self._fill(size):
+                    raise
+            else:
+                # scalars like numbers might continue in the next chunk
+                if end < len(self._buf) or not self._fill(size):
+                    self._pos = end
+                    return value
+            # grow reads, so that huge values are not decoded over and over again
+            size *= 2
+
+    def skip(self) -> None:
+        """Skip a value - without decoding it.
+
+        Only strings and the nesting of arrays and objects are tracked, to find the end of the value.
+        The skipped content is not validated otherwise.
+        """
+        char = self._peek()
+        if char not in ('"', '[', '{'):
+            # scalars are small
+            self.value()
+            return
+        depth = 0
+        while True:
+            m = _SKIP_STRUCTURE.search(self._buf, self._pos)
+            if m is None:
+                self._pos = len(self._buf)
+                if not self._fill(self._chunk_size):
+                    raise JSONDecodeError('Unterminated value', self._buf, self._pos)
+                continue
+            self._pos = m.end()
+            char = m.group()
+            if char == '"':
+                self.__skip_string()
+            elif char in '[{':
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0:
+                return
+
+    def __skip_string(self) -> None:
+        """Skip the rest of a string, after its opening quote."""
+        while True:
+            m = _SKIP_STRING.search(self._buf, self._pos)
+            if m is None:
+                self._pos = len(self._buf)
+                if not self._fill(self._chunk_size):
+                    raise JSONDecodeError('Unterminated string', self._buf, self._pos)
+                continue
+            self._pos = m.end()
+            if m.group() == '"':
+                return
+            # the escaped character might be in the next chunk
+            if self._pos == len(self._buf) and not self._fill(self._chunk_size):
+                raise JSONDecodeError('Unterminated string', self._buf, self._pos)
+            self._pos += 1
+
+
+class _JsonStream:
+    """Reads the items of the sections of a document, one by one.
+
+    Each item is materialized as soon as it was read; its raw data is dropped afterwards.
+    Unwanted sections and fields are skipped, without being decoded.
+    Everything else is collected in :attr:`rest`, for later deserialization of the rest of the document.
+    """
+
+    def __init__(self, source: Source,
+                 sections: Optional[Container[str]] = None, skip_fields: Container[str] = (), lazy: bool = False,
+                 chunk_size: int = 64 * 1024) -> None:
+        self.source = source
+        self.sections = sections
+        self.skip_fields = skip_fields
+        self.lazy = lazy
+        self.chunk_size = chunk_size
+        self.rest: dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        with _open(self.source) as f:
+            reader = _JsonReader(f, self.chunk_size)
+            reader.expect('{')
+            if not reader.consume('}'):
+                while True:
+                    yield from self.__read_member(reader)
+                    if reader.consume('}'):
+                        break
+                    reader.expect(',')
+            reader.expect_end()
+
+    def __read_member(self, reader: _JsonReader) -> Iterator[tuple[str, Any]]:
+        key = reader.value()
+        reader.expect(':')
+        if self.sections is not None and key not in self.sections:
+            reader.skip()
+            return
+        section_type = _SECTIONS.get(key)
+        if section_type is None or not reader.consume('['):
+            self.rest[key] = reader.value()
+            return
+        if reader.consume(']'):
+            return
+        read: Callable[[_JsonReader], Any] = self.__read_pruned if self.skip_fields and key in _SKIP_FIELDS_OF \
+            else _JsonReader.value
+        make = LazyComponent if self.lazy and section_type is Component \
+            else section_type.from_json  # type:ignore[attr-defined]
+        while True:
+            yield key, make(read(reader))
+            if reader.consume(']'):
+                return
+            reader.expect(',')
+
+    def __read_pruned(self, reader: _JsonReader) -> Any:
+        """Read a component or service - skipping the unwanted fields of it and its nested components/services."""
+        if not reader.consume('{'):
+            return reader.value()
+        data: dict[str, Any] = {}
+        if reader.consume('}'):
+            return data
+        while True:
+            key = reader.value()
+            reader.expect(':')
+            if key in self.skip_fields:
+                reader.skip()
+            elif key in _SKIP_FIELDS_OF and reader.consume('['):
+                data[key] = self.__read_pruned_array(reader)
+            else:
+                data[key] = reader.value()
+            if reader.consume('}'):
+                return data
+            reader.expect(',')
+
+    def __read_pruned_array(self, reader: _JsonReader) -> list[Any]:
+        """Read the rest of an array of components or services, after its opening bracket."""
+        items: list[Any] = []
+        if reader.consume(']'):
+            return items
+        while True:
+            items.append(self.__read_pruned(reader))
+            if reader.consume(']'):
+                return items
+            reader.expect(',')
+
+
+def iter_json(source: Source, *,
+              sections: Optional[Container[str]] = None, skip_fields: Container[str] = (),
+              lazy: bool = False) -> Iterator[Item]:
+    """Read the components, services, dependencies and vulnerabilities of a CycloneDX JSON document, one by one.
+
+    Items are yielded in order of the document, as soon as they were read completely.
+    Only the top-level items are yielded; nested components/services are part of their parent.
+    Processed parts of the document are discarded, so that memory usage is bounded by the largest item -
+    not by the size of the document.
+
+    :param source: path of a file, or a binary stream
+    :param sections: names of the sections to read, like ``components`` - all, if omitted
+    :param skip_fields: names of the fields of components and services to skip, like ``evidence``
+    :param lazy: whether to yield components as :class:`LazyComponent`
+    :return: iterator of :class:`Component`, :class:`Service`, :class:`Dependency` and :class:`Vulnerability`
+    """
+    for _, item in _JsonStream(source, sections, skip_fields, lazy):
+        yield item
+
+
+def load_json(source: Source, *,
+              sections: Optional[Container[str]] = None, skip_fields: Container[str] = (),
+              lazy: bool = False) -> Bom:
+    """Read a CycloneDX JSON document incrementally.
+
+    Results equal :meth:`Bom.from_json()`, but the document is never fully parsed into memory:
+    the components, services, dependencies and vulnerabilities are read one by one - see :func:`iter_json()`.
+
+    Parts of the document that are not needed can be skipped, which saves the cost of their deserialization.
+    Skipped sections are left empty; a skipped ``metadata`` is replaced by the default one.
+
+    :param source: path of a file, or a binary stream
+    :param sections: names of the sections to read, like ``metadata`` or ``dependencies`` - all, if omitted
+    :param skip_fields: names of the fields of components and services to skip, like ``evidence`` or ``pedigree``
+    :param lazy: whether to read the components as :class:`LazyComponent` - which is cheap for read-mostly jobs,
+                 like lookups by name or purl
+    :return: the Bom
+    """
+    stream = _JsonStream(source, sections, skip_fields, lazy)
+    items = list(stream)
+    return _populate(Bom.from_json(stream.rest), items)  # type:ignore[attr-defined]
@@ -0,0 +1,144 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Incremental reading of CycloneDX XML documents."""
+
+__all__ = ['iter_xml', 'load_xml']
+
+from collections.abc import Container, Iterator
+from typing import Any, Optional
+from xml.etree.ElementTree import Element, iterparse  # nosec B405
+
+from ..model.bom import Bom
+from . import _SECTIONS, Item, Source, _open, _populate
+
+_SKIP_FIELDS_OF = ('component', 'service')
+
+
+class _XmlStream:
+    """Reads the items of the sections of a document, element by element.
+
+    Each item is materialized as soon as its element closes; the element is dropped afterwards.
+    Unwanted sections and fields are dropped as soon as they close, without being materialized.
+    Everything else remains in :attr:`root`, for later deserialization of the rest of the document.
+    """
+
+    def __init__(self, source: Source,
+                 sections: Optional[Container[str]] = None, skip_fields: Container[str] = ()) -> None:
+        self.source = source
+        self.sections = sections
+        self.skip_fields = skip_fields
+        self.root: Optional[Element] = None
+        self.namespace = ''
+        self.__section_name = ''
+        self.__section_wanted = True
+        self.__section_type: Optional[type] = None
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        stack: list[Element] = []
+        with _open(self.source) as f:
+            for event, elem in iterparse(f, events=('start', 'end')):  # nosec B314
+                if event == 'start':
+                    stack.append(elem)
+                    self.__start(len(stack), elem)
+                    continue
+                stack.pop()
+                item = self.__end(stack, elem)
+                if item is not None:
+                    yield item
+
+    def __start(self, depth: int, elem: Element) -> None:
+        if depth == 1:
+            self.__set_root(elem)
+        elif depth == 2:
+            self.__section_name = self.__local_name(elem.tag)
+            self.__section_wanted = self.sections is None or self.__section_name in self.sections
+            self.__section_type = _SECTIONS.get(self.__section_name) if self.__section_wanted else None
+
+    def __end(self, stack: list[Element], elem: Element) -> Optional[tuple[str, Any]]:
+        depth = len(stack)
+        item = None
+        if depth == 2:
+            if self.__section_type is not None:
+                item = self.__section_name, self.__section_type.from_xml(  # type:ignore[attr-defined]
+                    elem, self.namespace)
+            if self.__section_type is not None or not self.__section_wanted:
+                # is the first child, as previous ones were removed already. so this is cheap.
+                self.__drop(stack[-1], elem)
+        elif depth > 2:
+            if self.__section_type is not None and self.__is_skipped_field(stack[-1], elem):
+                self.__drop(stack[-1], elem)
+        elif depth == 1 and not self.__section_wanted:
+            self.__drop(stack[-1], elem)
+        return item
+
+    def __set_root(self, root: Element) -> None:
+        self.root = root
+        if root.tag.startswith('{'):
+            self.namespace = root.tag[1:root.tag.index('}')]
+
+    def __local_name(self, tag: str) -> str:
+        return tag[len(self.namespace) + 2:] if self.namespace else tag
+
+    def __is_skipped_field(self, parent: Element, elem: Element) -> bool:
+        return (self.__local_name(elem.tag) in self.skip_fields
+                and self.__local_name(parent.tag) in _SKIP_FIELDS_OF)
+
+    @staticmethod
+    def __drop(parent: Element, elem: Element) -> None:
+        elem.clear()
+        parent.remove(elem)
+
+
+def iter_xml(source: Source, *,
+             sections: Optional[Container[str]] = None, skip_fields: Container[str] = ()) -> Iterator[Item]:
+    """Read the components, services, dependencies and vulnerabilities of a CycloneDX XML document, one by one.
+
+    Items are yielded in order of the document, as soon as they were read completely.
+    Only the top-level items are yielded; nested components/services are part of their parent.
+    Processed parts of the document are discarded, so that memory usage is bounded by the largest item
+    and the parser's read-ahead - not by the size of the document.
+
+    :param source: path of a file, or a binary stream
+    :param sections: names of the sections to read, like ``components`` - all, if omitted
+    :param skip_fields: names of the fields of components and services to skip, like ``evidence``
+    :return: iterator of :class:`Component`, :class:`Service`, :class:`Dependency` and :class:`Vulnerability`
+    """
+    for _, item in _XmlStream(source, sections, skip_fields):
+        yield item
+
+
+def load_xml(source: Source, *,
+             sections: Optional[Container[str]] = None, skip_fields: Container[str] = ()) -> Bom:
+    """Read a CycloneDX XML document incrementally.
+
+    Results equal :meth:`Bom.from_xml()`, but the document is never fully parsed into memory:
+    the components, services, dependencies and vulnerabilities are read one by one - see :func:`iter_xml()`.
+
+    Parts of the document that are not needed can be skipped, which saves the cost of their deserialization.
+    Skipped sections are left empty; a skipped ``metadata`` is replaced by the default one.
+
+    :param source: path of a file, or a binary stream
+    :param sections: names of the sections to read, like ``metadata`` or ``dependencies`` - all, if omitted
+    :param skip_fields: names of the fields of components and services to skip, like ``evidence`` or ``pedigree``
+    :return: the Bom
+    """
+    stream = _XmlStream(source, sections, skip_fields)
+    items = list(stream)
+    if stream.root is None:  # pragma: no cover
+        raise ValueError('Empty document')
+    return _populate(Bom.from_xml(stream.root, stream.namespace), items)  # type:ignore[attr-defined]
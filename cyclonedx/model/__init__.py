@@ -23,27 +23,23 @@ from a `cyclonedx.parser.BaseParser` implementation.
 """
 
 import re
-import sys
 from collections.abc import Generator, Iterable
 from datetime import datetime
 from enum import Enum
 from functools import reduce
-from json import loads as json_loads
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from urllib.parse import quote as url_quote
 from uuid import UUID
 from warnings import warn
 from xml.etree.ElementTree import Element as XmlElement  # nosec B405
 
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
 import py_serializable as serializable
 from sortedcontainers import SortedSet
 
-from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.compare import ComparableTuple as _ComparableTuple, cached_comparison as _cached_comparison
+from .._internal.deprecation import deprecated
+from .._internal.json import normalize as _json_normalize
+from .._internal.slots import SlotsDict as _SlotsDict
 from ..exception.model import InvalidLocaleTypeException, InvalidUriException
 from ..exception.serialization import CycloneDxDeserializationException, SerializationOfUnexpectedValueException
 from ..schema.schema import (
@@ -58,9 +54,38 @@ from ..schema.schema import (
 )
 from .bom_ref import BomRef
 
+if TYPE_CHECKING:  # pragma: no cover
+    from contextlib import AbstractContextManager
+
 _BOM_LINK_PREFIX = 'urn:cdx:'
 
 
+def cached_comparison() -> 'AbstractContextManager[None]':
+    """
+    Context manager that enables caching of the comparison keys of
+    :class:`cyclonedx.model.component.Component`, :class:`cyclonedx.model.service.Service`
+    and :class:`cyclonedx.model.vulnerability.Vulnerability`.
+
+    Equality, ordering and hashes of these objects are derived from all of their properties, recursively.
+    While in this context, each instance memoizes its comparison key and hash, which makes sorting and
+    de-duplicating large sets of components significantly cheaper.
+
+    Any property assignment on one of these objects, or on a :class:`cyclonedx.model.bom_ref.BomRef`, invalidates
+    all cached keys - and so does any in-place modification of their collections, like ``component.hashes.add(...)``.
+    Only such observed values are cached; other nested objects - like a component's supplier - are compared
+    as they are. So modifying them in place - like the name of a supplier - is reflected, too.
+
+    Caching is enabled for the current thread or asynchronous task only - see :mod:`contextvars`.
+    Modifications made by other threads, while in this context, are not observed either.
+
+    Example::
+
+        with cached_comparison():
+            components = SortedSet(many_components)
+    """
+    return _cached_comparison()
+
+
 @serializable.serializable_enum
 class DataFlow(str, Enum):
     """
@@ -333,10 +358,8 @@ class _HashTypeRepositorySerializationHelper(serializable.helpers.BaseHelper):
                        **__: Any) -> list[Any]:
         assert view is not None
         return [
-            json_loads(
-                ht.as_json(  # type:ignore[attr-defined]
-                    view_=view)
-            ) for ht in cls.__prep(o, view)
+            _json_normalize(ht, view)
+            for ht in cls.__prep(o, view)
         ]
 
     @classmethod
@@ -373,7 +396,7 @@ class _HashTypeRepositorySerializationHelper(serializable.helpers.BaseHelper):
 
 
 @serializable.serializable_class
-class HashType:
+class HashType(_SlotsDict):
     """
     This is our internal representation of the hashType complex type within the CycloneDX standard.
 
@@ -381,6 +404,8 @@ class HashType:
         See the CycloneDX Schema for hashType: https://cyclonedx.org/docs/1.7/xml/#type_hashType
     """
 
+    __slots__ = ('_alg', '_content')
+
     @staticmethod
     @deprecated('Deprecated - use cyclonedx.contrib.hash.factories.HashTypeFactory().from_hashlib_alg() instead')
     def from_hashlib_alg(hashlib_alg: str, content: str) -> 'HashType':
@@ -623,7 +648,7 @@ class _ExternalReferenceSerializationHelper(serializable.helpers.BaseHelper):
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class XsUri(serializable.helpers.BaseHelper):
+class XsUri(_SlotsDict, serializable.helpers.BaseHelper):
     """
     Helper class that allows us to perform validation on data strings that are defined as xs:anyURI
     in CycloneDX schema.
@@ -635,6 +660,8 @@ class XsUri(serializable.helpers.BaseHelper):
         See JSON Schema definition for iri-reference: https://tools.ietf.org/html/rfc3987
     """
 
+    __slots__ = ('_uri',)
+
     _INVALID_URI_REGEX = re.compile(r'%(?![0-9A-F]{2})|#.*#', re.IGNORECASE + re.MULTILINE)
 
     __SPEC_REPLACEMENTS = (
@@ -749,7 +776,7 @@ class XsUri(serializable.helpers.BaseHelper):
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class ExternalReference:
+class ExternalReference(_SlotsDict):
     """
     This is our internal representation of an ExternalReference complex type that can be used in multiple places within
     a CycloneDX BOM document.
@@ -758,6 +785,8 @@ class ExternalReference:
         See the CycloneDX Schema definition: https://cyclonedx.org/docs/1.7/xml/#type_externalReference
     """
 
+    __slots__ = ('_url', '_comment', '_type', '_hashes', '_properties')
+
     def __init__(
         self, *,
         type: ExternalReferenceType,
@@ -881,7 +910,7 @@ class ExternalReference:
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class Property:
+class Property(_SlotsDict):
     """
     This is our internal representation of `propertyType` complex type that can be used in multiple places within
     a CycloneDX BOM document.
@@ -892,6 +921,8 @@ class Property:
     Specifies an individual property with a name and value.
     """
 
+    __slots__ = ('_name', '_value')
+
     def __init__(
         self, *,
         name: str,
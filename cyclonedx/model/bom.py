@@ -16,18 +16,20 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-from collections.abc import Generator, Iterable
+from collections.abc import Collection, Generator, Iterable
 from datetime import datetime
 from enum import Enum
 from itertools import chain
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from uuid import UUID, uuid4
 from warnings import warn
 
 import py_serializable as serializable
 from sortedcontainers import SortedSet
 
+from .._internal import bom_index as _bom_index
 from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
 from .._internal.time import get_now_utc as _get_now_utc
 from ..exception.model import LicenseExpressionAlongWithOthersException, UnknownComponentDependencyException
 from ..schema.deprecation import SchemaDeprecationWarning1Dot6
@@ -57,6 +59,8 @@ from .vulnerability import Vulnerability
 if TYPE_CHECKING:  # pragma: no cover
     from packageurl import PackageURL
 
+    from ..input import Source
+
 
 @serializable.serializable_enum
 class TlpClassification(str, Enum):
@@ -418,6 +422,19 @@ class BomMetaData:
         return f'<BomMetaData timestamp={self.timestamp}, component={self.component}>'
 
 
+class _DependencyRefProbe:
+    """Sorts right before all :class:`Dependency` with the given ref - for bisecting them by ref."""
+
+    __slots__ = ('_key',)
+
+    def __init__(self, ref: BomRef) -> None:
+        # like :meth:`BomRef.__lt__` does
+        self._key = str(ref)
+
+    def __gt__(self, other: Any) -> bool:
+        return str(other.ref) < self._key
+
+
 @serializable.serializable_class(
     ignore_during_deserialization={
         '$schema', 'bom_format', 'spec_version',  # JSON-implementation's format hints
@@ -461,6 +478,17 @@ class Bom:
         self.dependencies = dependencies or []
         self.properties = properties or []
         self.definitions = definitions or Definitions()
+        self.__lookup_index: Optional[_bom_index.BomLookupIndex] = None
+
+    @staticmethod
+    def from_file(source: 'Source', **kwargs: Any) -> 'Bom':
+        """
+        Read a CycloneDX document from a file - in whatever format and schema version it is.
+
+        See :func:`cyclonedx.input.load()`.
+        """
+        from ..input import load
+        return load(source, **kwargs)
 
     @property
     @serializable.type_mapping(UrnUuidHelper)
@@ -535,7 +563,7 @@ class Bom:
 
     @components.setter
     def components(self, components: Iterable[Component]) -> None:
-        self._components = SortedSet(components)
+        self._components = _ObservedSortedSet.replacing(getattr(self, '_components', None), components)
 
     @property
     @serializable.view(SchemaVersion1Dot2)
@@ -557,7 +585,7 @@ class Bom:
 
     @services.setter
     def services(self, services: Iterable[Service]) -> None:
-        self._services = SortedSet(services)
+        self._services = _ObservedSortedSet.replacing(getattr(self, '_services', None), services)
 
     @property
     @serializable.view(SchemaVersion1Dot1)
@@ -597,6 +625,33 @@ class Bom:
     @dependencies.setter
     def dependencies(self, dependencies: Iterable[Dependency]) -> None:
         self._dependencies = SortedSet(dependencies)
+        # the value of `BomRef._value_changes`, as of which the order of the dependencies is known to be intact
+        self.__dependencies_sorted_as_of = BomRef._value_changes
+
+    def __find_dependency(self, ref: BomRef) -> Optional[Dependency]:
+        """The first of :attr:`dependencies` with the given ref - like a linear search would find.
+
+        The sorted dependencies are bisected by the ref's value, as long as their order is intact.
+        Changes of any `bom-ref` value might break the order. So it is checked again after such changes;
+        while it is broken, the dependencies are searched linearly.
+        """
+        dependencies = self._dependencies
+        if self.__dependencies_sorted_as_of != BomRef._value_changes:
+            changes = BomRef._value_changes
+            if any(str(d.ref) > str(n.ref) for d, n in zip(dependencies, dependencies.islice(1))):
+                return next((d for d in dependencies if d.ref == ref), None)
+            self.__dependencies_sorted_as_of = changes
+        return next((d for d in self.__equally_sorted_dependencies(ref) if d.ref == ref), None)
+
+    def __equally_sorted_dependencies(self, ref: BomRef) -> Iterable[Dependency]:
+        """The dependencies that sort like the ref - via bisection, as long as their order is intact."""
+        dependencies = self._dependencies
+        lo = dependencies.bisect_left(_DependencyRefProbe(ref))
+        key = str(ref)
+        for dependency in dependencies.islice(lo):
+            if str(dependency.ref) != key:
+                return
+            yield dependency
 
     # @property
     # ...
@@ -714,6 +769,159 @@ class Bom:
 
         return None
 
+    def build_lookup_index(self) -> None:
+        """
+        Build the lookup index, to speed up subsequent lookups.
+
+        The lookup index is used by :meth:`get_component_by_bom_ref()`, :meth:`get_components_by_purl()`,
+        :meth:`get_components_by_name()`, :meth:`get_components_by_cpe()`, :meth:`get_service_by_bom_ref()`
+        and :meth:`get_services_by_name()`. Without it, they search all components or services linearly.
+
+        The index is dropped on any change of the collections of components and services, including nested ones,
+        and when the component of :attr:`metadata` is replaced. Build it again after such changes are done.
+        Hits of the index are verified, and in case of a miss or an outdated hit, a linear search is done instead.
+        Still, a changed looked-up property - like the `bom_ref`, `purl`, `name` or `cpe` of a component -
+        is not reflected by the index, if other hits remain. Call :meth:`invalidate_lookup_index()` after such changes.
+        """
+        self.__lookup_index = _bom_index.BomLookupIndex(self.metadata.component, self.components, self.services)
+
+    def invalidate_lookup_index(self) -> None:
+        """
+        Drop the lookup index - see :meth:`build_lookup_index()`.
+        """
+        self.__lookup_index = None
+
+    def __get_lookup_index(self) -> Optional[_bom_index.BomLookupIndex]:
+        index = self.__lookup_index
+        if index is not None and (index.stale or index.metadata_component is not self.metadata.component):
+            index = self.__lookup_index = None
+        return index
+
+    def __lookup_components(self, key: '_bom_index.Key[Component]', value: str) -> list[Component]:
+        index = self.__get_lookup_index()
+        metadata_component = self.metadata.component
+        return _bom_index.lookup(
+            None if index is None else index.component_tables, key, value,
+            lambda: _bom_index.iter_components(
+                chain((metadata_component,) if metadata_component else (), self.components)))
+
+    def __lookup_services(self, key: '_bom_index.Key[Service]', value: str) -> list[Service]:
+        index = self.__get_lookup_index()
+        return _bom_index.lookup(
+            None if index is None else index.service_tables, key, value,
+            lambda: _bom_index.iter_services(self.services))
+
+    def get_component_by_bom_ref(self, bom_ref: Union[BomRef, str]) -> Optional[Component]:
+        """
+        Get a Component in the Bom by its bom-ref - including the component of :attr:`metadata` and nested components.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            bom_ref:
+                The `BomRef` or its value to look for.
+
+        Returns:
+            The first matching `Component` or `None`
+        """
+        value = bom_ref.value if isinstance(bom_ref, BomRef) else bom_ref
+        if not value:
+            return None
+        found = self.__lookup_components(_bom_index.component_bom_ref, value)
+        return found[0] if found else None
+
+    def get_components_by_purl(self, purl: 'PackageURL') -> tuple[Component, ...]:
+        """
+        Get all Components in the Bom that have the given PURL - including the component of :attr:`metadata`
+        and nested components.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            purl:
+                An instance of `packageurl.PackageURL` to look for.
+
+        Returns:
+            Matching `Component`s, in order of occurrence
+        """
+        return tuple(self.__lookup_components(_bom_index.component_purl, purl.to_string()))
+
+    def get_components_by_name(self, name: str, version: Optional[str] = None) -> tuple[Component, ...]:
+        """
+        Get all Components in the Bom that have the given name - including the component of :attr:`metadata`
+        and nested components.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            name:
+                The name to look for.
+            version:
+                If given, only components of this version are returned.
+
+        Returns:
+            Matching `Component`s, in order of occurrence
+        """
+        found = self.__lookup_components(_bom_index.component_name, name)
+        if version is not None:
+            return tuple(c for c in found if c.version == version)
+        return tuple(found)
+
+    def get_components_by_cpe(self, cpe: str) -> tuple[Component, ...]:
+        """
+        Get all Components in the Bom that have the given CPE - including the component of :attr:`metadata`
+        and nested components.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            cpe:
+                The CPE to look for.
+
+        Returns:
+            Matching `Component`s, in order of occurrence
+        """
+        return tuple(self.__lookup_components(_bom_index.component_cpe, cpe))
+
+    def get_service_by_bom_ref(self, bom_ref: Union[BomRef, str]) -> Optional[Service]:
+        """
+        Get a Service in the Bom by its bom-ref - including nested services.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            bom_ref:
+                The `BomRef` or its value to look for.
+
+        Returns:
+            The first matching `Service` or `None`
+        """
+        value = bom_ref.value if isinstance(bom_ref, BomRef) else bom_ref
+        if not value:
+            return None
+        found = self.__lookup_services(_bom_index.service_bom_ref, value)
+        return found[0] if found else None
+
+    def get_services_by_name(self, name: str, version: Optional[str] = None) -> tuple[Service, ...]:
+        """
+        Get all Services in the Bom that have the given name - including nested services.
+
+        Uses the lookup index, if built - see :meth:`build_lookup_index()`.
+
+        Args:
+            name:
+                The name to look for.
+            version:
+                If given, only services of this version are returned.
+
+        Returns:
+            Matching `Service`s, in order of occurrence
+        """
+        found = self.__lookup_services(_bom_index.service_name, name)
+        if version is not None:
+            return tuple(s for s in found if s.version == version)
+        return tuple(found)
+
     def get_urn_uuid(self) -> str:
         """
         Get the unique reference for this Bom.
@@ -779,22 +987,23 @@ class Bom:
         return bool(self.vulnerabilities)
 
     def register_dependency(self, target: Dependable, depends_on: Optional[Iterable[Dependable]] = None) -> None:
-        _d = next(filter(lambda _d: _d.ref == target.bom_ref, self.dependencies), None)
-        if _d:
+        depends_on = tuple(depends_on) if depends_on else ()
+        _d = self.__find_dependency(target.bom_ref)
+        if _d is not None:
             # Dependency Target already registered - but it might have new dependencies to add
             if depends_on:
                 _d.dependencies.update(map(lambda _d: Dependency(ref=_d.bom_ref), depends_on))
         else:
             # First time we are seeing this target as a Dependency
-            self._dependencies.add(Dependency(
+            _d = Dependency(
                 ref=target.bom_ref,
-                dependencies=map(lambda _dep: Dependency(ref=_dep.bom_ref), depends_on) if depends_on else []
-            ))
+                dependencies=map(lambda _dep: Dependency(ref=_dep.bom_ref), depends_on)
+            )
+            self._dependencies.add(_d)
 
-        if depends_on:
-            # Ensure dependents are registered with no further dependents in the DependencyGraph
-            for _d2 in depends_on:
-                self.register_dependency(target=_d2, depends_on=None)
+        # Ensure dependents are registered with no further dependents in the DependencyGraph
+        for _d2 in depends_on:
+            self.register_dependency(target=_d2, depends_on=None)
 
     def urn(self) -> str:
         """
@@ -817,19 +1026,25 @@ class Bom:
         """
         # !! deprecated function. have this as an part of the normalization process, like the BomRefDiscrimator
         # 0. Make sure all Dependable have a Dependency entry
+        for _d in self._get_dependables():
+            self.register_dependency(target=_d)
+        return self._validate(self.dependencies)
+
+    def _get_dependables(self) -> Generator[Dependable, None, None]:
+        """The items that :meth:`validate()` ensures a Dependency entry for."""
         if self.metadata.component:
-            self.register_dependency(target=self.metadata.component)
-        for _c in self.components:
-            self.register_dependency(target=_c)
-        for _s in self.services:
-            self.register_dependency(target=_s)
+            yield self.metadata.component
+        yield from self.components
+        yield from self.services
 
+    def _validate(self, dependencies: Collection[Dependency]) -> bool:
+        """The checks of :meth:`validate()` - against the given dependencies, instead of :attr:`dependencies`."""
         # 1. Make sure dependencies are all in this Bom.
         component_bom_refs = set(map(lambda c: c.bom_ref, self._get_all_components())) | set(
             map(lambda s: s.bom_ref, self.services))
         dependency_bom_refs = set(chain(
-            (d.ref for d in self.dependencies),
-            chain.from_iterable(d.dependencies_as_bom_refs() for d in self.dependencies)
+            (d.ref for d in dependencies),
+            chain.from_iterable(d.dependencies_as_bom_refs() for d in dependencies)
         ))
         dependency_diff = dependency_bom_refs - component_bom_refs
         if len(dependency_diff) > 0:
@@ -841,7 +1056,7 @@ class Bom:
         # this BOM is describing
         if self.metadata.component and len(self.components) > 0 and not any(map(
             lambda d: d.ref == self.metadata.component.bom_ref and len(d.dependencies) > 0,  # type:ignore[union-attr]
-            self.dependencies
+            dependencies
         )):
             warn(
                 f'The Component this BOM is describing {self.metadata.component.purl} has no defined dependencies '
@@ -16,10 +16,13 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 import py_serializable as serializable
 
+from .._internal.observe import bump_generation as _bump_generation
+from .._internal.ref_substitution import serialized_value as _serialized_value
+from .._internal.slots import SlotsDict as _SlotsDict
 from ..exception.serialization import CycloneDxDeserializationException, SerializationOfUnexpectedValueException
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -29,7 +32,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class BomRef(serializable.helpers.BaseHelper):
+class BomRef(_SlotsDict, serializable.helpers.BaseHelper):
     """
     An identifier that can be used to reference objects elsewhere in the BOM.
 
@@ -39,8 +42,14 @@ class BomRef(serializable.helpers.BaseHelper):
         See https://github.com/CycloneDX/cyclonedx-php-library/blob/master/docs/dev/decisions/BomDependencyDataModel.md
     """
 
+    __slots__ = ('_value',)
+
+    # counts the changes of the values of all BomRefs - so that orders by value can be told to be outdated
+    _value_changes: ClassVar[int] = 0
+
     def __init__(self, value: Optional[str] = None) -> None:
-        self.value = value
+        # not via the setter - initializing is not a change
+        self._value = value or None
 
     @property
     @serializable.json_name('.')
@@ -52,6 +61,9 @@ class BomRef(serializable.helpers.BaseHelper):
     def value(self, value: Optional[str]) -> None:
         # empty strings become `None`
         self._value = value or None
+        # values are part of the cached comparison keys of the objects that carry them, and of sorted sets
+        BomRef._value_changes += 1
+        _bump_generation()
 
     def __eq__(self, other: object) -> bool:
         return (self is other) or (
@@ -85,7 +97,7 @@ class BomRef(serializable.helpers.BaseHelper):
     @classmethod
     def serialize(cls, o: Any) -> Optional[str]:
         if isinstance(o, cls):
-            return o.value
+            return _serialized_value(o)
         raise SerializationOfUnexpectedValueException(
             f'Attempt to serialize a non-BomRef: {o!r}')
 
@@ -16,24 +16,25 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 import re
-import sys
 from collections.abc import Iterable
 from enum import Enum
 from typing import Any, Optional, Union
 from warnings import warn
 
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
 # See https://github.com/package-url/packageurl-python/issues/65
 import py_serializable as serializable
 from packageurl import PackageURL
 from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
-from .._internal.compare import ComparablePackageURL as _ComparablePackageURL, ComparableTuple as _ComparableTuple
+from .._internal.compare import (
+    CachedComparable as _CachedComparable,
+    ComparablePackageURL as _ComparablePackageURL,
+    ComparableTuple as _ComparableTuple,
+)
+from .._internal.deprecation import deprecated
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
+from .._internal.slots import SlotsDict as _SlotsDict
 from ..exception.model import InvalidOmniBorIdException, InvalidSwhidException
 from ..exception.serialization import (
     CycloneDxDeserializationException,
@@ -951,7 +952,7 @@ class Swhid(serializable.helpers.BaseHelper):
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class Component(Dependable):
+class Component(_CachedComparable, Dependable, _SlotsDict):
     """
     This is our internal representation of a Component within a Bom.
 
@@ -959,6 +960,13 @@ class Component(Dependable):
         See the CycloneDX Schema definition: https://cyclonedx.org/docs/1.7/xml/#type_component
     """
 
+    __slots__ = (
+        '_type', '_mime_type', '_bom_ref', '_supplier', '_manufacturer', '_authors', '_publisher', '_group', '_name',
+        '_description', '_scope', '_is_external', '_hashes', '_licenses', '_copyright', '_cpe', '_purl', '_omnibor_ids',
+        '_swhids', '_swid', '_pedigree', '_external_references', '_properties', '_components', '_evidence',
+        '_release_notes', '_crypto_properties', '_tags', '_author', '_modified', '_version',
+    )
+
     @staticmethod
     @deprecated('Deprecated - use cyclonedx.contrib.component.builders.ComponentBuilder().make_for_file() instead')
     def for_file(absolute_file_path: str, path_for_bom: Optional[str]) -> 'Component':
@@ -1064,6 +1072,7 @@ class Component(Dependable):
     @type.setter
     def type(self, type: ComponentType) -> None:
         self._type = type
+        self.changed()
 
     @property
     @serializable.xml_string(serializable.XmlStringSerializationType.TOKEN)
@@ -1083,6 +1092,7 @@ class Component(Dependable):
     @mime_type.setter
     def mime_type(self, mime_type: Optional[str]) -> None:
         self._mime_type = mime_type
+        self.changed()
 
     @property
     @serializable.json_name('bom-ref')
@@ -1127,6 +1137,7 @@ class Component(Dependable):
     @supplier.setter
     def supplier(self, supplier: Optional[OrganizationalEntity]) -> None:
         self._supplier = supplier
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot6)
@@ -1146,6 +1157,7 @@ class Component(Dependable):
     @manufacturer.setter
     def manufacturer(self, manufacturer: Optional[OrganizationalEntity]) -> None:
         self._manufacturer = manufacturer
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot6)
@@ -1165,7 +1177,8 @@ class Component(Dependable):
 
     @authors.setter
     def authors(self, authors: Iterable[OrganizationalContact]) -> None:
-        self._authors = SortedSet(authors)
+        self._authors = _ObservedSortedSet(authors)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot2)
@@ -1190,6 +1203,7 @@ class Component(Dependable):
         if author is not None:
             SchemaDeprecationWarning1Dot6._warn('@.author', '@.authors` or `@.manufacturer')
         self._author = author
+        self.changed()
 
     @property
     @serializable.xml_sequence(5)
@@ -1206,6 +1220,7 @@ class Component(Dependable):
     @publisher.setter
     def publisher(self, publisher: Optional[str]) -> None:
         self._publisher = publisher
+        self.changed()
 
     @property
     @serializable.xml_sequence(6)
@@ -1226,6 +1241,7 @@ class Component(Dependable):
     @group.setter
     def group(self, group: Optional[str]) -> None:
         self._group = group
+        self.changed()
 
     @property
     @serializable.xml_sequence(7)
@@ -1246,6 +1262,7 @@ class Component(Dependable):
     @name.setter
     def name(self, name: str) -> None:
         self._name = name
+        self.changed()
 
     @property
     @serializable.include_none(SchemaVersion1Dot0, '')
@@ -1271,6 +1288,7 @@ class Component(Dependable):
         if version and len(version) > 1024:
             warn('`@.version`has a maximum length of 1024 from CycloneDX v1.6 onwards.', UserWarning)
         self._version = version
+        self.changed()
 
     @property
     @serializable.xml_sequence(9)
@@ -1287,6 +1305,7 @@ class Component(Dependable):
     @description.setter
     def description(self, description: Optional[str]) -> None:
         self._description = description
+        self.changed()
 
     @property
     @serializable.type_mapping(_ComponentScopeSerializationHelper)
@@ -1305,6 +1324,7 @@ class Component(Dependable):
     @scope.setter
     def scope(self, scope: Optional[ComponentScope]) -> None:
         self._scope = scope
+        self.changed()
 
     @property
     @serializable.json_name('isExternal')
@@ -1328,6 +1348,7 @@ class Component(Dependable):
     @is_external.setter
     def is_external(self, is_external: Optional[bool]) -> None:
         self._is_external = is_external
+        self.changed()
 
     @property
     @serializable.type_mapping(_HashTypeRepositorySerializationHelper)
@@ -1343,7 +1364,8 @@ class Component(Dependable):
 
     @hashes.setter
     def hashes(self, hashes: Iterable[HashType]) -> None:
-        self._hashes = SortedSet(hashes)
+        self._hashes = _ObservedSortedSet(hashes)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot1)
@@ -1367,6 +1389,7 @@ class Component(Dependable):
     @licenses.setter
     def licenses(self, licenses: Iterable[License]) -> None:
         self._licenses = LicenseRepository(licenses)
+        self.changed()
 
     @property
     @serializable.xml_sequence(13)
@@ -1384,6 +1407,7 @@ class Component(Dependable):
     @copyright.setter
     def copyright(self, copyright: Optional[str]) -> None:
         self._copyright = copyright
+        self.changed()
 
     @property
     @serializable.xml_sequence(14)
@@ -1400,6 +1424,7 @@ class Component(Dependable):
     @cpe.setter
     def cpe(self, cpe: Optional[str]) -> None:
         self._cpe = cpe
+        self.changed()
 
     @property
     @serializable.type_mapping(PackageUrlSH)
@@ -1419,6 +1444,7 @@ class Component(Dependable):
     @purl.setter
     def purl(self, purl: Optional[PackageURL]) -> None:
         self._purl = purl
+        self.changed()
 
     @property
     @serializable.json_name('omniborId')
@@ -1439,7 +1465,8 @@ class Component(Dependable):
 
     @omnibor_ids.setter
     def omnibor_ids(self, omnibor_ids: Iterable[OmniborId]) -> None:
-        self._omnibor_ids = SortedSet(omnibor_ids)
+        self._omnibor_ids = _ObservedSortedSet(omnibor_ids)
+        self.changed()
 
     @property
     @serializable.json_name('swhid')
@@ -1460,7 +1487,8 @@ class Component(Dependable):
 
     @swhids.setter
     def swhids(self, swhids: Iterable[Swhid]) -> None:
-        self._swhids = SortedSet(swhids)
+        self._swhids = _ObservedSortedSet(swhids)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot2)
@@ -1482,6 +1510,7 @@ class Component(Dependable):
     @swid.setter
     def swid(self, swid: Optional[Swid]) -> None:
         self._swid = swid
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot0)  # todo: Deprecated in v1.3
@@ -1494,6 +1523,7 @@ class Component(Dependable):
         if modified:
             SchemaDeprecationWarning1Dot3._warn('@.modified', '@.pedigree')
         self._modified = modified
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot1)
@@ -1517,6 +1547,7 @@ class Component(Dependable):
     @pedigree.setter
     def pedigree(self, pedigree: Optional[Pedigree]) -> None:
         self._pedigree = pedigree
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot1)
@@ -1540,7 +1571,8 @@ class Component(Dependable):
 
     @external_references.setter
     def external_references(self, external_references: Iterable[ExternalReference]) -> None:
-        self._external_references = SortedSet(external_references)
+        self._external_references = _ObservedSortedSet(external_references)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot3)
@@ -1562,7 +1594,8 @@ class Component(Dependable):
 
     @properties.setter
     def properties(self, properties: Iterable[Property]) -> None:
-        self._properties = SortedSet(properties)
+        self._properties = _ObservedSortedSet(properties)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'component')
@@ -1580,7 +1613,8 @@ class Component(Dependable):
 
     @components.setter
     def components(self, components: Iterable['Component']) -> None:
-        self._components = SortedSet(components)
+        self._components = _ObservedSortedSet.replacing(getattr(self, '_components', None), components)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot3)
@@ -1602,6 +1636,7 @@ class Component(Dependable):
     @evidence.setter
     def evidence(self, evidence: Optional[ComponentEvidence]) -> None:
         self._evidence = evidence
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot4)
@@ -1621,6 +1656,7 @@ class Component(Dependable):
     @release_notes.setter
     def release_notes(self, release_notes: Optional[ReleaseNotes]) -> None:
         self._release_notes = release_notes
+        self.changed()
 
     # @property
     # ...
@@ -1664,6 +1700,7 @@ class Component(Dependable):
     @crypto_properties.setter
     def crypto_properties(self, crypto_properties: Optional[CryptoProperties]) -> None:
         self._crypto_properties = crypto_properties
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot6)
@@ -1682,7 +1719,8 @@ class Component(Dependable):
 
     @tags.setter
     def tags(self, tags: Iterable[str]) -> None:
-        self._tags = SortedSet(tags)
+        self._tags = _ObservedSortedSet(tags)
+        self.changed()
 
     def get_all_nested_components(self, include_self: bool = False) -> set['Component']:
         components = set()
@@ -1700,11 +1738,24 @@ class Component(Dependable):
         else:
             return f'https://pypi.org/project/{self.name}'
 
-    def __comparable_tuple(self) -> _ComparableTuple:
-        return _ComparableTuple((
+    def __comparable_key(self) -> tuple[Any, ...]:
+        return self._cached_comparable_key(self.__make_comparable_key)
+
+    def __make_comparable_key(self) -> tuple[Any, ...]:
+        # the identifying fields - they lead the comparable tuple and are the base of the hash.
+        # most components differ in these already, so that comparisons need not build the whole comparable tuple.
+        return (
             self.type, self.group, self.name, self.version,
             self.bom_ref.value,
             None if self.purl is None else _ComparablePackageURL(self.purl),
+        )
+
+    def __comparable_tuple(self) -> _ComparableTuple:
+        return self._cached_comparable_tuple(self.__make_comparable_tuple)
+
+    def __make_comparable_tuple(self) -> _ComparableTuple:
+        return _ComparableTuple((
+            *self.__comparable_key(),
             self.swid, self.cpe, _ComparableTuple(self.swhids),
             self.supplier, self.author, self.publisher,
             self.description,
@@ -1720,16 +1771,21 @@ class Component(Dependable):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Component):
-            return self.__comparable_tuple() == other.__comparable_tuple()
+            return self.__comparable_key() == other.__comparable_key() \
+                and self.__comparable_tuple() == other.__comparable_tuple()
         return False
 
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, Component):
+            key, other_key = self.__comparable_key(), other.__comparable_key()
+            if key != other_key:
+                return _ComparableTuple(key) < _ComparableTuple(other_key)
             return self.__comparable_tuple() < other.__comparable_tuple()
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.__comparable_tuple())
+        # equal components have equal keys - so hashing the key suffices, and is cheap
+        return self._cached_hash(self.__comparable_key)
 
     def __repr__(self) -> str:
         return f'<Component bom-ref={self.bom_ref!r}, group={self.group}, name={self.name}, ' \
@@ -19,7 +19,6 @@
 from collections.abc import Iterable
 from decimal import Decimal
 from enum import Enum
-from json import loads as json_loads
 from typing import Any, List, Optional, Union
 from warnings import warn
 from xml.etree.ElementTree import Element as XmlElement  # nosec B405
@@ -30,6 +29,7 @@ from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
 from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.json import normalize as _json_normalize
 from ..exception.model import InvalidConfidenceException, InvalidValueException
 from ..schema.schema import SchemaVersion1Dot5, SchemaVersion1Dot6, SchemaVersion1Dot7
 from . import Copyright
@@ -779,7 +779,7 @@ class _ComponentEvidenceSerializationHelper(serializable.helpers.BaseHelper):
     def json_normalize(cls, o: ComponentEvidence, *,
                        view: Optional[type[serializable.ViewType]],
                        **__: Any) -> dict[str, Any]:
-        data: dict[str, Any] = json_loads(o.as_json(view))  # type:ignore[attr-defined]
+        data: dict[str, Any] = _json_normalize(o, view)
         if view is SchemaVersion1Dot5:
             identities = data.get('identity', [])
             if identities:
@@ -24,6 +24,8 @@ import py_serializable as serializable
 from sortedcontainers import SortedSet
 
 from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.ref_substitution import serialized_value as _serialized_value
+from .._internal.slots import SlotsDict as _SlotsDict
 from ..exception.serialization import SerializationOfUnexpectedValueException
 from .bom_ref import BomRef
 
@@ -33,8 +35,8 @@ class _DependencyRepositorySerializationHelper(serializable.helpers.BaseHelper):
 
     @classmethod
     def serialize(cls, o: Any) -> list[str]:
-        if isinstance(o, (SortedSet, set)):
-            return [str(i.ref) for i in o]
+        if isinstance(o, (SortedSet, set, list)):
+            return [_serialized_value(i.ref) or '' for i in o]
         raise SerializationOfUnexpectedValueException(
             f'Attempt to serialize a non-DependencyRepository: {o!r}')
 
@@ -48,7 +50,7 @@ class _DependencyRepositorySerializationHelper(serializable.helpers.BaseHelper):
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class Dependency:
+class Dependency(_SlotsDict):
     """
     Models a Dependency within a BOM.
 
@@ -56,6 +58,8 @@ class Dependency:
         See https://cyclonedx.org/docs/1.7/xml/#type_dependencyType
     """
 
+    __slots__ = ('_ref', '_dependencies')
+
     def __init__(self, ref: BomRef, dependencies: Optional[Iterable['Dependency']] = None) -> None:
         self.ref = ref
         self.dependencies = dependencies or []
@@ -91,11 +95,15 @@ class Dependency:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Dependency):
-            return self.__comparable_tuple() == other.__comparable_tuple()
+            return self.ref == other.ref \
+                and self.__comparable_tuple() == other.__comparable_tuple()
         return False
 
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, Dependency):
+            # the ref leads the comparable tuple - so the dependencies need to be compared only for equal refs
+            if self.ref != other.ref:
+                return self.ref < other.ref
             return self.__comparable_tuple() < other.__comparable_tuple()
         return NotImplemented
 
@@ -111,6 +119,8 @@ class Dependable(ABC):
     Dependable objects can be part of the Dependency Graph
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def bom_ref(self) -> BomRef:
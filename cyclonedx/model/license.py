@@ -22,7 +22,6 @@ License related things
 
 from collections.abc import Iterable
 from enum import Enum
-from json import loads as json_loads
 from typing import TYPE_CHECKING, Any, Optional, Union
 from warnings import warn
 from xml.etree.ElementTree import Element  # nosec B405
@@ -32,6 +31,9 @@ from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
 from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.json import normalize as _json_normalize
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
+from .._internal.slots import SlotsDict as _SlotsDict
 from ..exception.model import MutuallyExclusivePropertiesException
 from ..exception.serialization import CycloneDxDeserializationException
 from ..schema import SchemaVersion
@@ -72,7 +74,7 @@ LicenseExpressionAcknowledgement = LicenseAcknowledgement
     name='license',
     ignore_unknown_during_deserialization=True
 )
-class DisjunctiveLicense:
+class DisjunctiveLicense(_SlotsDict):
     """
     This is our internal representation of `licenseType` complex type that can be used in multiple places within
     a CycloneDX BOM document.
@@ -81,6 +83,8 @@ class DisjunctiveLicense:
         See the CycloneDX Schema definition: https://cyclonedx.org/docs/1.7/xml/#type_licenseType
     """
 
+    __slots__ = ('_bom_ref', '_id', '_name', '_text', '_url', '_acknowledgement', '_properties')
+
     def __init__(
         self, *,
         bom_ref: Optional[Union[str, BomRef]] = None,
@@ -552,7 +556,7 @@ if TYPE_CHECKING:  # pragma: no cover
         """
 
 else:
-    class LicenseRepository(SortedSet):
+    class LicenseRepository(_ObservedSortedSet):
         """Collection of :class:`License`.
 
         This is a `set`, not a `list`.  Order MUST NOT matter here.
@@ -613,12 +617,9 @@ class _LicenseRepositorySerializationHelper(serializable.helpers.BaseHelper):
             # mixed license expression and license? this is an invalid constellation according to schema!
             # see https://github.com/CycloneDX/specification/pull/205
             # but models need to allow it for backwards compatibility with JSON CDX < 1.5
-            return [json_loads(expression.as_json(view_=view))]  # type:ignore[attr-defined]
+            return [_json_normalize(expression, view)]
         return [
-            {'license': json_loads(
-                li.as_json(  # type:ignore[attr-defined]
-                    view_=view)
-            )}
+            {'license': _json_normalize(li, view)}
             for li in o
             if isinstance(li, DisjunctiveLicense)
         ]
@@ -26,7 +26,6 @@
 """
 
 from enum import Enum
-from json import loads as json_loads
 from typing import TYPE_CHECKING, Any, Optional, Union
 from xml.etree.ElementTree import Element  # nosec B405
 
@@ -35,6 +34,7 @@ from py_serializable.helpers import BaseHelper
 from sortedcontainers import SortedSet
 
 from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.json import normalize as _json_normalize
 from ..exception.serialization import CycloneDxDeserializationException
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -198,8 +198,7 @@ class _LifecycleRepositoryHelper(BaseHelper):
                        **__: Any) -> Any:
         if len(o) == 0:
             return None
-        return [json_loads(li.as_json(  # type:ignore[union-attr]
-            view_=view)) for li in o]
+        return [_json_normalize(li, view) for li in o]
 
     @classmethod
     def json_denormalize(cls, o: list[dict[str, Any]],
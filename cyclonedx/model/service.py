@@ -31,7 +31,8 @@ import py_serializable as serializable
 from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
-from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.compare import CachedComparable as _CachedComparable, ComparableTuple as _ComparableTuple
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
 from ..schema.schema import (
     SchemaVersion1Dot3,
     SchemaVersion1Dot4,
@@ -48,7 +49,7 @@ from .release_note import ReleaseNotes
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class Service(Dependable):
+class Service(_CachedComparable, Dependable):
     """
     Class that models the `service` complex type in the CycloneDX schema.
 
@@ -119,6 +120,7 @@ class Service(Dependable):
     @provider.setter
     def provider(self, provider: Optional[OrganizationalEntity]) -> None:
         self._provider = provider
+        self.changed()
 
     @property
     @serializable.xml_sequence(2)
@@ -136,6 +138,7 @@ class Service(Dependable):
     @group.setter
     def group(self, group: Optional[str]) -> None:
         self._group = group
+        self.changed()
 
     @property
     @serializable.xml_sequence(3)
@@ -152,6 +155,7 @@ class Service(Dependable):
     @name.setter
     def name(self, name: str) -> None:
         self._name = name
+        self.changed()
 
     @property
     @serializable.xml_sequence(4)
@@ -168,6 +172,7 @@ class Service(Dependable):
     @version.setter
     def version(self, version: Optional[str]) -> None:
         self._version = version
+        self.changed()
 
     @property
     @serializable.xml_sequence(5)
@@ -184,6 +189,7 @@ class Service(Dependable):
     @description.setter
     def description(self, description: Optional[str]) -> None:
         self._description = description
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'endpoint')
@@ -199,7 +205,8 @@ class Service(Dependable):
 
     @endpoints.setter
     def endpoints(self, endpoints: Iterable[XsUri]) -> None:
-        self._endpoints = SortedSet(endpoints)
+        self._endpoints = _ObservedSortedSet(endpoints)
+        self.changed()
 
     @property
     @serializable.xml_sequence(7)
@@ -218,6 +225,7 @@ class Service(Dependable):
     @authenticated.setter
     def authenticated(self, authenticated: Optional[bool]) -> None:
         self._authenticated = authenticated
+        self.changed()
 
     @property
     @serializable.json_name('x-trust-boundary')
@@ -238,6 +246,7 @@ class Service(Dependable):
     @x_trust_boundary.setter
     def x_trust_boundary(self, x_trust_boundary: Optional[bool]) -> None:
         self._x_trust_boundary = x_trust_boundary
+        self.changed()
 
     # @property
     # ...
@@ -265,7 +274,8 @@ class Service(Dependable):
 
     @data.setter
     def data(self, data: Iterable[DataClassification]) -> None:
-        self._data = SortedSet(data)
+        self._data = _ObservedSortedSet(data)
+        self.changed()
 
     @property
     @serializable.type_mapping(_LicenseRepositorySerializationHelper)
@@ -283,6 +293,7 @@ class Service(Dependable):
     @licenses.setter
     def licenses(self, licenses: Iterable[License]) -> None:
         self._licenses = LicenseRepository(licenses)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'reference')
@@ -298,7 +309,8 @@ class Service(Dependable):
 
     @external_references.setter
     def external_references(self, external_references: Iterable[ExternalReference]) -> None:
-        self._external_references = SortedSet(external_references)
+        self._external_references = _ObservedSortedSet(external_references)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot3)
@@ -320,7 +332,8 @@ class Service(Dependable):
 
     @properties.setter
     def properties(self, properties: Iterable[Property]) -> None:
-        self._properties = SortedSet(properties)
+        self._properties = _ObservedSortedSet(properties)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'service')
@@ -340,7 +353,8 @@ class Service(Dependable):
 
     @services.setter
     def services(self, services: Iterable['Service']) -> None:
-        self._services = SortedSet(services)
+        self._services = _ObservedSortedSet.replacing(getattr(self, '_services', None), services)
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot4)
@@ -360,8 +374,12 @@ class Service(Dependable):
     @release_notes.setter
     def release_notes(self, release_notes: Optional[ReleaseNotes]) -> None:
         self._release_notes = release_notes
+        self.changed()
 
     def __comparable_tuple(self) -> _ComparableTuple:
+        return self._cached_comparable_tuple(self.__make_comparable_tuple)
+
+    def __make_comparable_tuple(self) -> _ComparableTuple:
         return _ComparableTuple((
             self.group, self.name, self.version,
             self.bom_ref.value,
@@ -383,7 +401,8 @@ class Service(Dependable):
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.__comparable_tuple())
+        # equal services have equal identifying fields - and nested objects might be changed in place
+        return self._cached_hash(lambda: (self.group, self.name, self.version, self.bom_ref.value))
 
     def __repr__(self) -> str:
         return f'<Service bom-ref={self.bom_ref}, group={self.group}, name={self.name}, version={self.version}>'
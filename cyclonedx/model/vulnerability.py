@@ -29,23 +29,19 @@ Since CycloneDX schema version 1.4, this has become part of the core schema.
 """
 
 import re
-import sys
 from collections.abc import Iterable
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Optional, Union
 
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
 import py_serializable as serializable
 from sortedcontainers import SortedSet
 
 from .._internal.bom_ref import bom_ref_from_str as _bom_ref_from_str
-from .._internal.compare import ComparableTuple as _ComparableTuple
+from .._internal.compare import CachedComparable as _CachedComparable, ComparableTuple as _ComparableTuple
+from .._internal.deprecation import deprecated
+from .._internal.observe import ObservedSortedSet as _ObservedSortedSet
 from ..exception.model import MutuallyExclusivePropertiesException, NoPropertiesProvidedException
 from ..schema.schema import SchemaVersion1Dot4, SchemaVersion1Dot5, SchemaVersion1Dot6, SchemaVersion1Dot7
 from . import Property, XsUri
@@ -957,7 +953,7 @@ class VulnerabilityCredits:
 
 
 @serializable.serializable_class(ignore_unknown_during_deserialization=True)
-class Vulnerability:
+class Vulnerability(_CachedComparable):
     """
     Class that models the `vulnerabilityType` complex type in the CycloneDX schema (version >= 1.4).
 
@@ -1039,6 +1035,7 @@ class Vulnerability:
     @id.setter
     def id(self, id: Optional[str]) -> None:
         self._id = id
+        self.changed()
 
     @property
     @serializable.xml_sequence(2)
@@ -1054,6 +1051,7 @@ class Vulnerability:
     @source.setter
     def source(self, source: Optional[VulnerabilitySource]) -> None:
         self._source = source
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'reference')
@@ -1072,7 +1070,8 @@ class Vulnerability:
 
     @references.setter
     def references(self, references: Iterable[VulnerabilityReference]) -> None:
-        self._references = SortedSet(references)
+        self._references = _ObservedSortedSet(references)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'rating')
@@ -1088,7 +1087,8 @@ class Vulnerability:
 
     @ratings.setter
     def ratings(self, ratings: Iterable[VulnerabilityRating]) -> None:
-        self._ratings = SortedSet(ratings)
+        self._ratings = _ObservedSortedSet(ratings)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'cwe')
@@ -1107,7 +1107,8 @@ class Vulnerability:
 
     @cwes.setter
     def cwes(self, cwes: Iterable[int]) -> None:
-        self._cwes = SortedSet(cwes)
+        self._cwes = _ObservedSortedSet(cwes)
+        self.changed()
 
     @property
     @serializable.xml_sequence(6)
@@ -1123,6 +1124,7 @@ class Vulnerability:
     @description.setter
     def description(self, description: Optional[str]) -> None:
         self._description = description
+        self.changed()
 
     @property
     @serializable.xml_sequence(7)
@@ -1139,6 +1141,7 @@ class Vulnerability:
     @detail.setter
     def detail(self, detail: Optional[str]) -> None:
         self._detail = detail
+        self.changed()
 
     @property
     @serializable.xml_sequence(8)
@@ -1154,6 +1157,7 @@ class Vulnerability:
     @recommendation.setter
     def recommendation(self, recommendation: Optional[str]) -> None:
         self._recommendation = recommendation
+        self.changed()
 
     @property
     @serializable.view(SchemaVersion1Dot5)
@@ -1173,6 +1177,7 @@ class Vulnerability:
     @workaround.setter
     def workaround(self, workaround: Optional[str]) -> None:
         self._workaround = workaround
+        self.changed()
 
     # @property
     # @serializable.view(SchemaVersion1Dot5)
@@ -1198,7 +1203,8 @@ class Vulnerability:
 
     @advisories.setter
     def advisories(self, advisories: Iterable[VulnerabilityAdvisory]) -> None:
-        self._advisories = SortedSet(advisories)
+        self._advisories = _ObservedSortedSet(advisories)
+        self.changed()
 
     @property
     @serializable.type_mapping(serializable.helpers.XsdDateTime)
@@ -1215,6 +1221,7 @@ class Vulnerability:
     @created.setter
     def created(self, created: Optional[datetime]) -> None:
         self._created = created
+        self.changed()
 
     @property
     @serializable.type_mapping(serializable.helpers.XsdDateTime)
@@ -1231,6 +1238,7 @@ class Vulnerability:
     @published.setter
     def published(self, published: Optional[datetime]) -> None:
         self._published = published
+        self.changed()
 
     @property
     @serializable.type_mapping(serializable.helpers.XsdDateTime)
@@ -1247,6 +1255,7 @@ class Vulnerability:
     @updated.setter
     def updated(self, updated: Optional[datetime]) -> None:
         self._updated = updated
+        self.changed()
 
     # @property
     # @serializable.view(SchemaVersion1Dot5)
@@ -1272,6 +1281,7 @@ class Vulnerability:
     @credits.setter
     def credits(self, credits: Optional[VulnerabilityCredits]) -> None:
         self._credits = credits
+        self.changed()
 
     @property
     @serializable.type_mapping(_ToolRepositoryHelper)
@@ -1290,6 +1300,7 @@ class Vulnerability:
         self._tools = tools \
             if isinstance(tools, ToolRepository) \
             else ToolRepository(tools=tools)
+        self.changed()
 
     @property
     @serializable.xml_sequence(18)
@@ -1305,6 +1316,7 @@ class Vulnerability:
     @analysis.setter
     def analysis(self, analysis: Optional[VulnerabilityAnalysis]) -> None:
         self._analysis = analysis
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'target')
@@ -1320,7 +1332,8 @@ class Vulnerability:
 
     @affects.setter
     def affects(self, affects_targets: Iterable[BomTarget]) -> None:
-        self._affects = SortedSet(affects_targets)
+        self._affects = _ObservedSortedSet(affects_targets)
+        self.changed()
 
     @property
     @serializable.xml_array(serializable.XmlArraySerializationType.NESTED, 'property')
@@ -1337,9 +1350,13 @@ class Vulnerability:
 
     @properties.setter
     def properties(self, properties: Iterable[Property]) -> None:
-        self._properties = SortedSet(properties)
+        self._properties = _ObservedSortedSet(properties)
+        self.changed()
 
     def __comparable_tuple(self) -> _ComparableTuple:
+        return self._cached_comparable_tuple(self.__make_comparable_tuple)
+
+    def __make_comparable_tuple(self) -> _ComparableTuple:
         return _ComparableTuple((
             self.id, self.bom_ref.value,
             self.source, _ComparableTuple(self.references),
@@ -1362,7 +1379,8 @@ class Vulnerability:
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.__comparable_tuple())
+        # equal vulnerabilities have equal identifying fields - and nested objects might be changed in place
+        return self._cached_hash(lambda: (self.id, self.bom_ref.value, self.description))
 
     def __repr__(self) -> str:
         return f'<Vulnerability bom-ref={self.bom_ref.value}, id={self.id}>'
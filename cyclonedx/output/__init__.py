@@ -22,17 +22,23 @@ and according to different versions of the CycloneDX schema standard.
 """
 
 import os
-import sys
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
-
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
-from ..contrib.bom.utils import BomRefDiscriminator as _BomRefDiscriminator
+from collections.abc import Generator, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Optional, Union, overload
+
+from .._internal.compression import (
+    Compression,
+    compression_by_suffix as _compression_by_suffix,
+    compressor as _compressor,
+)
+from .._internal.deprecation import deprecated
+from ..contrib.bom.utils import (
+    BomDependencyGraphFlatMerger as _BomDependencyGraphFlatMerger,
+    BomRefDiscriminator as _BomRefDiscriminator,
+    BomSerializationView as _BomSerializationView,
+)
 from ..schema import OutputFormat, SchemaVersion
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -43,9 +49,12 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class BaseOutput(ABC):
 
-    def __init__(self, bom: 'Bom', **kwargs: int) -> None:
+    def __init__(self, bom: 'Bom', *, read_only: bool = False, **kwargs: int) -> None:
         super().__init__(**kwargs)
         self._bom = bom
+        self._read_only = read_only
+        # shared by many outputters - see `output_as_strings()`
+        self._bom_view: Optional[_BomSerializationView] = None
         self._generated: bool = False
 
     @property
@@ -66,11 +75,43 @@ class BaseOutput(ABC):
     def generated(self, generated: bool) -> None:
         self._generated = generated
 
+    @property
+    def read_only(self) -> bool:
+        """
+        Whether the Bom is serialized without being modified - so that it can be serialized by many threads at once.
+
+        Otherwise, the Bom is modified temporarily while being serialized,
+        and missing dependency entries are registered in it - see :meth:`cyclonedx.model.bom.Bom.validate()`.
+        See :class:`cyclonedx.contrib.bom.utils.BomSerializationView`.
+        """
+        return self._read_only
+
     def get_bom(self) -> 'Bom':
         return self._bom
 
     def set_bom(self, bom: 'Bom') -> None:
         self._bom = bom
+        self._bom_view = None
+
+    @contextmanager
+    def _serialization(self, flatten: bool) -> Generator['Bom', None, None]:
+        """The Bom, prepared for serialization - via side tables, if :attr:`read_only`; otherwise in place."""
+        bom = self.get_bom()
+        if self._read_only:
+            bom_view = self._bom_view
+            if bom_view is None:
+                bom_view = _BomSerializationView(bom)
+                bom_view.validate()
+            with bom_view.serialization(flatten) as shell:
+                yield shell
+            return
+        bom.validate()
+        with _BomRefDiscriminator.from_bom(bom):
+            if flatten:
+                with _BomDependencyGraphFlatMerger(bom):
+                    yield bom
+            else:
+                yield bom
 
     @abstractmethod
     def generate(self, force_regeneration: bool = False) -> None:
@@ -84,7 +125,16 @@ class BaseOutput(ABC):
 
     def output_to_file(self, filename: str, allow_overwrite: bool = False, *,
                        indent: Optional[Union[int, str]] = None,
+                       compression: Union[Compression, Literal['auto'], None] = None,
                        **kwargs: Any) -> None:
+        """
+        Write the output to a file.
+
+        :param compression: compress the output while writing it - see :meth:`output_to_compressed_stream()`.
+                            If omitted, the output is not compressed - regardless of the file name.
+                            ``'auto'`` infers it from the file name's suffix:
+                            ``.gz``/``.gzip``, ``.bz2`` or ``.xz`` - otherwise, the output is not compressed.
+        """
         # Check directory writable
         output_filename = os.path.realpath(filename)
         output_directory = os.path.dirname(output_filename)
@@ -92,29 +142,62 @@ class BaseOutput(ABC):
             raise PermissionError(output_directory)
         if os.path.exists(output_filename) and not allow_overwrite:
             raise FileExistsError(output_filename)
+        if compression == 'auto':
+            compression = _compression_by_suffix(output_filename)
         with open(output_filename, mode='wb') as f_out:
-            f_out.write(self.output_as_string(indent=indent).encode('utf-8'))
+            if compression is None:
+                self.output_to_stream(f_out, indent=indent)
+            else:
+                self.output_to_compressed_stream(f_out, compression, indent=indent)
+
+    def output_to_compressed_stream(self, stream: BinaryIO, compression: Compression, *,
+                                    indent: Optional[Union[int, str]] = None,
+                                    **kwargs: Any) -> None:
+        """
+        Write the output as UTF-8 to a binary stream - compressed while being written,
+        so that the uncompressed document is never materialized in memory; see :meth:`output_to_stream()`.
+
+        Compressed outputs are reproducible: the gzip header carries neither file name nor time stamp.
+        The stream is not closed.
+
+        :param compression: ``'gzip'``, ``'bz2'`` or ``'xz'``
+        """
+        with _compressor(stream, compression) as compressed:
+            self.output_to_stream(compressed, indent=indent, **kwargs)  # type:ignore[arg-type]
+
+    def output_to_stream(self, stream: BinaryIO, *,
+                         indent: Optional[Union[int, str]] = None,
+                         **kwargs: Any) -> None:
+        """
+        Write the output as UTF-8 to a binary stream, like a file opened in mode ``'wb'``.
+
+        Outputters that support streaming write their output piece by piece,
+        so that the whole document is never materialized in memory.
+        """
+        stream.write(self.output_as_string(indent=indent, **kwargs).encode('utf-8'))
 
 
 @overload
 def make_outputter(bom: 'Bom', output_format: Literal[OutputFormat.JSON],
-                   schema_version: SchemaVersion) -> 'JsonOutputter':
+                   schema_version: SchemaVersion, *, read_only: bool = ...) -> 'JsonOutputter':
     ...  # pragma: no cover
 
 
 @overload
 def make_outputter(bom: 'Bom', output_format: Literal[OutputFormat.XML],
-                   schema_version: SchemaVersion) -> 'XmlOutputter':
+                   schema_version: SchemaVersion, *, read_only: bool = ...) -> 'XmlOutputter':
     ...  # pragma: no cover
 
 
 @overload
 def make_outputter(bom: 'Bom', output_format: OutputFormat,
-                   schema_version: SchemaVersion) -> Union['XmlOutputter', 'JsonOutputter']:
+                   schema_version: SchemaVersion, *,
+                   read_only: bool = ...) -> Union['XmlOutputter', 'JsonOutputter']:
     ...  # pragma: no cover
 
 
-def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: SchemaVersion) -> BaseOutput:
+def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: SchemaVersion, *,
+                   read_only: bool = False) -> BaseOutput:
     """
     Helper method to quickly get the correct output class/formatter.
 
@@ -126,6 +209,7 @@ def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: Sche
     :param bom: Bom
     :param output_format: OutputFormat
     :param schema_version: SchemaVersion
+    :param read_only: see :attr:`BaseOutput.read_only`
     :return: BaseOutput
     """
     if TYPE_CHECKING:  # pragma: no cover
@@ -140,7 +224,41 @@ def make_outputter(bom: 'Bom', output_format: OutputFormat, schema_version: Sche
     klass = BY_SCHEMA_VERSION.get(schema_version, None)
     if klass is None:
         raise ValueError(f'Unknown {output_format.name}/schema_version: {schema_version!r}')
-    return klass(bom)
+    return klass(bom, read_only=read_only)
+
+
+def output_as_strings(bom: 'Bom', targets: Iterable[tuple[OutputFormat, SchemaVersion]], *,
+                      indent: Optional[Union[int, str]] = None,
+                      max_workers: int = 0) -> dict[tuple[OutputFormat, SchemaVersion], str]:
+    """
+    Serialize a Bom to many formats and schema versions at once.
+
+    The view-independent work - validation, discrimination of `bom-ref` values and flattening of the dependency graph -
+    is done only once, and shared by all targets; see :class:`cyclonedx.contrib.bom.utils.BomSerializationView`.
+    So all outputs use the same `bom-ref` values. The Bom is not modified - see :attr:`BaseOutput.read_only`.
+
+    Raises error when any target is not supported - see :func:`make_outputter()`.
+
+    :param bom: Bom
+    :param targets: the output formats and schema versions
+    :param indent: see :meth:`BaseOutput.output_as_string()`
+    :param max_workers: render the targets in up to this many worker threads; ``0`` renders in the calling thread
+    :return: the outputs, by target
+    """
+    outputters = {target: make_outputter(bom, *target, read_only=True) for target in targets}
+    bom_view = _BomSerializationView(bom)
+    bom_view.validate()
+    for outputter in outputters.values():
+        outputter._bom_view = bom_view
+
+    def render(outputter: BaseOutput) -> str:
+        return outputter.output_as_string(indent=indent)
+
+    if max_workers > 0 and len(outputters) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(outputters, executor.map(render, outputters.values())))
+    return {target: render(outputter) for target, outputter in outputters.items()}
+
 
 # region deprecated re-export
 
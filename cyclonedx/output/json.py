@@ -16,10 +16,12 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 from abc import abstractmethod
-from json import dumps as json_dumps, loads as json_loads
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from collections.abc import Container, Generator
+from contextlib import contextmanager
+from json import dumps as json_dumps
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Optional, Union
 
-from ..contrib.bom.utils import BomDependencyGraphFlatMerger, BomRefDiscriminator
+from .._internal.json import iterencode as _json_iterencode, normalize_deferred as _json_normalize_deferred
 from ..exception.output import FormatNotSupportedException
 from ..schema import OutputFormat, SchemaVersion
 from ..schema.schema import (
@@ -42,8 +44,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class Json(BaseOutput, BaseSchemaVersion):
 
-    def __init__(self, bom: 'Bom') -> None:
-        super().__init__(bom=bom)
+    def __init__(self, bom: 'Bom', *, read_only: bool = False) -> None:
+        super().__init__(bom=bom, read_only=read_only)
         self._bom_json: dict[str, Any] = dict()
 
     @property
@@ -58,6 +60,14 @@ class Json(BaseOutput, BaseSchemaVersion):
         if self.generated and not force_regeneration:
             return
 
+        with self.__normalized(defer=()) as bom_json:
+            self._bom_json = bom_json
+        self.generated = True
+
+    __STREAMED_PROPERTIES = frozenset(('components', 'services', 'dependencies', 'vulnerabilities'))
+
+    @contextmanager
+    def __normalized(self, defer: Container[str]) -> Generator[dict[str, Any], None, None]:
         schema_uri: Optional[str] = self._get_schema_uri()
         if not schema_uri:
             raise FormatNotSupportedException(
@@ -69,16 +79,11 @@ class Json(BaseOutput, BaseSchemaVersion):
             'specVersion': self.schema_version.to_version()
         }
         _view = SCHEMA_VERSIONS.get(self.schema_version_enum)
-        bom = self.get_bom()
-        bom.validate()
-        with BomRefDiscriminator.from_bom(bom):
-            with BomDependencyGraphFlatMerger(bom):
-                bom_json: dict[str, Any] = json_loads(
-                    bom.as_json(  # type:ignore[attr-defined]
-                        view_=_view))
-        bom_json.update(_json_core)
-        self._bom_json = bom_json
-        self.generated = True
+        with self._serialization(flatten=True) as bom:
+            bom_json = _json_normalize_deferred(bom, _view, defer)
+            bom_json.update(_json_core)
+            # deferred parts are normalized while being consumed - so consume them in here
+            yield bom_json
 
     def output_as_string(self, *,
                          indent: Optional[Union[int, str]] = None,
@@ -87,6 +92,24 @@ class Json(BaseOutput, BaseSchemaVersion):
         return json_dumps(self._bom_json,
                           indent=indent)
 
+    def output_to_stream(self, stream: BinaryIO, *,
+                         indent: Optional[Union[int, str]] = None,
+                         **kwargs: Any) -> None:
+        """
+        Write the JSON document as UTF-8 to a binary stream, like a file opened in mode ``'wb'``.
+
+        Components, services, dependencies and vulnerabilities are rendered and written one by one,
+        so memory usage does not grow with the size of the document.
+        The written bytes are identical to ``output_as_string(indent=indent).encode('utf-8')``.
+        """
+        if self.generated:
+            for chunk in _json_iterencode(self._bom_json, indent):
+                stream.write(chunk.encode('utf-8'))
+            return
+        with self.__normalized(defer=self.__STREAMED_PROPERTIES) as bom_json:
+            for chunk in _json_iterencode(bom_json, indent):
+                stream.write(chunk.encode('utf-8'))
+
     @abstractmethod
     def _get_schema_uri(self) -> Optional[str]:
         ...  # pragma: no cover
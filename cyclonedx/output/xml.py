@@ -16,11 +16,17 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union
-from xml.dom.minidom import parseString as dom_parseString  # nosec B408
-from xml.etree.ElementTree import Element as XmlElement, tostring as xml_dumps  # nosec B405
+from collections.abc import Callable, Iterator
+from copy import copy
+from io import StringIO, TextIOWrapper
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Optional, Union
+from xml.etree.ElementTree import Element as XmlElement  # nosec B405
 
-from ..contrib.bom.utils import BomRefDiscriminator
+from py_serializable import ObjectMetadataLibrary, SerializationType
+from py_serializable.formatters import CurrentFormatter
+from sortedcontainers import SortedSet
+
+from .._internal.xml import XmlWriter as _XmlWriter, iter_deferred as _xml_iter_deferred
 from ..schema import OutputFormat, SchemaVersion
 from ..schema.schema import (
     SCHEMA_VERSIONS,
@@ -37,13 +43,15 @@ from ..schema.schema import (
 from . import BaseOutput
 
 if TYPE_CHECKING:  # pragma: no cover
+    from py_serializable import ViewType
+
     from ..model.bom import Bom
 
 
 class Xml(BaseSchemaVersion, BaseOutput):
-    def __init__(self, bom: 'Bom') -> None:
-        super().__init__(bom=bom)
-        self._bom_xml: str = ''
+    def __init__(self, bom: 'Bom', *, read_only: bool = False) -> None:
+        super().__init__(bom=bom, read_only=read_only)
+        self._bom_xml: Optional[XmlElement] = None
 
     @property
     def schema_version(self) -> SchemaVersion:
@@ -58,39 +66,104 @@ class Xml(BaseSchemaVersion, BaseOutput):
             return
 
         _view = SCHEMA_VERSIONS[self.schema_version_enum]
-        bom = self.get_bom()
-        bom.validate()
         xmlns = self.get_target_namespace()
-        with BomRefDiscriminator.from_bom(bom):
-            self._bom_xml = '<?xml version="1.0" ?>\n' + xml_dumps(  # type:ignore[call-overload]
-                bom.as_xml(  # type:ignore[attr-defined]
-                    _view, as_string=False, xmlns=xmlns),
-                method='xml', default_namespace=xmlns, encoding='unicode',
-                # `xml-declaration` is inconsistent/bugged in py38,
-                # especially on Windows it will print a non-UTF8 codepage.
-                # Furthermore, it might add an encoding of "utf-8" which is redundant default value of XML.
-                # -> so we write the declaration manually, as long as py38 is supported.
-                xml_declaration=False)
+        with self._serialization(flatten=False) as bom:
+            self._bom_xml = bom.as_xml(  # type:ignore[attr-defined]
+                _view, as_string=False, xmlns=xmlns)
 
         self.generated = True
 
-    @staticmethod
-    def __make_indent(v: Optional[Union[int, str]]) -> str:
-        if isinstance(v, int):
-            return ' ' * v
-        if isinstance(v, str):
-            return v
-        return ''
-
     def output_as_string(self, *,
                          indent: Optional[Union[int, str]] = None,
                          **kwargs: Any) -> str:
         self.generate()
-        return self._bom_xml if indent is None else dom_parseString(  # nosecc B318
-            self._bom_xml).toprettyxml(
-            indent=self.__make_indent(indent)
-            # do not set `encoding` - this would convert result to binary, not string
-        )
+        buffer = StringIO()
+        writer = _XmlWriter(buffer.write, self.get_target_namespace(), indent)
+        writer.declaration()
+        writer.element(self._bom_xml)  # type:ignore[arg-type]
+        return buffer.getvalue()
+
+    def output_to_stream(self, stream: BinaryIO, *,
+                         indent: Optional[Union[int, str]] = None,
+                         **kwargs: Any) -> None:
+        """
+        Write the XML document as UTF-8 to a binary stream, like a file opened in mode ``'wb'``.
+
+        Components, services, dependencies and vulnerabilities are rendered and written one by one,
+        so memory usage does not grow with the size of the document - even when indented.
+        The written bytes are identical to ``output_as_string(indent=indent).encode('utf-8')``.
+        """
+        text_stream = TextIOWrapper(stream, encoding='utf-8', newline='\n')
+        try:
+            writer = _XmlWriter(text_stream.write, self.get_target_namespace(), indent)
+            writer.declaration()
+            if self.generated:
+                writer.element(self._bom_xml)  # type:ignore[arg-type]
+            else:
+                self.__stream(writer)
+        finally:
+            text_stream.flush()
+            text_stream.detach()
+
+    __STREAMED_PROPERTIES = ('components', 'services', 'dependencies', 'vulnerabilities')
+
+    def __stream(self, writer: _XmlWriter) -> None:
+        _view = SCHEMA_VERSIONS[self.schema_version_enum]
+        xmlns = self.get_target_namespace()
+        sequences, deferrable = self.__bom_elements(_view, xmlns)
+        with self._serialization(flatten=False) as bom:
+            # a shallow copy, that lacks the bulk data - which is streamed instead
+            shell = copy(bom)
+            deferred: dict[str, tuple[int, Callable[[], Iterator[XmlElement]]]] = {}
+            for prop_name in self.__STREAMED_PROPERTIES:
+                items = getattr(bom, prop_name)
+                if prop_name not in deferrable or len(items) == 0:
+                    continue
+                tag, item_tag = deferrable[prop_name]
+                # NOTE: not using the setter - it would notify the observers of the original's collections.
+                setattr(shell, f'_{prop_name}', SortedSet())
+                deferred[tag] = (sequences[tag], self.__make_items(items, _view, item_tag, xmlns))
+            root = shell.as_xml(  # type:ignore[attr-defined]
+                _view, as_string=False, xmlns=xmlns)
+            writer.start(root.tag, root.attrib)
+            for part in _xml_iter_deferred(root, deferred, sequences):
+                if isinstance(part, XmlElement):
+                    writer.element(part)
+                else:
+                    tag, elements = part
+                    writer.start(tag)
+                    for element in elements:
+                        writer.element(element)
+                    writer.end()
+            writer.end()
+
+    @staticmethod
+    def __make_items(items: Any, view: type['ViewType'], item_tag: str,
+                     xmlns: str) -> Callable[[], Iterator[XmlElement]]:
+        return lambda: (
+            item.as_xml(view_=view, as_string=False, element_name=item_tag, xmlns=xmlns)
+            for item in items)
+
+    def __bom_elements(self, view: type['ViewType'],
+                       xmlns: str) -> tuple[dict[str, int], dict[str, tuple[str, str]]]:
+        """Element names of the Bom's properties mapped to their XML sequence,
+        and the streamable properties of the view mapped to their element names and item element names."""
+        from ..model.bom import Bom
+
+        sequences = {}
+        deferrable = {}
+        for prop_name, prop_info in ObjectMetadataLibrary.klass_property_mappings[
+            f'{Bom.__module__}.{Bom.__qualname__}'
+        ].items():
+            if prop_info.is_xml_attribute:
+                continue
+            name = prop_info.custom_names.get(SerializationType.XML, prop_name)
+            tag = f'{{{xmlns}}}{CurrentFormatter.formatter.encode(name)}'
+            sequences[tag] = prop_info.xml_sequence
+            if prop_name in self.__STREAMED_PROPERTIES and prop_info.xml_array_config \
+                    and (not prop_info.views or view in prop_info.views):
+                deferrable[prop_name] = (tag, f'{{{xmlns}}}{prop_info.xml_array_config[1]}')
+        return sequences, deferrable
 
     def get_target_namespace(self) -> str:
         return f'http://cyclonedx.org/schema/bom/{self.get_schema_version()}'
@@ -20,7 +20,6 @@
 Set of helper classes for use with ``serializable`` when conducting (de-)serialization.
 """
 
-import sys
 from typing import Any, Optional
 from uuid import UUID
 
@@ -28,11 +27,7 @@ from uuid import UUID
 from packageurl import PackageURL
 from py_serializable.helpers import BaseHelper
 
-if sys.version_info >= (3, 13):
-    from warnings import deprecated
-else:
-    from typing_extensions import deprecated
-
+from .._internal.deprecation import deprecated
 from ..exception.serialization import CycloneDxDeserializationException, SerializationOfUnexpectedValueException
 from ..model.bom_ref import BomRef
 from ..model.license import _LicenseRepositorySerializationHelper
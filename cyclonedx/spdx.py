@@ -22,33 +22,56 @@ __all__ = [
 ]
 
 from json import load as json_load
+from threading import Lock
 from typing import TYPE_CHECKING, Optional
 
-from license_expression import get_spdx_licensing  # type:ignore[import-untyped]
-
 from .schema._res import SPDX_JSON as __SPDX_JSON_SCHEMA
 
 if TYPE_CHECKING:  # pragma: no cover
-    from license_expression import Licensing
+    from license_expression import Licensing  # type:ignore[import-untyped]
 
 # region init
-# python's internal module loader will assure that this init-part runs only once.
-
-# !!! this requires to ship the actual schema data with the package.
-with open(__SPDX_JSON_SCHEMA) as schema:
-    __IDS: set[str] = set(json_load(schema).get('enum', []))
-assert len(__IDS) > 0, 'known SPDX-IDs should be non-empty set'
-
-__IDS_LOWER_MAP: dict[str, str] = {id_.lower(): id_ for id_ in __IDS}
-
-__SPDX_EXPRESSION_LICENSING: 'Licensing' = get_spdx_licensing()
+# the tables and the licensing are costly to build, and many users never need them.
+# so they are built on first use, not on import - once, even when first used by many threads at once.
+
+__INIT_LOCK = Lock()
+__ids_tables: Optional[tuple[frozenset[str], dict[str, str]]] = None
+__spdx_expression_licensing: Optional['Licensing'] = None
+
+
+def __get_ids_tables() -> tuple[frozenset[str], dict[str, str]]:
+    """The known SPDX-IDs - and a map of their lower-case variants to them."""
+    global __ids_tables
+    tables = __ids_tables
+    if tables is None:
+        with __INIT_LOCK:
+            tables = __ids_tables
+            if tables is None:
+                # !!! this requires to ship the actual schema data with the package.
+                with open(__SPDX_JSON_SCHEMA) as schema:
+                    ids = frozenset(json_load(schema).get('enum', []))
+                assert len(ids) > 0, 'known SPDX-IDs should be non-empty set'
+                tables = __ids_tables = ids, {id_.lower(): id_ for id_ in ids}
+    return tables
+
+
+def __get_spdx_expression_licensing() -> 'Licensing':
+    global __spdx_expression_licensing
+    licensing = __spdx_expression_licensing
+    if licensing is None:
+        with __INIT_LOCK:
+            licensing = __spdx_expression_licensing
+            if licensing is None:
+                from license_expression import get_spdx_licensing
+                licensing = __spdx_expression_licensing = get_spdx_licensing()
+    return licensing
 
 # endregion
 
 
 def is_supported_id(value: str) -> bool:
     """Validate SPDX-ID according to current spec."""
-    return value in __IDS
+    return value in __get_ids_tables()[0]
 
 
 def fixup_id(value: str) -> Optional[str]:
@@ -56,7 +79,7 @@ def fixup_id(value: str) -> Optional[str]:
 
     :returns: repaired value string, or `None` if fixup was unable to help.
     """
-    return __IDS_LOWER_MAP.get(value.lower())
+    return __get_ids_tables()[1].get(value.lower())
 
 
 def is_expression(value: str) -> bool:
@@ -70,7 +93,7 @@ def is_expression(value: str) -> bool:
     .. _license-expression library: https://github.com/nexB/license-expression
     """
     try:
-        res = __SPDX_EXPRESSION_LICENSING.validate(value)
+        res = __get_spdx_expression_licensing().validate(value)
     except Exception:
         # the throw happens when internals crash due to unexpected input characters.
         return False
@@ -17,16 +17,18 @@
 
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol, Union, overload
+from collections.abc import Callable, Hashable, Iterable
+from threading import RLock, local
+from typing import TYPE_CHECKING, Any, Literal, Optional, Protocol, TypeVar, Union, overload
 
-from ..schema import OutputFormat
+from ..schema import OutputFormat, SchemaVersion
 
 if TYPE_CHECKING:  # pragma: no cover
-    from ..schema import SchemaVersion
     from .json import JsonValidator
     from .xml import XmlValidator
 
+_T = TypeVar('_T')
+
 
 class ValidationError:
     """Validation failed with this specific error.
@@ -90,9 +92,49 @@ class SchemabasedValidator(Protocol):
         ...  # pragma: no cover
 
 
+class _CompiledSchemaCache:
+    """Process-wide, thread-safe cache of compiled schemas.
+
+    Each schema is compiled only once, even if requested concurrently.
+    Compiled schemas that must not be shared between threads are cached per thread.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = RLock()
+        self.__shared: dict[Hashable, Any] = {}
+        self.__per_thread = local()
+
+    def get(self, key: Hashable, compile: Callable[[], _T], *, per_thread: bool = False) -> _T:
+        if per_thread:
+            store = getattr(self.__per_thread, 'store', None)
+            if store is None:
+                store = self.__per_thread.store = {}
+        else:
+            store = self.__shared
+        compiled = store.get(key)
+        if compiled is None:
+            with self.__lock:
+                compiled = store.get(key)
+                if compiled is None:
+                    compiled = store[key] = compile()
+        return compiled
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__shared.clear()
+            self.__per_thread = local()
+
+
+_compiled_schemas = _CompiledSchemaCache()
+
+
 class BaseSchemabasedValidator(ABC, SchemabasedValidator):
     """Base Schema-based Validator"""
 
+    _strict: bool = False
+    """Whether this validator is strict - in addition to the format and schema version, this tells compiled schemas
+    apart in the process-wide cache."""
+
     def __init__(self, schema_version: 'SchemaVersion') -> None:
         self.__schema_version = schema_version
         if not self._schema_file:
@@ -115,6 +157,10 @@ class BaseSchemabasedValidator(ABC, SchemabasedValidator):
         """Get the schema file according to schema version."""
         ...  # pragma: no cover
 
+    def _warm_up(self) -> None:
+        """Compile the schema ahead of time - see :func:`warm_up_schemabased_validators()`."""
+        pass  # pragma: no cover
+
 
 @overload
 def make_schemabased_validator(output_format: Literal[OutputFormat.JSON], schema_version: 'SchemaVersion'
@@ -149,3 +195,45 @@ def make_schemabased_validator(output_format: OutputFormat, schema_version: 'Sch
     else:
         raise ValueError(f'Unexpected output_format: {output_format!r}')
     return Validator(schema_version)
+
+
+def warm_up_schemabased_validators(
+    output_formats: Optional[Iterable[OutputFormat]] = None,
+    schema_versions: Optional[Iterable[SchemaVersion]] = None,
+    *, strict: bool = False
+) -> None:
+    """Compile Schema-based Validators ahead of time.
+
+    Compiled schemas are cached process-wide, keyed by format, schema version and strictness;
+    any validator made afterwards uses them. Call this at the startup of a worker, to take the compilation cost
+    off the first validation.
+
+    XML schemas are compiled per thread, as they must not be shared between threads;
+    so call this in each worker thread that validates XML - like in the `initializer` of a thread pool.
+
+    :param output_formats: formats to compile validators for - all formats, if omitted
+    :param schema_versions: schema versions to compile validators for - all versions, if omitted.
+        Versions that a format does not support are skipped.
+    :param strict: whether to compile strict validators, where available
+    :raises MissingOptionalDependencyException: if a format's validation dependencies are not installed
+    """
+    if TYPE_CHECKING:  # pragma: no cover
+        Validator: type[BaseSchemabasedValidator]  # noqa:N806
+    schema_versions = tuple(SchemaVersion if schema_versions is None else schema_versions)
+    for output_format in (OutputFormat if output_formats is None else output_formats):
+        if OutputFormat.JSON is output_format:
+            if strict:
+                from .json import JsonStrictValidator as Validator
+            else:
+                from .json import JsonValidator as Validator
+        elif OutputFormat.XML is output_format:
+            from .xml import XmlValidator as Validator
+        else:
+            raise ValueError(f'Unexpected output_format: {output_format!r}')
+        for schema_version in schema_versions:
+            try:
+                validator = Validator(schema_version)
+            except ValueError:
+                # unsupported schema version
+                continue
+            validator._warm_up()
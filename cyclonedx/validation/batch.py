@@ -0,0 +1,192 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+"""Validation of many documents at once, in parallel."""
+
+__all__ = ['BatchValidationResult', 'validate_batch']
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from os import PathLike, cpu_count, fspath
+from pickle import dumps as pickle_dumps  # nosec B403
+from typing import TYPE_CHECKING, Optional, Union
+
+from ..exception import MissingOptionalDependencyException
+from ..schema import OutputFormat
+from . import ValidationError, warm_up_schemabased_validators
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..schema import SchemaVersion
+    from . import BaseSchemabasedValidator
+
+Document = Union[str, 'PathLike[str]', bytes, bytearray, memoryview]
+"""A document to validate: either the path of a file, or the content as a byte buffer."""
+
+
+class BatchValidationResult:
+    """Result of validating one document of a batch."""
+
+    def __init__(self, index: int, source: Optional[str],
+                 errors: Optional[list[ValidationError]] = None,
+                 exception: Optional[Exception] = None) -> None:
+        self.index = index
+        self.source = source
+        self.errors = errors
+        self.exception = exception
+
+    index: int
+    """Position of the document in the batch."""
+
+    source: Optional[str]
+    """Path of the document - or `None`, if the document was given as a byte buffer."""
+
+    errors: Optional[list[ValidationError]]
+    """Validation errors - `None` if the document is valid, or if it could not be validated at all.
+
+    Contains only the first error found, unless all errors were requested."""
+
+    exception: Optional[Exception]
+    """Why the document could not be validated at all - like an unreadable file or malformed data."""
+
+    @property
+    def valid(self) -> bool:
+        """Whether the document is valid."""
+        return self.errors is None and self.exception is None
+
+    def __repr__(self) -> str:
+        return f'<BatchValidationResult index={self.index!r} source={self.source!r} valid={self.valid!r}>'
+
+
+def _make_validator(output_format: OutputFormat, schema_version: 'SchemaVersion',
+                    strict: bool) -> 'BaseSchemabasedValidator':
+    if OutputFormat.JSON is output_format:
+        from .json import JsonStrictValidator, JsonValidator
+        return (JsonStrictValidator if strict else JsonValidator)(schema_version)
+    if OutputFormat.XML is output_format:
+        from .xml import XmlValidator
+        return XmlValidator(schema_version)
+    raise ValueError(f'Unexpected output_format: {output_format!r}')
+
+
+def _portable_exception(e: Exception) -> Exception:
+    try:
+        pickle_dumps(e)
+    except Exception:
+        return RuntimeError(f'{type(e).__qualname__}: {e}')
+    return e
+
+
+def _validate(output_format: OutputFormat, schema_version: 'SchemaVersion', strict: bool, all_errors: bool,
+              portable: bool, index: int, document: Document) -> BatchValidationResult:
+    # runs in a worker. Compiled validators are cached in each worker process - see `_compiled_schemas`.
+    source = None
+    errors: Optional[list[ValidationError]]
+    try:
+        if isinstance(document, (str, PathLike)):
+            source = fspath(document)
+            # a leading byte order mark is not part of the document
+            with open(source, encoding='utf-8-sig') as f:
+                data = f.read()
+        else:
+            data = str(document, encoding='utf-8-sig')
+        validator = _make_validator(output_format, schema_version, strict)
+        if all_errors:
+            found_all = validator.validate_str(data, all_errors=True)
+            errors = None if found_all is None else list(found_all)
+        else:
+            found = validator.validate_str(data)
+            errors = None if found is None else [found]
+    except MissingOptionalDependencyException:
+        raise
+    except Exception as e:
+        return BatchValidationResult(index, source,
+                                     exception=_portable_exception(e) if portable else e)
+    if errors is not None and portable:
+        # raw error data of the underlying validators cannot be transferred between processes
+        errors = [type(e)(str(e.data)) for e in errors]
+    return BatchValidationResult(index, source, errors=errors)
+
+
+def validate_batch(
+    documents: Iterable[Document],
+    output_format: OutputFormat,
+    schema_version: 'SchemaVersion',
+    *,
+    strict: bool = False,
+    all_errors: bool = False,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> Iterator[BatchValidationResult]:
+    """Validate many documents in parallel.
+
+    Results are yielded as soon as they are available - not necessarily in order of the `documents`;
+    use :attr:`BatchValidationResult.index` to correlate.
+    `documents` are consumed lazily, and only a limited number of them is in flight at any time,
+    so that arbitrarily many documents can be validated with constant memory.
+
+    By default, the documents are validated in a pool of processes, which utilizes all CPU cores.
+    Pass any other `executor`, like a :class:`concurrent.futures.ThreadPoolExecutor`, to use that instead.
+    Compiled schemas are cached per worker process - see :func:`warm_up_schemabased_validators()`.
+
+    When validated in processes, the :attr:`ValidationError.data` of each error is its string representation,
+    as the raw error data of the underlying validators cannot be transferred between processes.
+
+    :param documents: paths of files, or documents' content as byte buffers - all UTF-8 encoded
+    :param output_format: format of all documents
+    :param schema_version: schema version to validate all documents against
+    :param strict: whether to use a strict validator, where available
+    :param all_errors: whether to collect all errors of each document, or only (any)one
+    :param executor: executor to run the validations - a process pool, if omitted
+    :param max_workers: number of workers of the process pool, if no `executor` was given
+    :raises MissingOptionalDependencyException: if the validation dependencies for the format are not installed
+    """
+    _make_validator(output_format, schema_version, strict)  # fail early on unsupported arguments
+    portable = executor is None or isinstance(executor, ProcessPoolExecutor)
+    return _run(executor, documents, max_workers, (output_format, schema_version, strict, all_errors, portable))
+
+
+def _run(executor: Optional[Executor], documents: Iterable[Document], max_workers: Optional[int],
+         args: tuple[OutputFormat, 'SchemaVersion', bool, bool, bool]) -> Iterator[BatchValidationResult]:
+    # a process pool of our own is started only when the results are iterated - and shut down when that ends,
+    # so that no pool is left behind by results that are never iterated
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_up, initargs=args[:3])
+    # keep all workers busy, while not reading more documents than needed
+    in_flight_max = 2 * (max_workers or cpu_count() or 1)
+    in_flight: set[Future[BatchValidationResult]] = set()
+    enumerated = enumerate(documents)
+    try:
+        while True:
+            for index, document in islice(enumerated, in_flight_max - len(in_flight)):
+                in_flight.add(executor.submit(_validate, *args, index, document))
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+def _warm_up(output_format: OutputFormat, schema_version: 'SchemaVersion', strict: bool) -> None:
+    # initializer of worker processes
+    warm_up_schemabased_validators((output_format,), (schema_version,), strict=strict)
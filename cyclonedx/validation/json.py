@@ -37,7 +37,7 @@ from ..schema._res import (
     JSF as _S_JSF,
     SPDX_JSON as _S_SPDX,
 )
-from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError
+from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError, _compiled_schemas
 
 _missing_deps_error: Optional[tuple[MissingOptionalDependencyException, ImportError]] = None
 try:
@@ -97,6 +97,9 @@ class _BaseJsonValidator(BaseSchemabasedValidator, ABC):
         ) -> Union[None, JsonValidationError, Iterable[JsonValidationError]]:
             raise self.__MDERROR[0] from self.__MDERROR[1]
 
+        def _warm_up(self) -> None:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
     else:
 
         def validate_str(  # type:ignore[no-redef] # noqa:F811 # typing-relevant headers go first
@@ -118,16 +121,25 @@ class _BaseJsonValidator(BaseSchemabasedValidator, ABC):
         @property
         def _validator(self) -> 'JsonSchemaValidator':
             if not self.__validator:
-                schema_file = self._schema_file
-                if schema_file is None:
-                    raise NotImplementedError('missing schema file')
-                with open(schema_file) as sf:
-                    self.__validator = Draft7Validator(
-                        json_loads(sf.read()),
-                        registry=self.__make_validator_registry(),
-                        format_checker=Draft7Validator.FORMAT_CHECKER)
+                # compiled validators are shared process-wide - `Draft7Validator` is safe to use from multiple threads
+                self.__validator = _compiled_schemas.get(
+                    (self.output_format, self.schema_version, self._strict),
+                    self.__make_validator)
             return self.__validator
 
+        def _warm_up(self) -> None:
+            self._validator  # noqa:B018
+
+        def __make_validator(self) -> 'JsonSchemaValidator':
+            schema_file = self._schema_file
+            if schema_file is None:
+                raise NotImplementedError('missing schema file')
+            with open(schema_file) as sf:
+                return Draft7Validator(
+                    json_loads(sf.read()),
+                    registry=_compiled_schemas.get('json-registry', self.__make_validator_registry),
+                    format_checker=Draft7Validator.FORMAT_CHECKER)
+
         @staticmethod
         def __make_validator_registry() -> Registry[Any]:
             schema_prefix = 'http://cyclonedx.org/schema/'
@@ -154,6 +166,9 @@ class JsonStrictValidator(_BaseJsonValidator, BaseSchemabasedValidator, Schemaba
     In contrast to :class:`~JsonValidator`,
     the document must not have additional or unknown JSON properties.
     """
+
+    _strict = True
+
     @property
     def _schema_file(self) -> Optional[str]:
         return _S_BOM_STRICT.get(self.schema_version)
@@ -26,7 +26,7 @@ from typing import TYPE_CHECKING, Literal, Optional, Union, overload
 from ..exception import MissingOptionalDependencyException
 from ..schema import OutputFormat
 from ..schema._res import BOM_XML as _S_BOM
-from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError
+from . import BaseSchemabasedValidator, SchemabasedValidator, ValidationError, _compiled_schemas
 
 if TYPE_CHECKING:  # pragma: no cover
     from ..schema import SchemaVersion
@@ -91,6 +91,9 @@ class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
         ) -> Union[None, XmlValidationError, Iterable[XmlValidationError]]:
             raise self.__MDERROR[0] from self.__MDERROR[1]
 
+        def _warm_up(self) -> None:
+            raise self.__MDERROR[0] from self.__MDERROR[1]
+
     else:
         def validate_str(  # type:ignore[no-redef] # noqa:F811 # typing-relevant headers go first
             self, data: str, *, all_errors: bool = False
@@ -107,8 +110,6 @@ class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
                 if all_errors \
                 else XmlValidationError._make_from_xle(errors.last_error)
 
-        __validator: Optional['XMLSchema'] = None
-
         @property
         def __xml_parser(self) -> XMLParser:
             return XMLParser(
@@ -122,12 +123,20 @@ class _BaseXmlValidator(BaseSchemabasedValidator, ABC):
 
         @property
         def _validator(self) -> 'XMLSchema':
-            if not self.__validator:
-                schema_file = self._schema_file
-                if schema_file is None:
-                    raise NotImplementedError('missing schema file')
-                self.__validator = XMLSchema(file=Path(schema_file).absolute().as_uri())
-            return self.__validator
+            # compiled schemas are cached per thread - `XMLSchema` keeps the `error_log` of its last validation
+            return _compiled_schemas.get(
+                (self.output_format, self.schema_version, self._strict),
+                self.__make_validator,
+                per_thread=True)
+
+        def _warm_up(self) -> None:
+            self._validator  # noqa:B018
+
+        def __make_validator(self) -> 'XMLSchema':
+            schema_file = self._schema_file
+            if schema_file is None:
+                raise NotImplementedError('missing schema file')
+            return XMLSchema(file=Path(schema_file).absolute().as_uri())
 
 
 class XmlValidator(_BaseXmlValidator, BaseSchemabasedValidator, SchemabasedValidator):
@@ -0,0 +1,122 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from packageurl import PackageURL
+
+from cyclonedx.contrib.bom.diff import _Differ, diff_boms
+from cyclonedx.contrib.bom.digest import digest
+from cyclonedx.model import HashAlgorithm, HashType
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.contact import OrganizationalEntity
+from cyclonedx.model.license import DisjunctiveLicense
+from cyclonedx.model.service import Service
+from cyclonedx.model.vulnerability import Vulnerability
+
+
+def _lib(name: str, version: str = '1', license_id: str = 'MIT', hash_content: str = 'aa',
+         **kwargs: object) -> Component:
+    return Component(name=name, version=version, purl=PackageURL('pypi', name=name, version=version),
+                     licenses=[DisjunctiveLicense(id=license_id)],
+                     hashes=[HashType(alg=HashAlgorithm.SHA_256, content=hash_content)],
+                     **kwargs)  # type:ignore[arg-type]
+
+
+class TestDiffBoms(TestCase):
+
+    def test_unchanged(self) -> None:
+        # bom-refs are not content
+        diff = diff_boms(Bom(components=[_lib('a', bom_ref='x')]), Bom(components=[_lib('a', bom_ref='y')]))
+        self.assertFalse(diff)
+        self.assertEqual([], diff.components_changed)
+
+    def test_added_removed(self) -> None:
+        diff = diff_boms(Bom(components=[_lib('a'), _lib('b')]), Bom(components=[_lib('b'), _lib('c')]))
+        self.assertEqual(['c'], [c.name for c in diff.components_added])
+        self.assertEqual(['a'], [c.name for c in diff.components_removed])
+        self.assertEqual([], diff.components_changed)
+        self.assertTrue(diff)
+
+    def test_changed(self) -> None:
+        diff = diff_boms(Bom(components=[_lib('a'), _lib('b')]),
+                         Bom(components=[_lib('a', version='2', hash_content='bb'),
+                                         _lib('b', license_id='Apache-2.0')]))
+        a, b = sorted(diff.components_changed, key=lambda c: c.new.name)
+        self.assertEqual(('hashes', 'purl', 'version'), a.fields)
+        self.assertEqual(('1', '2'), (a.old.version, a.new.version))
+        self.assertEqual(['bb'], [h.content for h in a.added('hashes')])
+        self.assertEqual(['aa'], [h.content for h in a.removed('hashes')])
+        self.assertEqual(('licenses',), b.fields)
+        self.assertEqual([DisjunctiveLicense(id='Apache-2.0')], list(b.added('licenses')))
+        self.assertEqual([DisjunctiveLicense(id='MIT')], list(b.removed('licenses')))
+
+    def test_ambiguous_keys(self) -> None:
+        diff = diff_boms(Bom(components=[_lib('a', '1'), _lib('a', '2'), _lib('a', '3')]),
+                         Bom(components=[_lib('a', '2'), _lib('a', '4')]))
+        self.assertEqual([], diff.components_added)
+        self.assertEqual(1, len(diff.components_removed))
+        change, = diff.components_changed
+        self.assertEqual('4', change.new.version)
+        self.assertIn(change.old.version, ('1', '3'))
+
+    def test_nested_and_metadata(self) -> None:
+        old = Bom(components=[_lib('p', components=[_lib('n1'), _lib('n2')])])
+        old.metadata.component = Component(name='app', version='1')
+        new = Bom(components=[_lib('p', components=[_lib('n1', version='2'), _lib('n3')])])
+        new.metadata.component = Component(name='app', version='2')
+        diff = diff_boms(old, new)
+        self.assertEqual({'app', 'n1'}, {c.new.name for c in diff.components_changed})
+        self.assertEqual(['n3'], [c.name for c in diff.components_added])
+        self.assertEqual(['n2'], [c.name for c in diff.components_removed])
+
+    def test_services_and_vulnerabilities(self) -> None:
+        old = Bom(services=[Service(name='s', version='1')],
+                  vulnerabilities=[Vulnerability(id='CVE-1', description='foo'), Vulnerability(id='CVE-2')])
+        new = Bom(services=[Service(name='s', version='2')],
+                  vulnerabilities=[Vulnerability(id='CVE-1', description='bar'), Vulnerability(id='CVE-3')])
+        diff = diff_boms(old, new)
+        self.assertEqual([('version',)], [c.fields for c in diff.services_changed])
+        self.assertEqual(['CVE-3'], [v.id for v in diff.vulnerabilities_added])
+        self.assertEqual(['CVE-2'], [v.id for v in diff.vulnerabilities_removed])
+        self.assertEqual([('description',)], [c.fields for c in diff.vulnerabilities_changed])
+
+    def test_digested(self) -> None:
+        old = Bom(components=[_lib('a'), _lib('b'), _lib('p', components=[_lib('n')])])
+        new = Bom(components=[_lib('a'), _lib('b', version='2'), _lib('p', components=[_lib('n')])])
+        digest(old)
+        digest(new)
+        with patch.object(_Differ, 'changed_fields', side_effect=_Differ.changed_fields) as changed_fields:
+            diff = diff_boms(old, new, memoized_digests=True)
+        # pairs with equal memoized digests - nested ones included - are not compared field by field
+        self.assertEqual([('b', 'b')], [(o.name, n.name) for (o, n), _ in changed_fields.call_args_list])
+        self.assertEqual([('purl', 'version')], [c.fields for c in diff.components_changed])
+        # a change drops the memos - of the nested item and of its parent
+        next(iter(next(c for c in new.components if c.name == 'p').components)).version = '2'
+        diff = diff_boms(old, new, memoized_digests=True)
+        self.assertEqual({'b', 'n'}, {c.new.name for c in diff.components_changed})
+
+    def test_digested_not_trusted_by_default(self) -> None:
+        old = Bom(components=[_lib('a', supplier=OrganizationalEntity(name='s'))])
+        new = Bom(components=[_lib('a', supplier=OrganizationalEntity(name='s'))])
+        digest(old)
+        digest(new)
+        # in-place changes of nested values do not drop the memos
+        next(iter(new.components)).supplier.name = 'changed'  # type:ignore[union-attr]
+        self.assertEqual([('supplier',)], [c.fields for c in diff_boms(old, new).components_changed])
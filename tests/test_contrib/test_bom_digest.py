@@ -0,0 +1,138 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+from copy import copy, deepcopy
+from pickle import dumps, loads  # nosec B403
+from unittest import TestCase
+from unittest.mock import patch
+
+from packageurl import PackageURL
+
+from cyclonedx.contrib.bom.digest import _Digester, digest
+from cyclonedx.model import HashAlgorithm, HashType, Property
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component, Pedigree
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.license import DisjunctiveLicense
+from cyclonedx.model.service import Service
+from cyclonedx.model.vulnerability import BomTarget, Vulnerability
+from tests._data.models import all_get_bom_funct_valid_immut
+
+
+def _lib(name: str, version: str = '1', **kwargs: object) -> Component:
+    return Component(name=name, version=version, purl=PackageURL('pypi', name=name, version=version),
+                     licenses=[DisjunctiveLicense(id='MIT')],
+                     hashes=[HashType(alg=HashAlgorithm.SHA_256, content='aa')],
+                     **kwargs)  # type:ignore[arg-type]
+
+
+def _bom(a_ref: str, b_ref: str) -> Bom:
+    a, b = _lib('a', bom_ref=a_ref), _lib('b', bom_ref=b_ref)
+    bom = Bom(components=[a, b], services=[Service(name='s')],
+              vulnerabilities=[Vulnerability(id='CVE-1', affects=[BomTarget(ref=b_ref)])])
+    bom.register_dependency(a, [b])
+    return bom
+
+
+class TestDigest(TestCase):
+
+    def test_stable(self) -> None:
+        self.assertEqual(digest(_lib('a')), digest(_lib('a')))
+        self.assertEqual(64, len(digest(_lib('a'))))
+        self.assertNotEqual(digest(_lib('a')), digest(_lib('a', version='2')))
+        self.assertNotEqual(digest(_lib('a')), digest(Service(name='a')))
+        self.assertEqual(digest(Service(name='s', bom_ref='x')), digest(Service(name='s', bom_ref='y')))
+
+    def test_bom_refs_are_not_content(self) -> None:
+        self.assertEqual(digest(_bom('x', 'y')), digest(_bom('p', 'q')))
+        # references resolve to the content of their targets - swapped roles differ
+        swapped = _bom('x', 'y')
+        swapped.dependencies.clear()
+        a, b = swapped.components
+        swapped.register_dependency(b, [a])
+        self.assertNotEqual(digest(_bom('x', 'y')), digest(swapped))
+
+    def test_document_properties_are_not_content(self) -> None:
+        bom1, bom2 = _bom('x', 'y'), _bom('x', 'y')
+        bom2.version = 2
+        self.assertNotEqual(bom1.serial_number, bom2.serial_number)
+        self.assertNotEqual(bom1.metadata.timestamp, bom2.metadata.timestamp)
+        self.assertEqual(digest(bom1), digest(bom2))
+        bom2.dependencies.add(Dependency(bom2.services[0].bom_ref))
+        self.assertNotEqual(digest(bom1), digest(bom2))
+
+    def test_memoized(self) -> None:
+        parent = _lib('p', components=[_lib('n')])
+        initial = digest(parent)
+        self.assertIsNotNone(parent._digest_cache)
+        self.assertEqual(initial, digest(parent))
+        parent.version = '2'
+        changed = digest(parent)
+        self.assertNotEqual(initial, changed)
+        parent.components[0].description = 'nested'
+        self.assertNotEqual(changed, digest(parent))
+        parent.components.add(_lib('m'))
+        self.assertEqual(digest(parent, memoize=False), digest(parent))
+
+    def test_memo_dropped_on_change(self) -> None:
+        nested = _lib('n')
+        parent = _lib('p', pedigree=Pedigree(ancestors=[nested]), components=[_lib('m')])
+        initial = digest(parent)
+        sha1 = HashType(alg=HashAlgorithm.SHA_1, content='bb')
+        for change, undo in (
+            (lambda: parent.hashes.add(sha1), lambda: parent.hashes.discard(sha1)),
+            (lambda: parent.tags.add('empty before'), parent.tags.clear),
+            (lambda: setattr(nested, 'description', 'in pedigree'), lambda: setattr(nested, 'description', None)),
+            (lambda: parent.components[0].properties.add(Property(name='p', value='1')),
+             parent.components[0].properties.clear),
+        ):
+            change()
+            self.assertIsNone(parent._digest_cache)
+            self.assertEqual(digest(parent, memoize=False), digest(parent))
+            self.assertNotEqual(initial, digest(parent))
+            undo()
+            self.assertEqual(initial, digest(parent))
+
+    def test_memo_not_copied(self) -> None:
+        original = _lib('a')
+        digest(original)
+        for copied in (copy(original), deepcopy(original), loads(dumps(original))):
+            copied.hashes = []
+            self.assertNotEqual(digest(original), digest(copied))
+            self.assertEqual(digest(copied, memoize=False), digest(copied))
+
+    def test_clean_items_are_not_digested_again(self) -> None:
+        bom = _bom('x', 'y')
+        with patch.object(_Digester, '_object', autospec=True, side_effect=_Digester._object) as digested:
+            digest(bom)
+            first = digested.call_count
+            digested.reset_mock()
+            digest(bom)
+            self.assertLess(digested.call_count, first)
+            self.assertFalse(any(isinstance(c.args[1], (Component, Service)) for c in digested.call_args_list))
+
+    def test_items_are_digested_once_per_bom(self) -> None:
+        bom = _bom('x', 'y')
+        with patch.object(_Digester, '_object', autospec=True, side_effect=_Digester._object) as digested:
+            digest(bom, memoize=False)
+        components = [c.args[1] for c in digested.call_args_list if isinstance(c.args[1], Component)]
+        self.assertEqual(2, len(components))
+        self.assertEqual(2, len(set(map(id, components))))
+
+    def test_all_test_boms(self) -> None:
+        for name, get_bom in all_get_bom_funct_valid_immut:
+            with self.subTest(name):
+                self.assertEqual(digest(get_bom(), memoize=False), digest(get_bom()))
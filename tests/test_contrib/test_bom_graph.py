@@ -0,0 +1,106 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from unittest import TestCase
+
+from cyclonedx.contrib.bom.graph import DependencyGraph
+from cyclonedx.exception.model import CyclicDependencyException
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.dependency import Dependency
+
+
+def _make_graph(edges: dict[str, tuple[str, ...]]) -> DependencyGraph:
+    return DependencyGraph(
+        Dependency(BomRef(s), dependencies=(Dependency(BomRef(t)) for t in ts))
+        for s, ts in edges.items())
+
+
+def _values(refs: tuple[BomRef, ...]) -> list[str]:
+    return [r.value for r in refs]  # type:ignore[misc]
+
+
+class TestDependencyGraph(TestCase):
+
+    def test_nodes_and_edges(self) -> None:
+        graph = _make_graph({'app': ('a', 'b'), 'a': ('c',), 'b': ('c',)})
+        self.assertEqual(4, len(graph))
+        self.assertEqual(4, graph.edge_count)
+        self.assertIn(BomRef('c'), graph)
+        self.assertNotIn(BomRef('x'), graph)
+        self.assertEqual(['app', 'a', 'b', 'c'], _values(graph.refs))
+        self.assertEqual(3, graph.index_of(BomRef('c')))
+        self.assertEqual(['a', 'b'], _values(graph.dependencies_of(BomRef('app'))))
+        self.assertEqual(['a', 'b'], _values(graph.dependents_of(BomRef('c'))))
+        self.assertEqual(['app'], _values(graph.roots()))
+        self.assertEqual(['c'], _values(graph.leaves()))
+        with self.assertRaises(KeyError):
+            graph.dependencies_of(BomRef('x'))
+
+    def test_flattens_and_merges_nested(self) -> None:
+        d1 = Dependency(BomRef('a'), dependencies=[
+            Dependency(BomRef('b'), dependencies=[Dependency(BomRef('c'))]),
+        ])
+        d2 = Dependency(BomRef('a'), dependencies=[Dependency(BomRef('c'))])
+        graph = DependencyGraph([d1, d2])
+        self.assertEqual(['b', 'c'], _values(graph.dependencies_of(BomRef('a'))))
+        self.assertEqual(['c'], _values(graph.dependencies_of(BomRef('b'))))
+        self.assertEqual(3, graph.edge_count)
+
+    def test_from_bom(self) -> None:
+        bom = Bom(dependencies=[Dependency(BomRef('a'), dependencies=[Dependency(BomRef('b'))])])
+        self.assertEqual(['a', 'b'], _values(DependencyGraph.from_bom(bom).refs))
+
+    def test_reachability(self) -> None:
+        graph = _make_graph({'app': ('a', 'b'), 'a': ('c',), 'b': ('c',), 'c': ('d',), 'x': ('d',)})
+        self.assertEqual(['c', 'd'], _values(graph.transitive_dependencies(BomRef('a'))))
+        self.assertEqual(['a', 'b', 'c', 'd'], _values(graph.transitive_dependencies(BomRef('app'))))
+        self.assertEqual(['c', 'x', 'a', 'b', 'app'], _values(graph.transitive_dependents(BomRef('d'))))
+        self.assertEqual(['app'], _values(graph.transitive_dependents(BomRef('a'), BomRef('b'))))
+        self.assertEqual([], _values(graph.transitive_dependents(BomRef('app'))))
+
+    def test_depths(self) -> None:
+        graph = _make_graph({'app': ('a', 'c'), 'a': ('b',), 'b': ('c',), 'x': ('y',), 'y': ('x',)})
+        self.assertEqual({'app': 0, 'a': 1, 'c': 1, 'b': 2},
+                         {r.value: d for r, d in graph.depths().items()})
+
+    def test_topological_order(self) -> None:
+        graph = _make_graph({'app': ('a', 'b'), 'a': ('c',), 'b': ('c', 'a'), 'c': ()})
+        self.assertTrue(graph.is_acyclic())
+        self.assertEqual(['c', 'a', 'b', 'app'], _values(graph.topological_order()))
+        self.assertEqual((), graph.cycles())
+
+    def test_cycles(self) -> None:
+        graph = _make_graph({'app': ('a', 's'), 'a': ('b',), 'b': ('c',), 'c': ('a', 'd'), 's': ('s',)})
+        self.assertFalse(graph.is_acyclic())
+        with self.assertRaises(CyclicDependencyException):
+            graph.topological_order()
+        self.assertEqual([{'a', 'b', 'c'}, {'s'}],
+                         [set(_values(c)) for c in graph.cycles()])
+        components = [set(_values(c)) for c in graph.strongly_connected_components()]
+        self.assertEqual([{'d'}, {'a', 'b', 'c'}, {'s'}, {'app'}], components)
+
+    def test_large(self) -> None:
+        # a long chain, plus fan-in to every link: deep enough to break recursive implementations
+        n = 20_000
+        graph = _make_graph({f'n{i}': (f'n{i + 1}', f'n{n}') for i in range(n)})
+        self.assertEqual(n + 1, len(graph))
+        self.assertEqual(2 * n - 1, graph.edge_count)
+        self.assertEqual(f'n{n}', graph.topological_order()[0].value)
+        self.assertEqual(n, len(graph.transitive_dependents(BomRef(f'n{n}'))))
+        self.assertEqual(n + 1, len(graph.strongly_connected_components()))
+        self.assertEqual(n - 1, graph.depths()[BomRef(f'n{n - 1}')])
@@ -0,0 +1,94 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from unittest import TestCase
+
+from cyclonedx.contrib.bom.impact import ImpactAnalyzer
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.vulnerability import BomTarget, Vulnerability
+
+
+def _make_bom() -> Bom:
+    # app1 -> lib1 -> util
+    # app2 -> lib2 -> lib1
+    #              -> other
+    edges = {'app1': ('lib1',), 'app2': ('lib2',), 'lib1': ('util',), 'lib2': ('lib1', 'other')}
+    return Bom(
+        dependencies=(Dependency(BomRef(s), dependencies=(Dependency(BomRef(t)) for t in ts))
+                      for s, ts in edges.items()),
+        vulnerabilities=[
+            Vulnerability(bom_ref='v1', id='CVE-1', affects=[BomTarget(ref='util')]),
+            Vulnerability(bom_ref='v2', id='CVE-2', affects=[BomTarget(ref='other'), BomTarget(ref='unknown')]),
+        ])
+
+
+def _values(refs: tuple[BomRef, ...]) -> list[str]:
+    return [r.value for r in refs]  # type:ignore[misc]
+
+
+class TestImpactAnalyzer(TestCase):
+
+    def test_impact_of(self) -> None:
+        impact = ImpactAnalyzer.from_bom(_make_bom()).impact_of([BomRef('util')])
+        self.assertEqual(['util'], _values(impact.affected))
+        self.assertEqual(['lib1', 'app1', 'lib2', 'app2'], _values(impact.dependents))
+        self.assertEqual(['app1', 'app2'], _values(impact.roots))
+        self.assertEqual({
+            'util': ['util'],
+            'lib1': ['lib1', 'util'],
+            'app1': ['app1', 'lib1', 'util'],
+            'lib2': ['lib2', 'lib1', 'util'],
+            'app2': ['app2', 'lib2', 'lib1', 'util'],
+        }, {r.value: _values(p) for r, p in impact.paths.items()})
+        self.assertEqual(['util', 'lib1', 'app1', 'lib2', 'app2'], _values(impact.impacted))
+        self.assertIn(BomRef('lib2'), impact)
+        with self.assertRaises(KeyError):
+            impact.path(BomRef('other'))
+
+    def test_shortest_path_to_any_affected(self) -> None:
+        impact = ImpactAnalyzer.from_bom(_make_bom()).impact_of(['util', 'lib2'])
+        self.assertEqual(['app2', 'lib2'], _values(impact.path(BomRef('app2'))))
+        self.assertEqual(['lib1', 'util'], _values(impact.path(BomRef('lib1'))))
+        self.assertEqual(['lib1', 'app2', 'app1'], _values(impact.dependents))
+
+    def test_unknown_and_nothing(self) -> None:
+        analyzer = ImpactAnalyzer.from_bom(_make_bom())
+        impact = analyzer.impact_of(['unknown'])
+        self.assertEqual(['unknown'], _values(impact.roots))
+        self.assertEqual((), impact.dependents)
+        self.assertFalse(analyzer.impact_of(()))
+
+    def test_impact_of_vulnerabilities(self) -> None:
+        bom = _make_bom()
+        impacts = ImpactAnalyzer.from_bom(bom).impact_of_vulnerabilities(bom.vulnerabilities)
+        self.assertEqual({
+            'CVE-1': ['app1', 'app2'],
+            'CVE-2': ['unknown', 'app2'],
+        }, {v.id: _values(i.roots) for v, i in impacts.items()})
+
+    def test_caches_closures(self) -> None:
+        analyzer = ImpactAnalyzer.from_bom(_make_bom(), cache_size=2)
+        first = analyzer.impact_of(['util'])
+        closure = analyzer._closures[analyzer.graph.index_of(BomRef('util'))]
+        self.assertEqual(first.impacted, analyzer.impact_of(['util']).impacted)
+        self.assertIs(closure, analyzer._closures[analyzer.graph.index_of(BomRef('util'))])
+        analyzer.impact_of(['lib1', 'lib2'])
+        self.assertEqual(2, len(analyzer._closures))
+        analyzer.clear_cache()
+        self.assertEqual({}, analyzer._closures)
@@ -0,0 +1,154 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from collections.abc import Iterator
+from unittest import TestCase
+
+from packageurl import PackageURL
+
+from cyclonedx.contrib.bom.merge import BomMerger, merge_boms
+from cyclonedx.model import HashAlgorithm, HashType
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.service import Service
+from cyclonedx.model.tool import Tool
+from cyclonedx.model.vulnerability import BomTarget, Vulnerability
+from cyclonedx.output.json import JsonV1Dot6
+
+
+def _make_bom(app: str, *libs: Component, vulnerable: str = '') -> Bom:
+    bom = Bom(components=libs)
+    bom.metadata.component = root = Component(name=app, bom_ref=app)
+    bom.metadata.tools.tools.add(Tool(name=f'{app}-tool'))
+    bom.register_dependency(root, libs)
+    if vulnerable:
+        bom.vulnerabilities.add(Vulnerability(bom_ref='v', id='CVE-1', affects=[BomTarget(ref=vulnerable)]))
+    return bom
+
+
+def _deps(bom: Bom) -> dict[str, list[str]]:
+    return {d.ref.value: sorted(t.ref.value for t in d.dependencies)  # type:ignore[misc]
+            for d in bom.dependencies}
+
+
+class TestBomMerger(TestCase):
+
+    def test_dedupes_by_purl(self) -> None:
+        bom = merge_boms([
+            _make_bom('app1', Component(name='lib', bom_ref='lib-a', purl=PackageURL('pypi', name='lib'))),
+            _make_bom('app2', Component(name='lib', bom_ref='lib-b', purl=PackageURL('pypi', name='lib'))),
+        ])
+        self.assertEqual(['app1', 'app2', 'lib'], sorted(c.name for c in bom.components))
+        self.assertEqual({'app1': ['lib-a'], 'app2': ['lib-a'], 'lib-a': []}, _deps(bom))
+        self.assertEqual(['app1-tool', 'app2-tool'], [t.name for t in bom.metadata.tools.tools])
+
+    def test_dedupes_by_name_version_hashes(self) -> None:
+        def lib(ref: str, content: str) -> Component:
+            return Component(name='lib', version='1', bom_ref=ref,
+                             hashes=[HashType(alg=HashAlgorithm.SHA_256, content=content)])
+
+        bom = merge_boms([_make_bom('app1', lib('l1', 'aa')),
+                          _make_bom('app2', lib('l2', 'aa')),
+                          _make_bom('app3', lib('l3', 'bb'))])
+        self.assertEqual(['l1', 'l3'], sorted(c.bom_ref.value for c in bom.components if c.name == 'lib'))
+        self.assertEqual(['l1'], _deps(bom)['app2'])
+
+    def test_rewrites_colliding_refs(self) -> None:
+        bom1 = _make_bom('app1', Component(name='a', bom_ref='lib'), vulnerable='lib')
+        bom2 = _make_bom('app2', Component(name='b', bom_ref='lib'), vulnerable='lib')
+        for v in bom2.vulnerabilities:
+            v.id = 'CVE-2'
+        bom = merge_boms([bom1, bom2])
+        refs = {c.name: c.bom_ref.value for c in bom.components}
+        self.assertEqual({'app1': 'app1', 'app2': 'app2', 'a': 'lib', 'b': 'lib-1'}, refs)
+        self.assertEqual(['lib'], _deps(bom)['app1'])
+        self.assertEqual(['lib-1'], _deps(bom)['app2'])
+        self.assertEqual({'CVE-1': ['lib'], 'CVE-2': ['lib-1']},
+                         {v.id: [t.ref for t in v.affects] for v in bom.vulnerabilities})
+        self.assertEqual(['v', 'v-1'], [v.bom_ref.value for v in bom.vulnerabilities])
+        bom.validate()
+        JsonV1Dot6(bom).output_as_string()
+
+    def test_rewrites_chained_collisions(self) -> None:
+        # the rewritten value of `x` collides with the original value of `y`
+        bom2 = Bom(components=[Component(name='x', bom_ref='a'), Component(name='y', bom_ref='a-1'),
+                               Component(name='z', bom_ref='z')])
+        x, y, z = sorted(bom2.components, key=lambda c: c.name)
+        bom2.register_dependency(x, [z])
+        bom2.register_dependency(y)
+        bom = merge_boms([Bom(components=[Component(name='w', bom_ref='a')]), bom2])
+        refs = {c.name: c.bom_ref.value for c in bom.components}
+        self.assertEqual({'w': 'a', 'x': 'a-1', 'y': 'a-1-1', 'z': 'z'}, refs)
+        self.assertEqual({'a-1': ['z'], 'a-1-1': [], 'z': []}, _deps(bom))
+
+    def test_merges_vulnerabilities(self) -> None:
+        bom = merge_boms([
+            _make_bom('app1', Component(name='a', bom_ref='a'), vulnerable='a'),
+            _make_bom('app2', Component(name='b', bom_ref='b'), vulnerable='b'),
+        ])
+        vulnerability, = bom.vulnerabilities
+        self.assertEqual(['a', 'b'], [t.ref for t in vulnerability.affects])
+
+    def test_dedupes_nested_and_services(self) -> None:
+        def parent(ref: str) -> Component:
+            return Component(name='parent', bom_ref=f'p-{ref}', components=[Component(name='child', bom_ref=ref)])
+
+        parent2 = parent('c2')
+        service2 = Service(name='s', bom_ref='s2')
+        bom1 = _make_bom('app1', parent('c1'))
+        bom2 = _make_bom('app2', parent2)
+        bom1.services.add(Service(name='s', bom_ref='s1'))
+        bom2.services.add(service2)
+        bom2.register_dependency(next(iter(parent2.components)), [service2])
+        bom = merge_boms([bom1, bom2])
+        self.assertEqual(['app1', 'app2', 'parent'], sorted(c.name for c in bom.components))
+        self.assertEqual(['s1'], [s.bom_ref.value for s in bom.services])
+        self.assertEqual(['s1'], _deps(bom)['c1'])
+
+    def test_keeps_nested_of_duplicates(self) -> None:
+        def lib(*nested: Component) -> Component:
+            return Component(name='a', version='1', bom_ref='a', purl=PackageURL('pypi', 'a', '1'),
+                             components=nested)
+
+        bom1 = _make_bom('app1', lib(Component(name='x', bom_ref='x')))
+        nested = Component(name='y', bom_ref='y', components=[Component(name='z', bom_ref='z')])
+        duplicate = lib(Component(name='x', bom_ref='x'), nested)
+        bom2 = _make_bom('app2', duplicate)
+        bom2.register_dependency(duplicate, [nested])
+        bom = merge_boms([bom1, bom2])
+        kept, = (c for c in bom.components if c.name == 'a')
+        self.assertEqual(['x', 'y'], [c.name for c in kept.components])
+        self.assertEqual(['z'], [c.name for c in next(c for c in kept.components if c.name == 'y').components])
+        self.assertEqual(['y'], _deps(bom)['a'])
+        JsonV1Dot6(bom).output_as_string()  # all dependencies are known
+
+    def test_product_and_stream(self) -> None:
+        product = Component(name='product', bom_ref='app1')
+        released = []
+
+        def boms() -> Iterator[Bom]:
+            for i in (1, 2):
+                bom = _make_bom(f'app{i}')
+                yield bom
+                released.append(bom)
+
+        merger = BomMerger(product)
+        merger.add_all(boms())
+        bom = merger.to_bom()
+        self.assertIs(product, bom.metadata.component)
+        self.assertEqual(2, len(released))
+        self.assertEqual(['app1-1', 'app2'], _deps(bom)['app1'])
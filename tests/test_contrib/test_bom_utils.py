@@ -18,9 +18,10 @@
 
 from unittest import TestCase
 
-from cyclonedx.contrib.bom.utils import BomDependencyGraphFlatMerger, BomRefDiscriminator
+from cyclonedx.contrib.bom.utils import BomDependencyGraphFlatMerger, BomRefDiscriminator, BomSerializationView
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.component import Component
 from cyclonedx.model.dependency import Dependency
 
 
@@ -49,6 +50,25 @@ class TestBomRefDiscriminator(TestCase):
         self.assertEqual('djdlkfjdslkf', bomref1.value)
         self.assertEqual('djdlkfjdslkf', bomref2.value)
 
+    def test_discriminate_many(self) -> None:
+        bomrefs = [BomRef(f'ref{i % 100}' if i % 3 else None) for i in range(3000)]
+        original_values = [br.value for br in bomrefs]
+        with BomRefDiscriminator(bomrefs):
+            values = [br.value for br in bomrefs]
+            self.assertNotIn(None, values)
+            self.assertEqual(len(bomrefs), len(set(values)), 'should be discriminated')
+            # first occurrences keep their values
+            self.assertEqual([f'ref{i}' for i in range(100) if i % 3],
+                             [values[i] for i in range(100) if i % 3])
+        self.assertEqual(original_values, [br.value for br in bomrefs])
+
+    def test_substitutes(self) -> None:
+        bomrefs = [BomRef('a'), BomRef('a'), BomRef(), BomRef('b')]
+        substitutes = BomRefDiscriminator(bomrefs).substitutes()
+        self.assertEqual({id(bomrefs[1]), id(bomrefs[2])}, set(substitutes))
+        self.assertEqual(2, len({'a', 'b', *substitutes.values()}) - 2)
+        self.assertEqual(['a', 'a', None, 'b'], [br.value for br in bomrefs], 'not modified')
+
 
 class TestBomDependencyGraphFlatMerger(TestCase):
 
@@ -188,3 +208,49 @@ class TestBomDependencyGraphFlatMerger(TestCase):
             }, bom.dependencies)
         self.assertIs(bom_dependencies, bom.dependencies)
         self.assertSetEqual(bom_dependencies, bom.dependencies)
+
+
+class TestBomSerializationView(TestCase):
+
+    def test_not_modified(self) -> None:
+        c1, c2, c3 = Component(name='c1', bom_ref='x'), Component(name='c2', bom_ref='x'), Component(name='c3')
+        bom = Bom(components=[c1, c2, c3])
+        bom.register_dependency(c1, [c2])
+        dependencies = bom.dependencies
+        view = BomSerializationView(bom)
+        view.validate()
+        self.assertEqual(['x', 'x', None], [c.bom_ref.value for c in (c1, c2, c3)])
+        self.assertIs(dependencies, bom.dependencies)
+        self.assertEqual(1, len(bom.dependencies))
+        # c3 is missing in the graph - like `Bom.validate()` would register it
+        self.assertEqual(2, len(view.dependencies))
+        values = [view.value_of(c.bom_ref) for c in (c1, c2, c3)]
+        self.assertNotIn(None, values)
+        self.assertEqual(3, len(set(values)), 'should be discriminated')
+        self.assertIn('x', values)
+
+    def test_flat_dependencies(self) -> None:
+        c1, c2 = Component(name='c1', bom_ref='x'), Component(name='c2', bom_ref='x')
+        bom = Bom(components=[c1, c2], dependencies=[
+            Dependency(c1.bom_ref, [Dependency(c2.bom_ref, [Dependency(c1.bom_ref)])]),
+        ])
+        view = BomSerializationView(bom)
+        flat = view.flat_dependencies()
+        # equal original values are distinct nodes, after all
+        self.assertEqual(2, len(flat))
+        self.assertEqual(sorted(view.value_of(c.bom_ref) or '' for c in (c1, c2)),
+                         [view.value_of(d.ref) for d in flat])
+        self.assertEqual({d.ref: [t.ref for t in d.dependencies] for d in flat},
+                         {c1.bom_ref: [c2.bom_ref], c2.bom_ref: [c1.bom_ref]})
+        shell = view.shell(flatten=True)
+        self.assertIsNot(bom, shell)
+        self.assertEqual(flat, list(shell.dependencies))
+        self.assertEqual(1, len(bom.dependencies))
+
+    def test_serialization(self) -> None:
+        component = Component(name='c')
+        view = BomSerializationView(Bom(components=[component]))
+        with view.serialization() as shell:
+            self.assertIs(component, shell.components[0])
+            self.assertEqual(view.value_of(component.bom_ref), BomRef.serialize(component.bom_ref))
+        self.assertIsNone(BomRef.serialize(component.bom_ref))
@@ -0,0 +1,103 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from io import BytesIO
+from itertools import product
+from os.path import join
+from tempfile import TemporaryDirectory
+from typing import Any, Optional
+from unittest import TestCase
+from xml.etree.ElementTree import ParseError  # nosec B405
+
+from ddt import data, ddt, unpack
+
+from cyclonedx.exception.serialization import CycloneDxDeserializationException
+from cyclonedx.input import load
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.output import make_outputter
+from cyclonedx.schema import OutputFormat, SchemaVersion
+
+
+def _make_bom() -> Bom:
+    return Bom(components=(Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(3)))
+
+
+@ddt
+class TestLoad(TestCase):
+
+    def setUp(self) -> None:
+        self._tmpdir = TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = join(self._tmpdir.name, name)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    @data(*product(OutputFormat, (SchemaVersion.V1_2, SchemaVersion.V1_6), (None, 'gzip', 'xz')))
+    @unpack
+    def test_detected(self, output_format: OutputFormat, schema_version: SchemaVersion,
+                      compression: Optional[Any]) -> None:
+        path = join(self._tmpdir.name, 'bom')
+        outputter = make_outputter(_make_bom(), output_format, schema_version)
+        outputter.output_to_file(path, compression=compression)
+        bom = load(path, validate=True)
+        self.assertEqual(['c0', 'c1', 'c2'], [c.name for c in bom.components])
+
+    @data(*OutputFormat)
+    def test_stream(self, output_format: OutputFormat) -> None:
+        stream = BytesIO()
+        make_outputter(_make_bom(), output_format, SchemaVersion.V1_6).output_to_compressed_stream(stream, 'bz2')
+        stream.seek(0)
+        bom = load(stream, validate=True)
+        self.assertEqual(['c0', 'c1', 'c2'], [c.name for c in bom.components])
+        self.assertFalse(stream.closed)
+
+    def test_from_file(self) -> None:
+        path = self._write('bom.json', b'\xef\xbb\xbf \n{"bomFormat": "CycloneDX", "specVersion": "1.6",'
+                                       b' "components": [{"type": "library", "name": "a"}]}')
+        bom = Bom.from_file(path, sections=('components',))
+        self.assertEqual(['a'], [c.name for c in bom.components])
+
+    def test_given_format(self) -> None:
+        path = self._write('bom', b'{}')
+        self.assertEqual([], list(load(path, output_format=OutputFormat.JSON).components))
+        with self.assertRaises(ParseError):
+            load(path, output_format=OutputFormat.XML)
+
+    @data(b'', b'  ', b'[]', b'CycloneDX')
+    def test_unknown_format(self, content: bytes) -> None:
+        path = self._write('bom', content)
+        with self.assertRaisesRegex(CycloneDxDeserializationException, 'Unknown document format'):
+            load(path)
+
+    @data(
+        (b'{"bomFormat": "CycloneDX"}', 'unknown schema version'),
+        (b'{"bomFormat": "CycloneDX", "specVersion": "0.9"}', 'unknown schema version'),
+        (b'<bom xmlns="http://example.com/bom/1.6"/>', 'unknown schema version'),
+        (b'{"bomFormat": "SPDX", "specVersion": "1.6"}', 'Invalid JSON document for schema version 1.6'),
+        (b'<bom xmlns="http://cyclonedx.org/schema/bom/1.5" version="x"/>',
+         'Invalid XML document for schema version 1.5'),
+    )
+    @unpack
+    def test_invalid(self, content: bytes, message: str) -> None:
+        path = self._write('bom', content)
+        with self.assertRaisesRegex(CycloneDxDeserializationException, message):
+            load(path, validate=True)
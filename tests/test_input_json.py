@@ -0,0 +1,235 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from collections.abc import Callable
+from copy import copy, deepcopy
+from io import BytesIO
+from json import JSONDecodeError
+from pickle import dumps, loads  # nosec B403
+from tracemalloc import get_traced_memory, start as start_tracemalloc, stop as stop_tracemalloc
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from ddt import data, ddt, named_data
+
+from cyclonedx.exception.serialization import CycloneDxDeserializationException
+from cyclonedx.input import _populate
+from cyclonedx.input.json import LazyComponent, _JsonStream, iter_json, load_json
+from cyclonedx.model import Property
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.output.json import JsonV1Dot6, JsonV1Dot7
+from cyclonedx.output.xml import XmlV1Dot7
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from tests import DeepCompareMixin, SnapshotMixin, mksname
+from tests._data.models import (
+    all_get_bom_funct_valid_immut,
+    all_get_bom_funct_valid_reversible_migrate,
+    all_get_bom_funct_with_incomplete_deps,
+)
+
+_LATEST_SCHEMA = SchemaVersion.V1_7
+
+
+def _make_document(n: int) -> bytes:
+    bom = Bom(components=(Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(n)))
+    for c in bom.components:
+        bom.register_dependency(c)
+    return JsonV1Dot6(bom).output_as_string(indent=2).encode()
+
+
+def _make_nested_document() -> bytes:
+    bom = Bom(components=[Component(name='a', bom_ref='a', properties=[Property(name='p', value='1')],
+                                    components=[Component(name='b', properties=[Property(name='p', value='2')])])])
+    bom.metadata.properties.add(Property(name='m', value='3'))
+    bom.register_dependency(bom.components[0])
+    return JsonV1Dot6(bom).output_as_string().encode()
+
+
+@ddt
+class TestLoadJson(TestCase, SnapshotMixin, DeepCompareMixin):
+
+    @named_data(*all_get_bom_funct_valid_immut,
+                *all_get_bom_funct_valid_reversible_migrate)
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_prepared(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, _LATEST_SCHEMA, OutputFormat.JSON)
+        expected = get_bom()
+        bom = load_json(self.getSnapshotFile(snapshot_name))
+        self.assertBomDeepEqual(expected, bom,
+                                fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
+    @named_data(*all_get_bom_funct_valid_immut)
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_tiny_chunks(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        # every token and every multibyte character may be split between chunks
+        snapshot_name = mksname(get_bom, _LATEST_SCHEMA, OutputFormat.JSON)
+        expected = get_bom()
+        stream = _JsonStream(self.getSnapshotFile(snapshot_name), chunk_size=3)
+        items = list(stream)
+        bom = _populate(Bom.from_json(stream.rest), items)  # type:ignore[attr-defined]
+        self.assertBomDeepEqual(expected, bom,
+                                fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
+    def test_sections(self) -> None:
+        bom = load_json(BytesIO(_make_nested_document()), sections={'dependencies'})
+        self.assertEqual(0, len(bom.components))
+        self.assertEqual(0, len(bom.metadata.properties))
+        self.assertEqual(['a'], [d.ref.value for d in bom.dependencies])
+
+    def test_skip_fields(self) -> None:
+        bom = load_json(BytesIO(_make_nested_document()), skip_fields={'properties'})
+        component, = bom.components
+        nested, = component.components
+        self.assertEqual(('a', 'b'), (component.name, nested.name))
+        self.assertEqual(0, len(component.properties))
+        self.assertEqual(0, len(nested.properties))
+        self.assertEqual(1, len(bom.metadata.properties))
+
+    def test_skipping_bounds_memory(self) -> None:
+        # skipped parts are scanned - not decoded
+        description = 'x' * (4 * 1024 * 1024)
+        document = JsonV1Dot6(Bom(components=[
+            Component(name='a', description=description),
+            Component(name='b', description=description),
+        ])).output_as_string().encode()
+        for sections, skip_fields in (({'metadata'}, ()), (None, {'description'})):
+            with self.subTest(sections=sections, skip_fields=skip_fields):
+                start_tracemalloc()
+                try:
+                    bom = load_json(BytesIO(document), sections=sections, skip_fields=skip_fields)
+                    _, peak = get_traced_memory()
+                finally:
+                    stop_tracemalloc()
+                self.assertLess(peak, 1024 * 1024)
+                self.assertTrue(all(c.description is None for c in bom.components))
+
+
+@ddt
+class TestLazyComponent(TestCase, SnapshotMixin):
+
+    @named_data(*all_get_bom_funct_valid_immut)
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_serializes_like_component(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, _LATEST_SCHEMA, OutputFormat.JSON)
+        expected = load_json(self.getSnapshotFile(snapshot_name))
+        self.assertEqual(JsonV1Dot7(expected).output_as_string(),
+                         JsonV1Dot7(load_json(self.getSnapshotFile(snapshot_name), lazy=True)).output_as_string())
+        self.assertEqual(XmlV1Dot7(expected).output_as_string(),
+                         XmlV1Dot7(load_json(self.getSnapshotFile(snapshot_name), lazy=True)).output_as_string())
+
+    def test_materializes_on_demand(self) -> None:
+        document = _make_nested_document()
+        bom = load_json(BytesIO(document), lazy=True)
+        component, = bom.components
+        self.assertIsInstance(component, LazyComponent)
+        assert isinstance(component, LazyComponent)  # for mypy
+        nested, = component.components
+        self.assertIsInstance(nested, LazyComponent)
+        self.assertIs(component, bom.get_component_by_bom_ref('a'))
+        self.assertEqual(('a', 'b'), (component.name, nested.name))
+        self.assertFalse(component.is_materialized)
+        bom_ref = component.bom_ref
+        self.assertEqual(['1'], [p.value for p in component.properties])
+        self.assertTrue(component.is_materialized)
+        self.assertIs(bom_ref, component.bom_ref)
+        self.assertIs(nested, next(iter(component.components)))
+        self.assertEqual(load_json(BytesIO(document)).components, bom.components)
+
+    def test_copy(self) -> None:
+        component = LazyComponent({'name': 'a', 'description': 'foo'})
+        for copied in (copy(component), deepcopy(component), loads(dumps(component))):  # nosec B301
+            self.assertIsInstance(copied, LazyComponent)
+            self.assertEqual('foo', copied.description)
+            self.assertEqual(component, copied)
+
+    def test_unknown_attribute(self) -> None:
+        with self.assertRaises(AttributeError):
+            LazyComponent({'name': 'a'}).unknown_attribute  # type:ignore[attr-defined]
+
+    def test_invalid(self) -> None:
+        with self.assertRaisesRegex(CycloneDxDeserializationException, 'Invalid component data'):
+            LazyComponent({'type': 'library'})
+        with self.assertRaisesRegex(CycloneDxDeserializationException, 'Invalid component data'):
+            LazyComponent({'name': 'a', 'type': 'unknown'})
+        with self.assertRaisesRegex(CycloneDxDeserializationException, 'Invalid component data'):
+            load_json(BytesIO(b'{"components": [{"name": "a", "components": [{"type": "library"}]}]}'), lazy=True)
+        component = LazyComponent({'name': 'a', 'scope': 'unknown'})
+        with self.assertRaisesRegex(CycloneDxDeserializationException, 'Invalid component data'):
+            component.scope
+
+
+@ddt
+class TestIterJson(TestCase):
+
+    def test_items_in_order(self) -> None:
+        items = list(iter_json(BytesIO(_make_document(3))))
+        self.assertEqual(['c0', 'c1', 'c2'], [i.name for i in items if isinstance(i, Component)])
+        self.assertEqual(['c0', 'c1', 'c2'], [i.ref.value for i in items if isinstance(i, Dependency)])
+        self.assertEqual(6, len(items))
+
+    @data('gzip', 'bz2', 'xz')
+    def test_compressed(self, compression: Any) -> None:
+        bom = Bom(components=(Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(3)))
+        stream = BytesIO()
+        JsonV1Dot6(bom).output_to_compressed_stream(stream, compression)
+        self.assertNotEqual(b'{', stream.getvalue()[:1])
+        stream.seek(0)
+        items = list(iter_json(stream))
+        self.assertEqual(['c0', 'c1', 'c2'], [i.name for i in items if isinstance(i, Component)])
+        self.assertFalse(stream.closed)
+
+    def test_scalars_across_chunks(self) -> None:
+        stream = _JsonStream(BytesIO(b'\xef\xbb\xbf{"version":12345,"components":[],"x":[1,2]}'), chunk_size=1)
+        self.assertEqual([], list(stream))
+        self.assertEqual({'version': 12345, 'x': [1, 2]}, stream.rest)
+
+    @data(1, 2, 3, 64 * 1024)
+    def test_skip(self, chunk_size: int) -> None:
+        document = (b'{"x": {"a": "b\\"]}\\\\", "c": [1, {"d": "\\u005d"}, []], "e": null}, "y": "[{",'
+                    b' "components": [{"name": "a", "evidence": {"f": ["}"]}, "components": [{"name": "b",'
+                    b' "evidence": "\\\\"}]}], "z": true}')
+        stream = _JsonStream(BytesIO(document), sections={'components', 'z'}, skip_fields={'evidence'},
+                             chunk_size=chunk_size)
+        component, = (item for _, item in stream)
+        self.assertEqual(('a', 'b'), (component.name, component.components[0].name))
+        self.assertEqual({'z': True}, stream.rest)
+
+    @data(
+        b'{"x": "a',
+        b'{"x": "a\\',
+        b'{"x": [{"a": "]"}',
+        b'{"x": ,}',
+    )
+    def test_skip_malformed(self, document: bytes) -> None:
+        with self.assertRaises(JSONDecodeError):
+            list(_JsonStream(BytesIO(document), sections=(), chunk_size=2))
+
+    @data(
+        b'',
+        b'[]',
+        b'{"components":[',
+        b'{"components":[]',
+        b'{"version":1}}',
+        b'{"version":1 "x":2}',
+    )
+    def test_malformed(self, document: bytes) -> None:
+        with self.assertRaises(JSONDecodeError):
+            list(iter_json(BytesIO(document)))
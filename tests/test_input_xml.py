@@ -0,0 +1,131 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from collections.abc import Callable
+from io import BytesIO
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from ddt import data, ddt, named_data
+
+from cyclonedx.input.xml import _XmlStream, iter_xml, load_xml
+from cyclonedx.model import Property
+from cyclonedx.model.bom import Bom
+from cyclonedx.model.component import Component
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.output.xml import XmlV1Dot6
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from tests import DeepCompareMixin, SnapshotMixin, mksname
+from tests._data.models import (
+    all_get_bom_funct_valid_immut,
+    all_get_bom_funct_valid_reversible_migrate,
+    all_get_bom_funct_with_incomplete_deps,
+    get_bom_with_nested_services,
+)
+
+_LATEST_SCHEMA = SchemaVersion.V1_7
+
+
+def _make_document(n: int) -> bytes:
+    bom = Bom(components=(Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(n)))
+    for c in bom.components:
+        bom.register_dependency(c)
+    return XmlV1Dot6(bom).output_as_string().encode()
+
+
+def _make_nested_document() -> bytes:
+    bom = Bom(components=[Component(name='a', bom_ref='a', properties=[Property(name='p', value='1')],
+                                    components=[Component(name='b', properties=[Property(name='p', value='2')])])])
+    bom.metadata.properties.add(Property(name='m', value='3'))
+    bom.register_dependency(bom.components[0])
+    return XmlV1Dot6(bom).output_as_string().encode()
+
+
+@ddt
+class TestLoadXml(TestCase, SnapshotMixin, DeepCompareMixin):
+
+    @named_data(*all_get_bom_funct_valid_immut,
+                *all_get_bom_funct_valid_reversible_migrate)
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_prepared(self, get_bom: Callable[[], Bom], *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, _LATEST_SCHEMA, OutputFormat.XML)
+        expected = get_bom()
+        bom = load_xml(self.getSnapshotFile(snapshot_name))
+        self.assertBomDeepEqual(expected, bom,
+                                fuzzy_deps=get_bom in all_get_bom_funct_with_incomplete_deps)
+
+    def test_equals_from_xml(self) -> None:
+        with open(self.getSnapshotFile(mksname(get_bom_with_nested_services, _LATEST_SCHEMA, OutputFormat.XML))) as s:
+            expected = Bom.from_xml(s)
+        with open(self.getSnapshotFile(mksname(get_bom_with_nested_services, _LATEST_SCHEMA, OutputFormat.XML)),
+                  'rb') as s:
+            bom = load_xml(s)
+        self.assertBomDeepEqual(expected, bom)
+
+    def test_sections(self) -> None:
+        bom = load_xml(BytesIO(_make_nested_document()), sections={'dependencies'})
+        self.assertEqual(0, len(bom.components))
+        self.assertEqual(0, len(bom.metadata.properties))
+        self.assertEqual(['a'], [d.ref.value for d in bom.dependencies])
+
+    def test_skip_fields(self) -> None:
+        bom = load_xml(BytesIO(_make_nested_document()), skip_fields={'properties'})
+        component, = bom.components
+        nested, = component.components
+        self.assertEqual(('a', 'b'), (component.name, nested.name))
+        self.assertEqual(0, len(component.properties))
+        self.assertEqual(0, len(nested.properties))
+        self.assertEqual(1, len(bom.metadata.properties))
+
+
+@ddt
+class TestIterXml(TestCase):
+
+    def test_items_in_order(self) -> None:
+        items = list(iter_xml(BytesIO(_make_document(3))))
+        self.assertEqual(['c0', 'c1', 'c2'], [i.name for i in items if isinstance(i, Component)])
+        self.assertEqual(['c0', 'c1', 'c2'], [i.ref.value for i in items if isinstance(i, Dependency)])
+        self.assertEqual(6, len(items))
+
+    @data('gzip', 'bz2', 'xz')
+    def test_compressed(self, compression: Any) -> None:
+        bom = Bom(components=(Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(3)))
+        stream = BytesIO()
+        XmlV1Dot6(bom).output_to_compressed_stream(stream, compression, indent=2)
+        stream.seek(0)
+        items = list(iter_xml(stream))
+        self.assertEqual(['c0', 'c1', 'c2'], [i.name for i in items if isinstance(i, Component)])
+
+    def test_discards_processed_elements(self) -> None:
+        stream = _XmlStream(BytesIO(_make_document(2000)))
+
+        def count_items() -> int:
+            assert stream.root is not None
+            return sum(len(section) for section in stream.root
+                       if section.tag.endswith(('}components', '}dependencies')))
+
+        # the parser reads ahead in chunks - so some items exist in advance, but never all of them
+        self.assertLess(max(count_items() for _ in stream), 2000)
+        self.assertEqual(0, count_items())
+
+    def test_without_namespace(self) -> None:
+        document = b'<bom version="1"><components><component type="library"><name>foo</name></component>' \
+                   b'</components></bom>'
+        bom = load_xml(BytesIO(document))
+        self.assertEqual(['foo'], [c.name for c in bom.components])
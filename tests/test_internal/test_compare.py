@@ -15,11 +15,13 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+from threading import Thread
 from unittest import TestCase
 
 from packageurl import PackageURL
 
-from cyclonedx._internal.compare import ComparablePackageURL
+from cyclonedx._internal.compare import CachedComparable, ComparablePackageURL, ComparableTuple, cached_comparison
+from cyclonedx._internal.observe import ObservedSortedSet
 
 
 class TestComparablePackageURL(TestCase):
@@ -41,3 +43,90 @@ class TestComparablePackageURL(TestCase):
         purl1 = ComparablePackageURL(PackageURL(type='pypi', name='foo', version='1.0.0'))
         purl2 = ComparablePackageURL(PackageURL(type='pypi', name='foo', version='1.0.0'))
         self.assertEqual(purl1, purl2)
+
+
+class _Cached(CachedComparable):
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.makes = 0
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+        self.changed()
+
+    def __make(self) -> ComparableTuple:
+        self.__dict__['makes'] += 1
+        return ComparableTuple((self.value,))
+
+    def comparable_tuple(self) -> ComparableTuple:
+        return self._cached_comparable_tuple(self.__make)
+
+    def __hash__(self) -> int:
+        return self._cached_hash(self.comparable_tuple)
+
+
+class TestCachedComparable(TestCase):
+
+    def test_not_cached_by_default(self) -> None:
+        o = _Cached(1)
+        o.comparable_tuple()
+        o.comparable_tuple()
+        self.assertEqual(2, o.makes)
+
+    def test_cached_in_context(self) -> None:
+        o = _Cached(1)
+        with cached_comparison():
+            self.assertEqual((1,), o.comparable_tuple())
+            self.assertEqual(hash(ComparableTuple((1,))), hash(o))
+            self.assertEqual((1,), o.comparable_tuple())
+            self.assertEqual(1, o.makes)
+        o.comparable_tuple()
+        self.assertEqual(2, o.makes)
+
+    def test_invalidated_by_assignment(self) -> None:
+        o = _Cached(1)
+        other = _Cached(5)
+        with cached_comparison():
+            self.assertEqual((1,), o.comparable_tuple())
+            o.value = 2
+            self.assertEqual((2,), o.comparable_tuple())
+            self.assertEqual(hash(ComparableTuple((2,))), hash(o))
+            other.value = 3
+            self.assertEqual((2,), o.comparable_tuple())
+            self.assertEqual(3, o.makes, 'assignment on any observed object invalidates')
+
+    def test_invalidated_by_collection_change(self) -> None:
+        o = _Cached(1)
+        collection = ObservedSortedSet()
+        with cached_comparison():
+            o.comparable_tuple()
+            collection.add(1)
+            o.comparable_tuple()
+            self.assertEqual(2, o.makes, 'change of any observed collection invalidates')
+
+    def test_scoped_per_thread(self) -> None:
+        o = _Cached(1)
+        with cached_comparison():
+            o.comparable_tuple()
+            thread = Thread(target=o.comparable_tuple)
+            thread.start()
+            thread.join()
+            self.assertEqual(2, o.makes, 'not cached in other threads')
+            o.comparable_tuple()
+            self.assertEqual(2, o.makes)
+
+    def test_nested_contexts(self) -> None:
+        o = _Cached(1)
+        with cached_comparison():
+            with cached_comparison():
+                o.comparable_tuple()
+            o.comparable_tuple()
+            self.assertEqual(1, o.makes, 'nested contexts share the cache')
+        o.comparable_tuple()
+        self.assertEqual(2, o.makes)
@@ -0,0 +1,84 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+import sys
+from os.path import dirname, realpath
+from subprocess import run  # nosec B404
+from unittest import TestCase
+
+from cyclonedx._internal.deprecation import deprecated
+
+_ROOT = dirname(dirname(dirname(realpath(__file__))))
+
+# heavy modules that are not needed for building a Bom - they must be imported on demand only
+_NOT_IMPORTED_BY_MODEL = (
+    'asyncio',
+    'cyclonedx.contrib',
+    'cyclonedx.input',
+    'cyclonedx.output',
+    'cyclonedx.spdx',
+    'cyclonedx.validation',
+    'jsonschema',
+    'license_expression',
+    'lxml',
+)
+
+
+class TestDeprecated(TestCase):
+
+    def test_function(self) -> None:
+        @deprecated('use bar()')
+        def foo(a: int) -> int:
+            """Foo"""
+            return a + 1
+
+        with self.assertWarnsRegex(DeprecationWarning, r'^use bar\(\)$') as cm:
+            self.assertEqual(2, foo(1))
+        self.assertEqual(__file__, cm.filename)
+        self.assertEqual('use bar()', foo.__deprecated__)  # type:ignore[attr-defined]
+        self.assertEqual(('foo', 'Foo'), (foo.__name__, foo.__doc__))
+
+    def test_method(self) -> None:
+        class Foo:
+            @staticmethod
+            @deprecated('use bar()', category=FutureWarning)
+            def foo() -> int:
+                return 1
+
+        with self.assertWarnsRegex(FutureWarning, r'^use bar\(\)$'):
+            self.assertEqual(1, Foo.foo())
+
+    def test_class(self) -> None:
+        @deprecated('use Bar')
+        class Foo:
+            pass
+
+        with self.assertWarnsRegex(DeprecationWarning, '^use Bar$'):
+            Foo()
+        self.assertEqual('use Bar', Foo.__deprecated__)  # type:ignore[attr-defined]
+
+
+class TestImportOfModel(TestCase):
+
+    def test_heavy_modules_not_imported(self) -> None:
+        # in a fresh interpreter - this one has imported everything already
+        res = run([sys.executable, '-c', 'import sys, cyclonedx.model.bom; print(*sys.modules)'],  # nosec B603
+                  cwd=_ROOT, capture_output=True, text=True, check=True)
+        imported = res.stdout.split()
+        self.assertIn('cyclonedx.model.bom', imported)
+        self.assertEqual([], [m for m in imported
+                              if any(m == n or m.startswith(f'{n}.') for n in _NOT_IMPORTED_BY_MODEL)])
@@ -0,0 +1,68 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from collections.abc import Callable
+from enum import Enum
+from json import dumps as json_dumps, loads as json_loads
+from typing import Any
+from unittest import TestCase
+from warnings import catch_warnings, simplefilter
+
+from ddt import data, ddt, named_data, unpack
+
+from cyclonedx._internal.json import normalize
+from cyclonedx.model.bom import Bom
+from cyclonedx.schema import SchemaVersion
+from cyclonedx.schema.schema import SCHEMA_VERSIONS
+from tests import is_valid_for_schema_version
+from tests._data.models import all_get_bom_funct_valid
+
+
+class _MyEnum(str, Enum):
+    FOO = 'foo'
+
+
+@ddt
+class TestInternalJsonNormalize(TestCase):
+
+    @data(
+        None, True, False, 0, 1.5, 'foo',
+        [1, 'a'], (1, 'a'), {'a': (1, None)},
+    )
+    def test_native(self, value: Any) -> None:
+        self.assertEqual(json_loads(json_dumps(value)), normalize(value, None))
+
+    def test_enum(self) -> None:
+        self.assertEqual('foo', normalize(_MyEnum.FOO, None))
+        self.assertIs(str, type(normalize(_MyEnum.FOO, None)))
+
+    @named_data(*(
+        (f'{n}-{sv.to_version()}', gb, sv)
+        for n, gb in all_get_bom_funct_valid
+        for sv in SchemaVersion
+        if sv >= SchemaVersion.V1_2
+        and is_valid_for_schema_version(gb, sv)
+    ))
+    @unpack
+    def test_same_as_roundtrip(self, get_bom: Callable[[], Bom], sv: SchemaVersion) -> None:
+        bom = get_bom()
+        view = SCHEMA_VERSIONS[sv]
+        with catch_warnings():
+            simplefilter('ignore')
+            expected = json_loads(bom.as_json(view_=view))  # type:ignore[attr-defined]
+            actual = normalize(bom, view)
+        self.assertEqual(expected, actual)
@@ -0,0 +1,70 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from collections.abc import Callable
+from typing import Any
+from unittest import TestCase
+from unittest.mock import Mock
+
+from ddt import data, ddt
+
+from cyclonedx._internal.observe import ObservedSortedSet
+
+
+@ddt
+class TestObservedSortedSet(TestCase):
+
+    @data(
+        lambda s: s.add(4),
+        lambda s: s.discard(1),
+        lambda s: s.remove(1),
+        lambda s: s.pop(),
+        lambda s: s.clear(),
+        lambda s: s.update([4]),
+        lambda s: s.difference_update([1]),
+        lambda s: s.intersection_update([1]),
+        lambda s: s.symmetric_difference_update([1]),
+        lambda s: s.__ior__([4]),
+        lambda s: s.__delitem__(0),
+    )
+    def test_changed(self, change: Callable[[ObservedSortedSet], Any]) -> None:
+        s = ObservedSortedSet([1, 2, 3])
+        observer = Mock()
+        s.observe(observer)
+        change(s)
+        observer.assert_called_once_with()
+        s.add(5)
+        observer.assert_called_once_with()  # observers are called only once
+
+    def test_unchanged(self) -> None:
+        s = ObservedSortedSet([1, 2, 3])
+        observer = Mock()
+        s.observe(observer)
+        self.assertIn(1, s)
+        self.assertEqual([1, 2, 3], list(s))
+        self.assertEqual([1, 2, 3, 4], list(s | [4]))
+        observer.assert_not_called()
+
+    def test_replacing(self) -> None:
+        s = ObservedSortedSet([1, 2, 3])
+        observer = Mock()
+        s.observe(observer)
+        replacement = ObservedSortedSet.replacing(s, [4])
+        observer.assert_called_once_with()
+        self.assertEqual([4], list(replacement))
+        self.assertEqual([1, 2, 3], list(s))
@@ -0,0 +1,86 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from copy import copy, deepcopy
+from pickle import dumps, loads  # nosec B403
+from unittest import TestCase
+
+from ddt import ddt, named_data
+
+from cyclonedx._internal.slots import SlotsDict
+from cyclonedx.model import ExternalReference, ExternalReferenceType, HashAlgorithm, HashType, Property, XsUri
+from cyclonedx.model.bom_ref import BomRef
+from cyclonedx.model.component import Component
+from cyclonedx.model.dependency import Dependency
+from cyclonedx.model.license import DisjunctiveLicense
+
+
+class _Base(SlotsDict):
+    __slots__ = ('_a',)
+
+
+class _Slotted(_Base):
+    __slots__ = ('_c', '_b')
+
+    def __init__(self) -> None:
+        self._a = 1
+        self._c = 3
+
+
+class _NotViewed:
+    __slots__ = ('_cache',)
+
+
+class _Mixed(_NotViewed, SlotsDict):
+    __slots__ = ('_d',)
+
+    def __init__(self) -> None:
+        self._cache = 0
+        self._d = 4
+
+
+@ddt
+class TestSlotsDict(TestCase):
+
+    def test_dict_view(self) -> None:
+        o = _Slotted()
+        self.assertListEqual([('_a', 1), ('_c', 3)], list(o.__dict__.items()))
+        o._b = 2
+        self.assertListEqual([('_a', 1), ('_c', 3), ('_b', 2)], list(vars(o).items()))
+
+    def test_dict_view_omits_slots_of_other_bases(self) -> None:
+        self.assertListEqual([('_d', 4)], list(_Mixed().__dict__.items()))
+
+    @named_data(
+        ('BomRef', BomRef('foo')),
+        ('XsUri', XsUri('https://example.com')),
+        ('HashType', HashType(alg=HashAlgorithm.SHA_256, content='a' * 64)),
+        ('Property', Property(name='foo', value='bar')),
+        ('ExternalReference', ExternalReference(type=ExternalReferenceType.WEBSITE, url=XsUri('https://example.com'))),
+        ('DisjunctiveLicense', DisjunctiveLicense(id='MIT')),
+        ('Dependency', Dependency(BomRef('foo'), [Dependency(BomRef('bar'))])),
+        ('Component', Component(name='foo', bom_ref='foo', hashes=[HashType(alg=HashAlgorithm.MD5, content='a')])),
+    )
+    def test_model(self, o: object) -> None:
+        if not isinstance(o, (BomRef, XsUri)):
+            # these two derive from `py_serializable`'s `BaseHelper`, which has no `__slots__`
+            with self.assertRaises(AttributeError):
+                o.unknown_attribute = 1  # type:ignore[attr-defined]
+        self.assertEqual(o, copy(o))
+        self.assertEqual(o, deepcopy(o))
+        self.assertEqual(o, loads(dumps(o)))  # nosec B301
@@ -0,0 +1,164 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+from io import StringIO
+from typing import Any
+from unittest import TestCase
+from xml.dom.minidom import parseString as dom_parseString  # nosec B408
+from xml.etree.ElementTree import Element, SubElement, tostring as xml_dumps  # nosec B405
+
+from ddt import data, ddt
+
+from cyclonedx._internal.xml import XmlWriter, iter_deferred
+
+_NS = 'urn:example:ns'
+_XML_NS = 'http://www.w3.org/XML/1998/namespace'
+
+
+def _make_tree() -> Element:
+    root = Element(f'{{{_NS}}}root', {f'{{{_NS}}}a': 'x&y', f'{{{_NS}}}b': '1 < 2'})
+    SubElement(root, f'{{{_NS}}}empty')
+    SubElement(root, f'{{{_NS}}}text').text = 'foo & <bar>'
+    nested = SubElement(root, f'{{{_NS}}}nested', {f'{{{_NS}}}c': 'd'})
+    SubElement(nested, f'{{{_NS}}}leaf').text = 'baz'
+    SubElement(SubElement(nested, f'{{{_NS}}}deeper'), f'{{{_NS}}}empty', {f'{{{_NS}}}e': 'f'})
+    return root
+
+
+@ddt
+class TestInternalXmlWriter(TestCase):
+
+    def test_as_elementtree(self) -> None:
+        tree = _make_tree()
+        buffer = StringIO()
+        writer = XmlWriter(buffer.write, _NS)
+        writer.element(tree)
+        self.assertEqual(
+            xml_dumps(tree, method='xml', default_namespace=_NS, encoding='unicode', xml_declaration=False),
+            buffer.getvalue())
+
+    @data(0, 2, '\t')
+    def test_as_minidom(self, indent: Any) -> None:
+        tree = _make_tree()
+        buffer = StringIO()
+        writer = XmlWriter(buffer.write, _NS, indent)
+        writer.declaration()
+        writer.element(tree)
+        expected = dom_parseString(  # nosec B318
+            xml_dumps(tree, method='xml', default_namespace=_NS, encoding='unicode')
+        ).toprettyxml(indent=' ' * indent if isinstance(indent, int) else indent)
+        self.assertEqual(expected, buffer.getvalue())
+
+    @data(None, 2)
+    def test_start_end_like_element(self, indent: Any) -> None:
+        tree = _make_tree()
+        expected = StringIO()
+        XmlWriter(expected.write, _NS, indent).element(tree)
+        actual = StringIO()
+        writer = XmlWriter(actual.write, _NS, indent)
+        writer.start(tree.tag, tree.attrib)
+        for child in tree:
+            if child.tag == f'{{{_NS}}}nested':
+                writer.start(child.tag, child.attrib)
+                for grandchild in child:
+                    writer.element(grandchild)
+                writer.end()
+            else:
+                writer.element(child)
+        writer.end()
+        self.assertEqual(expected.getvalue(), actual.getvalue())
+
+    def test_empty_started(self) -> None:
+        buffer = StringIO()
+        writer = XmlWriter(buffer.write, _NS, 2)
+        writer.start(f'{{{_NS}}}root')
+        writer.start(f'{{{_NS}}}empty')
+        writer.end()
+        writer.end()
+        self.assertEqual(f'<root xmlns="{_NS}">\n  <empty/>\n</root>\n', buffer.getvalue())
+
+    def test_foreign_namespace(self) -> None:
+        root = Element(f'{{{_NS}}}root')
+        SubElement(root, '{urn:other}foo', {'{urn:other}bar': 'baz'})
+        SubElement(root, '{urn:other}foo')
+        SubElement(SubElement(root, f'{{{_NS}}}nested'), '{urn:third}foo')
+        buffer = StringIO()
+        XmlWriter(buffer.write, _NS).element(root)
+        self.assertEqual(
+            f'<root xmlns="{_NS}" xmlns:ns1="urn:other" xmlns:ns2="urn:third">'
+            '<ns1:foo ns1:bar="baz" />'
+            '<ns1:foo />'
+            '<nested><ns2:foo /></nested>'
+            '</root>',
+            buffer.getvalue())
+        self.assertEqual(
+            xml_dumps(root, method='xml', default_namespace=_NS, encoding='unicode', xml_declaration=False),
+            buffer.getvalue())
+
+    def test_foreign_namespace_started(self) -> None:
+        buffer = StringIO()
+        writer = XmlWriter(buffer.write, _NS)
+        writer.start(f'{{{_NS}}}root')
+        writer.element(Element('{urn:other}foo', {'{urn:other}bar': 'baz'}))
+        writer.element(Element('{urn:other}foo'))
+        writer.end()
+        self.assertEqual(
+            f'<root xmlns="{_NS}">'
+            '<ns1:foo xmlns:ns1="urn:other" ns1:bar="baz" />'
+            '<ns1:foo xmlns:ns1="urn:other" />'
+            '</root>',
+            buffer.getvalue())
+
+    @data(None, 2)
+    def test_xml_namespace(self, indent: Any) -> None:
+        root = Element(f'{{{_NS}}}root')
+        SubElement(root, f'{{{_NS}}}text', {f'{{{_XML_NS}}}lang': 'en'}).text = 'foo'
+        buffer = StringIO()
+        writer = XmlWriter(buffer.write, _NS, indent)
+        writer.start(root.tag, {f'{{{_XML_NS}}}lang': 'de'})
+        writer.element(root[0])
+        writer.end()
+        self.assertNotIn('xmlns:', buffer.getvalue())
+        self.assertIn('<root xmlns="urn:example:ns" xml:lang="de">', buffer.getvalue())
+        self.assertIn('<text xml:lang="en">foo</text>', buffer.getvalue())
+        buffer = StringIO()
+        XmlWriter(buffer.write, _NS).element(root)
+        self.assertEqual(
+            xml_dumps(root, method='xml', default_namespace=_NS, encoding='unicode', xml_declaration=False),
+            buffer.getvalue())
+
+
+class TestInternalXmlIterDeferred(TestCase):
+
+    def test_merge_in_sequence(self) -> None:
+        root = Element('root')
+        a = SubElement(root, 'a')
+        SubElement(root, 'b')  # placeholder of a deferred array - to be dropped
+        c = SubElement(root, 'c')
+        b_items = [Element('b1')]
+        d_items = [Element('d1')]
+        parts = list(iter_deferred(
+            root,
+            {'b': (20, lambda: iter(b_items)), 'd': (40, lambda: iter(d_items))},
+            {'a': 10, 'b': 20, 'c': 30}))
+        self.assertIs(a, parts[0])
+        self.assertEqual('b', parts[1][0])  # type:ignore[index]
+        self.assertEqual(b_items, list(parts[1][1]))  # type:ignore[index,arg-type]
+        self.assertIs(c, parts[2])
+        self.assertEqual('d', parts[3][0])  # type:ignore[index]
+        self.assertEqual(d_items, list(parts[3][1]))  # type:ignore[index,arg-type]
+        self.assertEqual(4, len(parts))
@@ -20,7 +20,8 @@ from random import shuffle
 from unittest import TestCase
 from uuid import uuid4
 
-from ddt import ddt, named_data
+from ddt import data, ddt, named_data
+from packageurl import PackageURL
 
 from cyclonedx.exception.model import LicenseExpressionAlongWithOthersException
 from cyclonedx.model import Property
@@ -28,8 +29,10 @@ from cyclonedx.model.bom import Bom, BomMetaData, DistributionConstraints, TlpCl
 from cyclonedx.model.bom_ref import BomRef
 from cyclonedx.model.component import Component, ComponentType
 from cyclonedx.model.contact import OrganizationalContact, OrganizationalEntity
+from cyclonedx.model.dependency import Dependency
 from cyclonedx.model.license import DisjunctiveLicense
 from cyclonedx.model.lifecycle import LifecyclePhase, NamedLifecycle, PredefinedLifecycle
+from cyclonedx.model.service import Service
 from cyclonedx.model.tool import Tool
 from cyclonedx.output.json import JsonV1Dot7
 from tests import reorder
@@ -295,6 +298,71 @@ class TestBom(TestCase):
         self.assertIs(result, setuptools_simple)
         self.assertIsNone(bom.get_component_by_purl(get_component_setuptools_simple_no_version().purl))
 
+    @data(False, True)
+    def test_lookup(self, indexed: bool) -> None:
+        nested = Component(name='nested', version='1', bom_ref='nested', cpe='cpe:2.3:a:acme:nested:1:*:*:*:*:*:*:*',
+                           purl=PackageURL('pypi', name='nested', version='1'))
+        other = Component(name='nested', version='2', bom_ref='other')
+        root = Component(name='root', bom_ref='root')
+        bom = Bom(components=[Component(name='top', components=[nested]), other],
+                  services=[Service(name='svc', bom_ref='svc', services=[Service(name='svc2', bom_ref='svc2')])])
+        bom.metadata.component = root
+        if indexed:
+            bom.build_lookup_index()
+        self.assertIs(nested, bom.get_component_by_bom_ref('nested'))
+        self.assertIs(nested, bom.get_component_by_bom_ref(BomRef('nested')))
+        self.assertIs(root, bom.get_component_by_bom_ref('root'))
+        self.assertIsNone(bom.get_component_by_bom_ref('svc'))
+        self.assertIsNone(bom.get_component_by_bom_ref(BomRef()))
+        self.assertTupleEqual((nested,), bom.get_components_by_purl(PackageURL('pypi', name='nested', version='1')))
+        self.assertTupleEqual((), bom.get_components_by_purl(PackageURL('pypi', name='nested', version='2')))
+        self.assertTupleEqual((other, nested), bom.get_components_by_name('nested'))
+        self.assertTupleEqual((other,), bom.get_components_by_name('nested', '2'))
+        self.assertTupleEqual((nested,), bom.get_components_by_cpe('cpe:2.3:a:acme:nested:1:*:*:*:*:*:*:*'))
+        svc2 = bom.get_service_by_bom_ref('svc2')
+        self.assertIsNotNone(svc2)
+        self.assertTupleEqual((svc2,), bom.get_services_by_name('svc2'))
+        self.assertTupleEqual((), bom.get_services_by_name('svc2', '1'))
+
+    def test_lookup_index_observes_collections(self) -> None:
+        a = Component(name='a', bom_ref='a')
+        b = Component(name='b', bom_ref='b')
+        bom = Bom(components=[a])
+        bom.build_lookup_index()
+        self.assertIs(a, bom.get_component_by_bom_ref('a'))
+        # same number of components, after a removal and an addition
+        bom.components.remove(a)
+        bom.components.add(b)
+        self.assertIsNone(bom.get_component_by_bom_ref('a'))
+        self.assertIs(b, bom.get_component_by_bom_ref('b'))
+        bom.build_lookup_index()
+        b.components.add(a)
+        self.assertIs(a, bom.get_component_by_bom_ref('a'))
+        bom.build_lookup_index()
+        b.components = []
+        self.assertIsNone(bom.get_component_by_bom_ref('a'))
+        bom.build_lookup_index()
+        bom.metadata.component = a
+        self.assertIs(a, bom.get_component_by_bom_ref('a'))
+        bom.build_lookup_index()
+        s = Service(name='s', bom_ref='s')
+        bom.services.add(Service(name='t', services=[s]))
+        self.assertIs(s, bom.get_service_by_bom_ref('s'))
+        bom.build_lookup_index()
+        s.services.add(u := Service(name='u', bom_ref='u'))
+        self.assertIs(u, bom.get_service_by_bom_ref('u'))
+
+    def test_lookup_index_verifies_hits(self) -> None:
+        a = Component(name='a', bom_ref='a')
+        bom = Bom(components=[a])
+        bom.build_lookup_index()
+        a.bom_ref.value = 'b'
+        a.name = 'b'
+        self.assertIsNone(bom.get_component_by_bom_ref('a'))
+        self.assertIs(a, bom.get_component_by_bom_ref('b'))
+        self.assertTupleEqual((), bom.get_components_by_name('a'))
+        self.assertTupleEqual((a,), bom.get_components_by_name('b'))
+
     @named_data(
         ('none', tuple()),
         # a = anonymous - bom-ref auto-set
@@ -329,6 +397,84 @@ class TestBom(TestCase):
             for dd in d2:
                 self.assertIn(dd.bom_ref, bom_dep.dependencies_as_bom_refs())
 
+    def test_register_dependency_existing(self) -> None:
+        bom = Bom()
+        c1 = Component(name='c1', bom_ref='c1')
+        c2 = Component(name='c2', bom_ref='c2')
+        c3 = Component(name='c3', bom_ref='c3')
+        bom.register_dependency(c1, [c2])
+        bom.register_dependency(c1, [c3])
+        bom.register_dependency(c2)
+        self.assertEqual(3, len(bom.dependencies))
+        d1 = next(d for d in bom.dependencies if d.ref is c1.bom_ref)
+        self.assertSetEqual({c2.bom_ref, c3.bom_ref}, set(d1.dependencies_as_bom_refs()))
+
+    def test_register_dependency_after_dependencies_changed(self) -> None:
+        bom = Bom()
+        c1 = Component(name='c1', bom_ref='c1')
+        c2 = Component(name='c2', bom_ref='c2')
+        c3 = Component(name='c3', bom_ref='c3')
+        bom.register_dependency(c1, [c2])
+        bom.dependencies = [Dependency(c3.bom_ref)]
+        bom.register_dependency(c3, [c1])
+        self.assertSetEqual({c3.bom_ref, c1.bom_ref}, {d.ref for d in bom.dependencies})
+        bom.dependencies.add(Dependency(c2.bom_ref))
+        bom.register_dependency(c2, [c1])
+        self.assertEqual(3, len(bom.dependencies))
+        d2 = next(d for d in bom.dependencies if d.ref is c2.bom_ref)
+        self.assertSetEqual({c1.bom_ref}, set(d2.dependencies_as_bom_refs()))
+
+    def test_register_dependency_after_bom_ref_changed(self) -> None:
+        bom = Bom()
+        a = Component(name='a', bom_ref='a')
+        x = Component(name='x', bom_ref='x')
+        y = Component(name='y', bom_ref='y')
+        bom.register_dependency(a, [x])
+        a.bom_ref.value = 'a2'
+        bom.register_dependency(a, [y])
+        self.assertEqual({'a2': ['x', 'y'], 'x': [], 'y': []},
+                         {d.ref.value: sorted(t.ref.value for t in d.dependencies)  # type:ignore[misc]
+                          for d in bom.dependencies})
+
+    def test_register_dependency_after_bom_ref_changed_order(self) -> None:
+        bom = Bom()
+        dependency = Dependency(BomRef('a'))
+        bom.dependencies = [dependency, Dependency(BomRef('m')), Dependency(BomRef('x'))]
+        bom.register_dependency(Component(name='m', bom_ref='m'))
+        # the dependency is not in order anymore - so that bisecting would miss it
+        dependency.ref.value = 'z'
+        bom.register_dependency(Component(name='z', bom_ref='z'), [Component(name='x', bom_ref='x')])
+        self.assertEqual({'m': [], 'x': [], 'z': ['x']},
+                         {d.ref.value: sorted(t.ref.value for t in d.dependencies)  # type:ignore[misc]
+                          for d in bom.dependencies})
+        self.assertEqual(3, len(bom.dependencies))
+
+    def test_register_dependency_after_dependency_replaced(self) -> None:
+        bom = Bom()
+        a = Component(name='a', bom_ref='a')
+        x = Component(name='x', bom_ref='x')
+        y = Component(name='y', bom_ref='y')
+        bom.register_dependency(a, [x])
+        removed = next(d for d in bom.dependencies if d.ref is a.bom_ref)
+        bom.dependencies.remove(removed)
+        bom.dependencies.add(Dependency(a.bom_ref))
+        bom.register_dependency(a, [y])
+        self.assertEqual({'a': ['y'], 'x': [], 'y': []},
+                         {d.ref.value: sorted(t.ref.value for t in d.dependencies)  # type:ignore[misc]
+                          for d in bom.dependencies})
+        self.assertEqual(1, len(removed.dependencies))
+
+    def test_register_dependency_many(self) -> None:
+        bom = Bom()
+        components = [Component(name=f'c{i}', bom_ref=f'c{i}') for i in range(5000)]
+        bom.components.update(components)
+        for i, c in enumerate(components):
+            bom.register_dependency(c, components[i + 1:i + 4])
+        self.assertEqual(len(components), len(bom.dependencies))
+        for i in range(0, len(components), 1000):
+            d = next(d for d in bom.dependencies if d.ref is components[i].bom_ref)
+            self.assertEqual(3, len(d.dependencies))
+
     def test_regression_issue_539(self) -> None:
         """regression test for issue #539
         see https://github.com/CycloneDX/cyclonedx-python-lib/issues/539
@@ -23,11 +23,15 @@ from cyclonedx.model import (
     Encoding,
     ExternalReference,
     ExternalReferenceType,
+    HashAlgorithm,
+    HashType,
     IdentifiableAction,
     Property,
     XsUri,
+    cached_comparison,
 )
 from cyclonedx.model.component import Commit, Component, ComponentType, Diff, Patch, PatchClassification, Pedigree
+from cyclonedx.model.contact import OrganizationalEntity
 from cyclonedx.model.issue import IssueClassification, IssueType
 from tests import reorder
 from tests._data.models import (
@@ -304,6 +308,48 @@ class TestModelComponent(TestCase):
         expected_components = reorder(components, expected_order)
         self.assertListEqual(sorted_components, expected_components)
 
+    def test_cached_comparison(self) -> None:
+        components = [Component(name=f'c{i % 10}', version=str(i), components=[Component(name='n')])
+                      for i in range(100)]
+        expected = sorted(components)
+        with cached_comparison():
+            self.assertListEqual(expected, sorted(components))
+            self.assertEqual(100, len(set(components)))
+            a, b = Component(name='a', components=[Component(name='n')]), Component(name='a')
+            self.assertNotEqual(a, b)
+            b.components = [Component(name='n')]
+            self.assertEqual(a, b)
+            self.assertEqual(hash(a), hash(b))
+            # changes of nested components are reflected, too
+            next(iter(b.components)).version = '1'
+            self.assertNotEqual(a, b)
+            next(iter(a.components)).version = '1'
+            self.assertEqual(a, b)
+            a.bom_ref.value = 'a'
+            self.assertNotEqual(a, b)
+            # in-place changes of collections, too
+            b.bom_ref.value = 'a'
+            self.assertEqual(a, b)
+            a.hashes.add(HashType(alg=HashAlgorithm.SHA_256, content='0' * 64))
+            self.assertNotEqual(a, b)
+            a.hashes.clear()
+            self.assertEqual(a, b)
+            # and in-place changes of other nested objects
+            a.supplier, b.supplier = OrganizationalEntity(name='s'), OrganizationalEntity(name='s')
+            self.assertEqual(a, b)
+            b.supplier.name = 't'
+            self.assertNotEqual(a, b)
+            a.supplier.name = 't'
+            self.assertEqual(a, b)
+            self.assertEqual(hash(a), hash(b))
+
+    def test_compare_beyond_identifying_fields(self) -> None:
+        a, b = Component(name='a', description='a'), Component(name='a', description='b')
+        self.assertNotEqual(a, b)
+        self.assertListEqual([a, b], sorted([b, a]))
+        self.assertEqual(2, len({a, b}))
+        self.assertEqual(a, Component(name='a', description='a'))
+
     def test_nested_components_1(self) -> None:
         comp_b = Component(name='comp_b')
         comp_c = Component(name='comp_c')
@@ -18,6 +18,8 @@
 
 from unittest import TestCase
 
+from cyclonedx.model import cached_comparison
+from cyclonedx.model.contact import OrganizationalEntity
 from cyclonedx.model.service import Service
 from tests import reorder
 
@@ -80,3 +82,14 @@ class TestModelService(TestCase):
         sorted_services = sorted(services)
         expected_services = reorder(services, expected_order)
         self.assertListEqual(sorted_services, expected_services)
+
+    def test_cached_comparison_nested_change(self) -> None:
+        with cached_comparison():
+            a = Service(name='s', provider=OrganizationalEntity(name='p'))
+            b = Service(name='s', provider=OrganizationalEntity(name='q'))
+            self.assertNotEqual(a, b)
+            services = {a}
+            b.provider.name = 'p'  # type:ignore[union-attr]
+            self.assertEqual(a, b)
+            self.assertEqual(hash(a), hash(b))
+            self.assertIn(b, services)
@@ -16,16 +16,25 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
+import gzip
+import lzma
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import Mock
 
 from ddt import data, ddt, named_data, unpack
 
+from cyclonedx.exception.output import FormatNotSupportedException
 from cyclonedx.model.bom import Bom
 from cyclonedx.model.bom_ref import BomRef
-from cyclonedx.output import BomRefDiscriminator, make_outputter
+from cyclonedx.output import BomRefDiscriminator, make_outputter, output_as_strings
 from cyclonedx.schema import OutputFormat, SchemaVersion
+from tests._data.models import bom_all_same_bomref, get_bom_with_component_setuptools_with_vulnerability
 
 
 @ddt
@@ -37,9 +46,15 @@ class TestTestGetInstance(TestCase):
         bom = Mock(spec=Bom)
         outputter = make_outputter(bom, of, sv)
         self.assertIs(outputter.get_bom(), bom)
+        self.assertFalse(outputter.read_only)
         self.assertIs(outputter.output_format, of)
         self.assertIs(outputter.schema_version, sv)
 
+    def test_read_only(self) -> None:
+        bom = Mock(spec=Bom)
+        self.assertFalse(make_outputter(bom, OutputFormat.JSON, SchemaVersion.V1_6).read_only)
+        self.assertTrue(make_outputter(bom, OutputFormat.XML, SchemaVersion.V1_6, read_only=True).read_only)
+
     @data(
         *((of, 'foo', (ValueError, f"Unknown {of.name}/schema_version: 'foo'")) for of in OutputFormat),
         *(('foo', sv, (ValueError, "Unexpected output_format: 'foo'")) for sv in SchemaVersion),
@@ -80,3 +95,77 @@ class TestBomRefDiscriminator(TestCase):
         discr.reset()
         self.assertEqual('djdlkfjdslkf', bomref1.value)
         self.assertEqual('djdlkfjdslkf', bomref2.value)
+
+
+class TestReadOnlyConcurrently(TestCase):
+
+    def test_same_as_sequential(self) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        unsupported = ((OutputFormat.JSON, SchemaVersion.V1_0), (OutputFormat.JSON, SchemaVersion.V1_1))
+        targets = [target for target in product(OutputFormat, SchemaVersion) if target not in unsupported]
+        expected = [make_outputter(bom, of, sv, read_only=True).output_as_string() for of, sv in targets]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            actual = list(executor.map(
+                lambda target: make_outputter(bom, *target, read_only=True).output_as_string(),
+                targets * 3))
+        self.assertEqual(expected * 3, actual)
+
+
+class TestOutputAsStrings(TestCase):
+
+    def test_same_as_single(self) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        targets = [(OutputFormat.JSON, SchemaVersion.V1_4), (OutputFormat.JSON, SchemaVersion.V1_6),
+                   (OutputFormat.XML, SchemaVersion.V1_6)]
+        expected = {target: make_outputter(bom, *target, read_only=True).output_as_string(indent=2)
+                    for target in targets}
+        self.assertEqual(expected, output_as_strings(bom, targets, indent=2))
+        self.assertEqual(expected, output_as_strings(bom, targets, indent=2, max_workers=3))
+
+    def test_shares_bom_refs(self) -> None:
+        bom, _ = bom_all_same_bomref()
+        outputs = output_as_strings(bom, ((OutputFormat.JSON, SchemaVersion.V1_6),
+                                          (OutputFormat.JSON, SchemaVersion.V1_5)), max_workers=2)
+        found = [re.findall(r'"bom-ref":\s*"(.*?)"', output) for output in outputs.values()]
+        self.assertEqual(found[0], found[1])
+        self.assertCountEqual(set(found[0]), found[0], 'expected unique items')
+
+    def test_unsupported(self) -> None:
+        with self.assertRaises(FormatNotSupportedException):
+            output_as_strings(Bom(), ((OutputFormat.JSON, SchemaVersion.V1_1),))
+
+
+@ddt
+class TestOutputToFile(TestCase):
+
+    @named_data(('gz', 'bom.json.gz', gzip.decompress),
+                ('xz', 'bom.json.xz', lzma.decompress),
+                ('none', 'bom.json', bytes))
+    @unpack
+    def test_compression_by_suffix(self, filename: str, decompress: Callable[[bytes], bytes]) -> None:
+        outputter = make_outputter(get_bom_with_component_setuptools_with_vulnerability(),
+                                   OutputFormat.JSON, SchemaVersion.V1_6, read_only=True)
+        with TemporaryDirectory() as tmpdir:
+            outputter.output_to_file(join(tmpdir, filename), indent=2, compression='auto')
+            with open(join(tmpdir, filename), 'rb') as f:
+                written = f.read()
+        self.assertEqual(outputter.output_as_string(indent=2).encode(), decompress(written))
+
+    @data('bom.json.gz', 'bom.json.bz2', 'bom.json.xz', 'bom.json')
+    def test_no_compression_by_default(self, filename: str) -> None:
+        outputter = make_outputter(get_bom_with_component_setuptools_with_vulnerability(),
+                                   OutputFormat.JSON, SchemaVersion.V1_6, read_only=True)
+        with TemporaryDirectory() as tmpdir:
+            outputter.output_to_file(join(tmpdir, filename), indent=2)
+            with open(join(tmpdir, filename), 'rb') as f:
+                written = f.read()
+        self.assertEqual(outputter.output_as_string(indent=2).encode(), written)
+
+    def test_compression_reproducible(self) -> None:
+        outputter = make_outputter(get_bom_with_component_setuptools_with_vulnerability(),
+                                   OutputFormat.XML, SchemaVersion.V1_6, read_only=True)
+        with TemporaryDirectory() as tmpdir:
+            outputter.output_to_file(join(tmpdir, 'a'), compression='gzip')
+            outputter.output_to_file(join(tmpdir, 'b.xml.gz'), compression='auto')
+            with open(join(tmpdir, 'a'), 'rb') as a, open(join(tmpdir, 'b.xml.gz'), 'rb') as b:
+                self.assertEqual(a.read(), b.read())
@@ -18,6 +18,7 @@
 
 import re
 from collections.abc import Callable
+from io import BytesIO
 from typing import Any
 from unittest import TestCase
 from unittest.mock import Mock, patch
@@ -38,7 +39,12 @@ from cyclonedx.output.json import BY_SCHEMA_VERSION, Json
 from cyclonedx.schema import OutputFormat, SchemaVersion
 from cyclonedx.validation.json import JsonStrictValidator
 from tests import SnapshotMixin, is_valid_for_schema_version, mksname
-from tests._data.models import all_get_bom_funct_invalid, all_get_bom_funct_valid, bom_all_same_bomref
+from tests._data.models import (
+    all_get_bom_funct_invalid,
+    all_get_bom_funct_valid,
+    bom_all_same_bomref,
+    get_bom_with_component_setuptools_with_vulnerability,
+)
 
 UNSUPPORTED_SV = frozenset((SchemaVersion.V1_1, SchemaVersion.V1_0,))
 
@@ -76,6 +82,58 @@ class TestOutputJson(TestCase, SnapshotMixin):
             self.assertIsNone(errors, json)
         self.assertEqualSnapshot(json, snapshot_name)
 
+    @named_data(*(
+        (f'{n}-{sv.to_version()}', gb, sv)
+        for n, gb in all_get_bom_funct_valid
+        for sv in SchemaVersion
+        if sv not in UNSUPPORTED_SV
+        and is_valid_for_schema_version(gb, sv)
+    ))
+    @unpack
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_valid_stream(self, get_bom: Callable[[], Bom], sv: SchemaVersion, *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, sv, OutputFormat.JSON)
+        bom = get_bom()
+        stream = BytesIO()
+        BY_SCHEMA_VERSION[sv](bom).output_to_stream(stream, indent=2)
+        self.assertEqualSnapshot(stream.getvalue().decode('utf-8'), snapshot_name)
+
+    @named_data(*(
+        (f'{n}-{sv.to_version()}', gb, sv)
+        for n, gb in all_get_bom_funct_valid
+        for sv in SchemaVersion
+        if sv not in UNSUPPORTED_SV
+        and is_valid_for_schema_version(gb, sv)
+    ))
+    @unpack
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_valid_read_only(self, get_bom: Callable[[], Bom], sv: SchemaVersion, *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, sv, OutputFormat.JSON)
+        bom = get_bom()
+        dependencies = bom.dependencies
+        expected_dependencies = list(dependencies)
+        json = BY_SCHEMA_VERSION[sv](bom, read_only=True).output_as_string(indent=2)
+        self.assertIs(dependencies, bom.dependencies)
+        self.assertEqual(expected_dependencies, list(bom.dependencies))
+        self.assertEqualSnapshot(json, snapshot_name)
+
+    @data(None, 0, 4, '\t')
+    def test_stream_same_as_string(self, indent: Any) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        stream = BytesIO()
+        BY_SCHEMA_VERSION[SchemaVersion.V1_6](bom).output_to_stream(stream, indent=indent)
+        expected = BY_SCHEMA_VERSION[SchemaVersion.V1_6](bom).output_as_string(indent=indent)
+        self.assertEqual(expected, stream.getvalue().decode('utf-8'))
+
+    @data(None, 4)
+    def test_stream_after_generate(self, indent: Any) -> None:
+        bom, _ = bom_all_same_bomref()
+        outputter = BY_SCHEMA_VERSION[SchemaVersion.V1_6](bom)
+        outputter.generate()
+        stream = BytesIO()
+        outputter.output_to_stream(stream, indent=indent)
+        self.assertEqual(outputter.output_as_string(indent=indent), stream.getvalue().decode('utf-8'))
+
     @named_data(*(
         (f'{n}-{sv.to_version()}', gb, sv)
         for n, gb in all_get_bom_funct_invalid
@@ -17,13 +17,15 @@
 
 import re
 from collections.abc import Callable
+from io import BytesIO
 from typing import Any
 from unittest import TestCase
 from unittest.mock import Mock, patch
 from warnings import warn
 
-from ddt import ddt, idata, named_data, unpack
+from ddt import data, ddt, idata, named_data, unpack
 
+from cyclonedx.contrib.bom.digest import digest, memoized_digest
 from cyclonedx.exception import CycloneDxException, MissingOptionalDependencyException
 from cyclonedx.exception.model import (
     InvalidOmniBorIdException,
@@ -36,7 +38,12 @@ from cyclonedx.output.xml import BY_SCHEMA_VERSION, Xml
 from cyclonedx.schema import OutputFormat, SchemaVersion
 from cyclonedx.validation.xml import XmlValidator
 from tests import SnapshotMixin, is_valid_for_schema_version, mksname
-from tests._data.models import all_get_bom_funct_invalid, all_get_bom_funct_valid, bom_all_same_bomref
+from tests._data.models import (
+    all_get_bom_funct_invalid,
+    all_get_bom_funct_valid,
+    bom_all_same_bomref,
+    get_bom_with_component_setuptools_with_vulnerability,
+)
 
 
 @ddt
@@ -65,6 +72,69 @@ class TestOutputXml(TestCase, SnapshotMixin):
             self.assertIsNone(errors, xml)
         self.assertEqualSnapshot(xml, snapshot_name)
 
+    @named_data(*(
+        (f'{n}-{sv.to_version()}', gb, sv)
+        for n, gb in all_get_bom_funct_valid
+        for sv in SchemaVersion
+        if is_valid_for_schema_version(gb, sv)
+    ))
+    @unpack
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_valid_stream(self, get_bom: Callable[[], Bom], sv: SchemaVersion, *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, sv, OutputFormat.XML)
+        bom = get_bom()
+        stream = BytesIO()
+        BY_SCHEMA_VERSION[sv](bom).output_to_stream(stream, indent=2)
+        self.assertEqualSnapshot(stream.getvalue().decode('utf-8'), snapshot_name)
+
+    @named_data(*(
+        (f'{n}-{sv.to_version()}', gb, sv)
+        for n, gb in all_get_bom_funct_valid
+        for sv in SchemaVersion
+        if is_valid_for_schema_version(gb, sv)
+    ))
+    @unpack
+    @patch('cyclonedx.contrib.this.builders.__ThisVersion', 'TESTING')
+    def test_valid_read_only(self, get_bom: Callable[[], Bom], sv: SchemaVersion, *_: Any, **__: Any) -> None:
+        snapshot_name = mksname(get_bom, sv, OutputFormat.XML)
+        bom = get_bom()
+        dependencies = bom.dependencies
+        expected_dependencies = list(dependencies)
+        xml = BY_SCHEMA_VERSION[sv](bom, read_only=True).output_as_string(indent=2)
+        self.assertIs(dependencies, bom.dependencies)
+        self.assertEqual(expected_dependencies, list(bom.dependencies))
+        self.assertEqualSnapshot(xml, snapshot_name)
+
+    @named_data(*((sv.to_version(), sv, indent) for sv in SchemaVersion for indent in (None, 4)))
+    @unpack
+    def test_stream_same_as_string(self, sv: SchemaVersion, indent: Any) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        stream = BytesIO()
+        BY_SCHEMA_VERSION[sv](bom).output_to_stream(stream, indent=indent)
+        expected = BY_SCHEMA_VERSION[sv](bom).output_as_string(indent=indent)
+        self.assertEqual(expected, stream.getvalue().decode('utf-8'))
+
+    def test_read_only_stream_leaves_bom_alone(self) -> None:
+        bom = get_bom_with_component_setuptools_with_vulnerability()
+        bom.build_lookup_index()
+        index = bom._Bom__get_lookup_index()  # type:ignore[attr-defined]
+        digest(bom)
+        memos = [memoized_digest(c) for c in bom.components]
+        BY_SCHEMA_VERSION[SchemaVersion.V1_6](bom, read_only=True).output_to_stream(BytesIO())
+        self.assertIsNotNone(index)
+        self.assertIs(index, bom._Bom__get_lookup_index())  # type:ignore[attr-defined]
+        self.assertNotIn(None, memos)
+        self.assertEqual(memos, [memoized_digest(c) for c in bom.components])
+
+    @data(None, 4)
+    def test_stream_after_generate(self, indent: Any) -> None:
+        bom, _ = bom_all_same_bomref()
+        outputter = BY_SCHEMA_VERSION[SchemaVersion.V1_6](bom)
+        outputter.generate()
+        stream = BytesIO()
+        outputter.output_to_stream(stream, indent=indent)
+        self.assertEqual(outputter.output_as_string(indent=indent), stream.getvalue().decode('utf-8'))
+
     @named_data(*(
         (f'{n}-{sv.to_version()}', gb, sv)
         for n, gb in all_get_bom_funct_invalid
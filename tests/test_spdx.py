@@ -15,11 +15,18 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
 from json import load as json_load
+from os.path import dirname, realpath
+from subprocess import run  # nosec B404
+from threading import Barrier
 from unittest import TestCase
+from unittest.mock import patch
 
 from ddt import ddt, idata, unpack
+from license_expression import get_spdx_licensing  # type:ignore[import-untyped]
 
 from cyclonedx import spdx
 from cyclonedx.schema._res import SPDX_JSON
@@ -130,3 +137,32 @@ class TestSpdxIsExpression(TestCase):
     def test_negative(self, invalid_expression: str) -> None:
         actual = spdx.is_expression(invalid_expression)
         self.assertFalse(actual)
+
+
+class TestSpdxInit(TestCase):
+
+    def test_not_on_import(self) -> None:
+        # in a fresh interpreter - this one has used everything already
+        code = 'import sys, cyclonedx.contrib.license.factories; print(*sys.modules)'
+        res = run([sys.executable, '-c', code],  # nosec B603
+                  cwd=dirname(dirname(realpath(__file__))), capture_output=True, text=True, check=True)
+        imported = res.stdout.split()
+        self.assertIn('cyclonedx.spdx', imported)
+        self.assertNotIn('license_expression', imported)
+
+    def test_once_when_concurrent(self) -> None:
+        threads = 8
+        barrier = Barrier(threads)
+
+        def first_use(value: str) -> bool:
+            barrier.wait()
+            return spdx.is_supported_id(value) and spdx.is_expression(value)
+
+        with patch.object(spdx, '__ids_tables', None), \
+                patch.object(spdx, '__spdx_expression_licensing', None), \
+                patch('cyclonedx.spdx.json_load', wraps=json_load) as json_load_mock, \
+                patch('license_expression.get_spdx_licensing', wraps=get_spdx_licensing) as licensing_mock, \
+                ThreadPoolExecutor(threads) as executor:
+            self.assertTrue(all(executor.map(first_use, ['MIT'] * threads)))
+        self.assertEqual(1, json_load_mock.call_count)
+        self.assertEqual(1, licensing_mock.call_count)
@@ -16,13 +16,16 @@
 # Copyright (c) OWASP Foundation. All Rights Reserved.
 
 
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 from unittest import TestCase
 
 from ddt import data, ddt, named_data, unpack
 
 from cyclonedx.schema import OutputFormat, SchemaVersion
-from cyclonedx.validation import make_schemabased_validator
+from cyclonedx.validation import make_schemabased_validator, warm_up_schemabased_validators
+from cyclonedx.validation.json import JsonStrictValidator, JsonValidator
+from cyclonedx.validation.xml import XmlValidator
 
 UNDEFINED_FORMAT_VERSION = {
     (OutputFormat.JSON, SchemaVersion.V1_1),
@@ -51,3 +54,42 @@ class TestGetSchemabasedValidator(TestCase):
     def test_fails_on_wrong_args(self, of: OutputFormat, sv: SchemaVersion, raises_regex: tuple) -> None:
         with self.assertRaisesRegex(*raises_regex):
             make_schemabased_validator(of, sv)
+
+
+class TestCompiledSchemaCache(TestCase):
+
+    def test_json_shared(self) -> None:
+        v1 = JsonValidator(SchemaVersion.V1_6)
+        v2 = JsonValidator(SchemaVersion.V1_6)
+        self.assertIs(v1._validator, v2._validator)
+        self.assertIsNot(v1._validator, JsonValidator(SchemaVersion.V1_5)._validator)
+        self.assertIsNot(v1._validator, JsonStrictValidator(SchemaVersion.V1_6)._validator)
+
+    def test_json_shared_across_threads(self) -> None:
+        v1 = JsonValidator(SchemaVersion.V1_6)._validator
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            v2 = pool.submit(lambda: JsonValidator(SchemaVersion.V1_6)._validator).result()
+        self.assertIs(v1, v2)
+
+    def test_xml_per_thread(self) -> None:
+        v1 = XmlValidator(SchemaVersion.V1_6)._validator
+        self.assertIs(v1, XmlValidator(SchemaVersion.V1_6)._validator)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            v2 = pool.submit(lambda: XmlValidator(SchemaVersion.V1_6)._validator).result()
+        self.assertIsNot(v1, v2)
+
+    def test_concurrent_xml_validation(self) -> None:
+        validator = XmlValidator(SchemaVersion.V1_6)
+        valid = '<bom xmlns="http://cyclonedx.org/schema/bom/1.6" version="1"/>'
+        invalid = '<bom xmlns="http://cyclonedx.org/schema/bom/1.6" version="foo"/>'
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda d: validator.validate_str(d), [valid, invalid] * 50))
+        self.assertListEqual([True, False] * 50, [r is None for r in results])
+
+    def test_warm_up(self) -> None:
+        warm_up_schemabased_validators((OutputFormat.JSON,), (SchemaVersion.V1_0, SchemaVersion.V1_6), strict=True)
+        warm_up_schemabased_validators()
+
+    def test_warm_up_fails_on_wrong_format(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unexpected output_format'):
+            warm_up_schemabased_validators(('foo',))  # type:ignore[arg-type]
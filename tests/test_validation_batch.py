@@ -0,0 +1,121 @@
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from glob import glob
+from os.path import basename, join
+from tempfile import TemporaryDirectory
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+from ddt import ddt, named_data, unpack
+
+from cyclonedx.schema import OutputFormat, SchemaVersion
+from cyclonedx.validation.batch import validate_batch
+from tests import SCHEMA_TESTDATA_DIRECTORY
+
+
+def _test_files(ext: str) -> list[str]:
+    return sorted(glob(join(SCHEMA_TESTDATA_DIRECTORY, '1.6', f'*valid-*.{ext}')))
+
+
+@ddt
+class TestValidateBatch(TestCase):
+
+    @named_data(('json', OutputFormat.JSON, 'json'), ('xml', OutputFormat.XML, 'xml'))
+    @unpack
+    def test_paths_in_threads(self, of: OutputFormat, ext: str) -> None:
+        files = _test_files(ext)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(validate_batch(files, of, SchemaVersion.V1_6, executor=executor, max_workers=4))
+        self.assertEqual(list(range(len(files))), sorted(r.index for r in results))
+        for result in results:
+            self.assertEqual(files[result.index], result.source)
+            self.assertIsNone(result.exception)
+            self.assertIs(basename(files[result.index]).startswith('valid-'), result.valid, result.source)
+            if not result.valid:
+                self.assertEqual(1, len(result.errors))
+
+    def test_buffers_in_processes(self) -> None:
+        files = _test_files('json')[:6]
+        buffers = []
+        for file in files:
+            with open(file, 'rb') as f:
+                buffers.append(f.read())
+        results = sorted(validate_batch(buffers, OutputFormat.JSON, SchemaVersion.V1_6, max_workers=2),
+                         key=lambda r: r.index)
+        self.assertEqual(len(files), len(results))
+        for file, result in zip(files, results):
+            self.assertIsNone(result.source)
+            self.assertIs(basename(file).startswith('valid-'), result.valid, file)
+            for error in result.errors or ():
+                self.assertIsInstance(error.data, str)
+
+    def test_all_errors(self) -> None:
+        document = b'{"bomFormat": "CycloneDX", "specVersion": "1.6", "version": "x", "components": 1}'
+        with ThreadPoolExecutor() as executor:
+            one, = validate_batch([document], OutputFormat.JSON, SchemaVersion.V1_6, executor=executor)
+            every, = validate_batch([document], OutputFormat.JSON, SchemaVersion.V1_6, executor=executor,
+                                    all_errors=True)
+        self.assertEqual(1, len(one.errors))
+        self.assertEqual(2, len(every.errors))
+
+    def test_byte_order_mark(self) -> None:
+        document = b'\xef\xbb\xbf{"bomFormat": "CycloneDX", "specVersion": "1.6", "version": 1}'
+        with TemporaryDirectory() as tmpdir:
+            path = join(tmpdir, 'bom.json')
+            with open(path, 'wb') as f:
+                f.write(document)
+            with ThreadPoolExecutor() as executor:
+                results = list(validate_batch([document, path], OutputFormat.JSON, SchemaVersion.V1_6,
+                                              executor=executor))
+        self.assertEqual([True, True], [r.valid for r in results], results)
+
+    def test_unreadable_document(self) -> None:
+        missing = join(SCHEMA_TESTDATA_DIRECTORY, 'does-not-exist.json')
+        with ThreadPoolExecutor() as executor:
+            result, = validate_batch([missing], OutputFormat.JSON, SchemaVersion.V1_6, executor=executor)
+        self.assertFalse(result.valid)
+        self.assertIsNone(result.errors)
+        self.assertIsInstance(result.exception, FileNotFoundError)
+
+    def test_fails_early_on_wrong_args(self) -> None:
+        with self.assertRaisesRegex(ValueError, 'Unexpected output_format'):
+            validate_batch([], 'foo', SchemaVersion.V1_6)  # type:ignore[arg-type]
+        with self.assertRaisesRegex(ValueError, 'Unsupported schema_version'):
+            validate_batch([], OutputFormat.JSON, SchemaVersion.V1_0)
+
+    def test_own_pool_lives_while_iterating(self) -> None:
+        pools: list[ThreadPoolExecutor] = []
+
+        def make_pool(**kwargs: Any) -> ThreadPoolExecutor:
+            pools.append(ThreadPoolExecutor(**kwargs))
+            return pools[-1]
+
+        documents = [b'{}'] * 3
+        with patch('cyclonedx.validation.batch.ProcessPoolExecutor', side_effect=make_pool):
+            validate_batch(documents, OutputFormat.JSON, SchemaVersion.V1_6)
+            self.assertEqual([], pools, 'no pool without iterating')
+            with closing(validate_batch(documents, OutputFormat.JSON, SchemaVersion.V1_6, max_workers=1)) as results:
+                next(results)
+                pool, = pools
+                self.assertIsNotNone(pool.submit(int).result())
+        with self.assertRaises(RuntimeError):
+            pool.submit(int)
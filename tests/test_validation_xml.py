@@ -29,6 +29,7 @@ from ddt import ddt, idata, unpack
 from cyclonedx.exception import MissingOptionalDependencyException
 from cyclonedx.schema import OutputFormat, SchemaVersion
 from cyclonedx.schema._res import BOM_XML
+from cyclonedx.validation import _compiled_schemas
 from cyclonedx.validation.xml import XmlValidator
 from tests import OWN_DATA_DIRECTORY, SCHEMA_TESTDATA_DIRECTORY, DpTuple
 
@@ -66,6 +67,9 @@ class TestXmlValidator(TestCase):
             copied_schema_file = join(schema_directory, basename(schema_file))
 
             with patch.dict('cyclonedx.validation.xml._S_BOM', {schema_version: copied_schema_file}):
+                # the schema might have been compiled from its original path, already
+                _compiled_schemas.clear()
+                self.addCleanup(_compiled_schemas.clear)
                 validation_error = XmlValidator(schema_version).validate_str(
                     '<bom xmlns="http://cyclonedx.org/schema/bom/1.6" version="1"/>'
                 )
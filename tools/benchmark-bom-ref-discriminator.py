@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+import sys
+from os.path import dirname, join, realpath
+from timeit import timeit
+
+sys.path.insert(0, realpath(join(dirname(__file__), '..')))
+
+from cyclonedx.contrib.bom.utils import BomRefDiscriminator  # noqa: E402
+from cyclonedx.model.bom_ref import BomRef  # noqa: E402
+
+HELP = f"""
+Benchmark of `BomRefDiscriminator.discriminate()`.
+Time per BomRef should stay flat, while the number of BomRefs grows.
+
+Usage: {sys.argv[0]} [sizes ...]
+"""
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print(HELP)
+    sys.exit(0)
+
+sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 50_000, 100_000]
+
+print(f'{"bom-refs":>10} {"total [ms]":>12} {"per bom-ref [µs]":>18}')
+for size in sizes:
+    # every tenth value is missing, every fifth is a duplicate
+    bomrefs = [BomRef(None if i % 10 == 0 else f'ref-{i - i % 5 if i % 5 == 1 else i}') for i in range(size)]
+    discriminator = BomRefDiscriminator(bomrefs)
+    runs = 5
+    total = timeit('d.discriminate(); d.reset()', globals={'d': discriminator}, number=runs) / runs
+    print(f'{size:>10} {total * 1e3:>12.2f} {total / size * 1e6:>18.3f}')
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+import sys
+from os.path import dirname, join, realpath
+from statistics import median
+from subprocess import run  # nosec B404
+
+ROOT = realpath(join(dirname(__file__), '..'))
+
+HELP = f"""
+Benchmark of the time it takes to import modules - each in a fresh interpreter, like on a cold start.
+Exits non-zero, if the median exceeds the limit.
+
+Usage: {sys.argv[0]} [--runs N] [--limit MS] [modules ...]
+"""
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print(HELP)
+    sys.exit(0)
+
+args = sys.argv[1:]
+runs = 10
+limit = None
+while args and args[0].startswith('--'):
+    option = args.pop(0)
+    if option == '--runs':
+        runs = int(args.pop(0))
+    elif option == '--limit':
+        limit = float(args.pop(0))
+modules = args or ['cyclonedx.model.bom', 'cyclonedx.output', 'cyclonedx.input']
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time in ms - as reported by `-X importtime`."""
+    res = run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],  # nosec B603
+              cwd=ROOT, capture_output=True, text=True, check=True)
+    for line in res.stderr.splitlines():
+        self_us, cumulative_us, name = line.split('|')
+        if name.strip() == module:
+            return int(cumulative_us) / 1e3
+    raise ValueError(f'no import time of {module!r}')
+
+
+# warm up: byte-compile, and fill the file system caches
+for module in modules:
+    import_time(module)
+
+print(f'{"module":<40} {"median [ms]":>12} {"min [ms]":>10}')
+exceeded = False
+for module in modules:
+    times = [import_time(module) for _ in range(runs)]
+    exceeded |= limit is not None and median(times) > limit
+    print(f'{module:<40} {median(times):>12.1f} {min(times):>10.1f}')
+sys.exit(1 if exceeded else 0)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# This file is part of CycloneDX Python Library
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) OWASP Foundation. All Rights Reserved.
+
+import sys
+import tracemalloc
+from collections.abc import Callable
+from os.path import dirname, join, realpath
+from typing import Any
+
+sys.path.insert(0, realpath(join(dirname(__file__), '..')))
+
+from cyclonedx.model import (  # noqa: E402
+    ExternalReference,
+    ExternalReferenceType,
+    HashAlgorithm,
+    HashType,
+    Property,
+    XsUri,
+)
+from cyclonedx.model.bom_ref import BomRef  # noqa: E402
+from cyclonedx.model.component import Component  # noqa: E402
+from cyclonedx.model.dependency import Dependency  # noqa: E402
+from cyclonedx.model.license import DisjunctiveLicense  # noqa: E402
+
+HELP = f"""
+Benchmark of the memory used per model object.
+Values of the objects are shared, so that only the objects themselves are measured.
+A BOM of realistic size is estimated from a component with 3 hashes, 3 properties and 3 external references.
+
+Usage: {sys.argv[0]} [count]
+"""
+
+if '-h' in sys.argv or '--help' in sys.argv:
+    print(HELP)
+    sys.exit(0)
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+url = XsUri('https://example.com')
+hash_content = 'a' * 64
+factories: dict[str, Callable[[], Any]] = {
+    'BomRef': lambda: BomRef('ref'),
+    'XsUri': lambda: XsUri('https://example.com'),
+    'HashType': lambda: HashType(alg=HashAlgorithm.SHA_256, content=hash_content),
+    'Property': lambda: Property(name='name', value='value'),
+    'ExternalReference': lambda: ExternalReference(type=ExternalReferenceType.WEBSITE, url=url),
+    'DisjunctiveLicense': lambda: DisjunctiveLicense(id='MIT'),
+    'Dependency': lambda: Dependency(BomRef('ref')),
+    'Component': lambda: Component(name='name', version='1.0'),
+    'Component, fully equipped': lambda: Component(
+        name='name', version='1.0',
+        hashes=[HashType(alg=HashAlgorithm.SHA_256, content=hash_content) for _ in range(3)],
+        properties=[Property(name=f'name{i}', value='value') for i in range(3)],
+        external_references=[ExternalReference(type=ExternalReferenceType.WEBSITE, url=url) for _ in range(3)],
+        licenses=[DisjunctiveLicense(id='MIT')]),
+}
+
+
+def measure(factory: Callable[[], Any]) -> float:
+    factory()  # warm up caches, like interned strings
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # the list itself holds one pointer per object
+    return (after - before) / count - 8
+
+
+print(f'{"class":>26} {"bytes per object":>18}')
+for name, factory in factories.items():
+    print(f'{name:>26} {measure(factory):>18.0f}')
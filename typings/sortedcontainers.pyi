@@ -3,7 +3,7 @@
 # The contents of this file were obtained from
 #  https://github.com/althonos/python-sortedcontainers/blob/d0a225d7fd0fb4c54532b8798af3cbeebf97e2d5/sortedcontainers/sortedset.pyi
 
-from collections.abc import Callable, Hashable, Iterable, MutableSet, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, MutableSet, Sequence
 from typing import Any, Optional, TypeVar, Union, overload  # Iterator,; Tuple,; Type, Set
 
 # --- Global
@@ -30,7 +30,7 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     # def __getitem__(self, index: int) -> _T: ...
     @overload
     def __getitem__(self, index: slice) -> list[_T]: ...
-    # def __delitem__(self, index: Union[int, slice]) -> None: ...
+    def __delitem__(self, index: Union[int, slice]) -> None: ...
     # def __eq__(self, other: Any) -> bool: ...
     # def __ne__(self, other: Any) -> bool: ...
     # def __lt__(self, other: Iterable[_T]) -> bool: ...
@@ -42,21 +42,21 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     # def __reversed__(self) -> Iterator[_T]: ...
     def add(self, value: _T) -> None: ...
     # def _add(self, value: _T) -> None: ...
-    # def clear(self) -> None: ...
+    def clear(self) -> None: ...
     # def copy(self: _SS) -> _SS: ...
     # def __copy__(self: _SS) -> _SS: ...
     # def count(self, value: _T) -> int: ...
     def discard(self, value: _T) -> None: ...
     # def _discard(self, value: _T) -> None: ...
-    # def pop(self, index: int = ...) -> _T: ...
-    # def remove(self, value: _T) -> None: ...
+    def pop(self, index: int = ...) -> _T: ...
+    def remove(self, value: _T) -> None: ...
     # def difference(
     #     self, *iterables: Iterable[_S]
     # ) -> SortedSet[Union[_T, _S]]: ...
     # def __sub__(self, *iterables: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
-    # def difference_update(
-    #     self, *iterables: Iterable[_S]
-    # ) -> SortedSet[Union[_T, _S]]: ...
+    def difference_update(
+        self, *iterables: Iterable[_S]
+    ) -> SortedSet[Union[_T, _S]]: ...
     # def __isub__(
     #     self, *iterables: Iterable[_S]
     # ) -> SortedSet[Union[_T, _S]]: ...
@@ -67,9 +67,9 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     # def __rand__(
     #     self, *iterables: Iterable[_S]
     # ) -> SortedSet[Union[_T, _S]]: ...
-    # def intersection_update(
-    #     self, *iterables: Iterable[_S]
-    # ) -> SortedSet[Union[_T, _S]]: ...
+    def intersection_update(
+        self, *iterables: Iterable[_S]
+    ) -> SortedSet[Union[_T, _S]]: ...
     # def __iand__(
     #     self, *iterables: Iterable[_S]
     # ) -> SortedSet[Union[_T, _S]]: ...
@@ -78,9 +78,9 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     # ) -> SortedSet[Union[_T, _S]]: ...
     # def __xor__(self, other: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
     # def __rxor__(self, other: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
-    # def symmetric_difference_update(
-    #     self, other: Iterable[_S]
-    # ) -> SortedSet[Union[_T, _S]]: ...
+    def symmetric_difference_update(
+        self, other: Iterable[_S]
+    ) -> SortedSet[Union[_T, _S]]: ...
     # def __ixor__(self, other: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
     # def union(self, *iterables: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
     # def __or__(self, *iterables: Iterable[_S]) -> SortedSet[Union[_T, _S]]: ...
@@ -93,14 +93,14 @@ class SortedSet(MutableSet[_T], Sequence[_T]):
     # ) -> Tuple[Type[SortedSet[_T]], Set[_T], Callable[[_T], Any]]: ...
     # def __repr__(self) -> str: ...
     # def _check(self) -> None: ...
-    # def bisect_left(self, value: _T) -> int: ...
+    def bisect_left(self, value: Any) -> int: ...
     # def bisect_right(self, value: _T) -> int: ...
-    # def islice(
-    #     self,
-    #     start: Optional[int] = ...,
-    #     stop: Optional[int] = ...,
-    #     reverse=bool,
-    # ) -> Iterator[_T]: ...
+    def islice(
+        self,
+        start: Optional[int] = ...,
+        stop: Optional[int] = ...,
+        reverse: bool = ...,
+    ) -> Iterator[_T]: ...
     # def irange(
     #     self,
     #     minimum: Optional[_T] = ...,